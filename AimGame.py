@@ -0,0 +1,222 @@
+"""
+    File name: AimGame.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+import random
+from typing import List, Optional, Tuple
+from SpatialGrid import SpatialGrid
+
+# The number of targets on screen at a time, and in a whole game, by default.
+TARGETS_AT_ONCE = 5
+TOTAL_TARGETS = 30
+
+
+class Target:
+    """
+    A round target in the aim trainer.
+    === Public Attributes ===
+    x: The horizontal position of the target's center.
+    y: The vertical position of the target's center.
+    radius: The radius of the target, in pixels.
+    shown_at: The time.perf_counter() reading when the target was first
+        presented on screen, or None if it has not been presented yet.
+
+    === Representation Invariants ===
+    radius > 0
+    """
+    x: float
+    y: float
+    radius: float
+    shown_at: Optional[float]
+
+    def __init__(self, x: float, y: float, radius: float) -> None:
+        """
+        Initialize a target centered at (<x>, <y>).
+        Precondition: radius > 0
+        """
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.shown_at = None
+
+    def box(self) -> Tuple[float, float, float, float]:
+        """
+        Return the square (x, y, width, height) around the target.
+        """
+        return self.x - self.radius, self.y - self.radius, \
+            2 * self.radius, 2 * self.radius
+
+    def is_hover(self, position: Tuple[float, float]) -> bool:
+        """
+        Returns whether or not <position> (x, y) is on the target.
+        """
+        return (position[0] - self.x) ** 2 + (position[1] - self.y) ** 2 < \
+            self.radius ** 2
+
+
+class AimGame:
+    """
+    A class representing the aim trainer's inner workings.
+    Up to targets_at_once targets are on screen at a time; every target hit is
+    replaced by a new one until total_targets have been shown.
+    === Public Attributes ===
+    area: The (x, y, width, height) of the area targets appear in.
+    radius: The radius of every target, in pixels.
+    targets_at_once: The number of targets on screen at a time.
+    total_targets: The number of targets in a game.
+    begin: Represents whether or not a game is being played.
+    targets: The targets on screen, oldest (bottom-most) first.
+    spawned: The number of targets created this game.
+    hit_times: The time (in seconds) between each target hit this game being
+        presented and being clicked, in the order they were hit.
+    misses: The number of clicks this game that did not hit a target.
+    changes: Counts every change to targets, so the screen can tell when
+        they need redrawing.
+    rng: The random number generator targets are placed with, or None to
+        use the random module.
+
+    === Private Attributes ===
+    _grid: Finds which presented target is under a point.
+
+    === Representation Invariants ===
+    radius > 0
+    targets_at_once >= 1
+    total_targets >= 1
+    len(targets) <= targets_at_once
+    len(hit_times) + len(targets) == spawned <= total_targets
+    misses >= 0
+    """
+    area: Tuple[float, float, float, float]
+    radius: float = 35
+    targets_at_once: int
+    total_targets: int
+    begin: bool = False
+    targets: List[Target]
+    spawned: int = 0
+    hit_times: List[float]
+    misses: int = 0
+    changes: int = 0
+    rng: Optional[random.Random] = None
+    _grid: SpatialGrid
+
+    def __init__(self, area: Tuple[float, float, float, float],
+                 rng: Optional[random.Random] = None,
+                 targets_at_once: int = TARGETS_AT_ONCE,
+                 total_targets: int = TOTAL_TARGETS) -> None:
+        """
+        Initialize an AimGame whose targets appear inside <area>, placed with
+        <rng> (the random module by default), with <targets_at_once> targets
+        on screen at a time and <total_targets> in a game.
+        Preconditions:
+            area is more than 2 * radius wide and high.
+            1 <= targets_at_once <= total_targets
+        """
+        self.area = area
+        self.rng = rng
+        self.targets_at_once = targets_at_once
+        self.total_targets = total_targets
+        self.targets = []
+        self.hit_times = []
+        self._grid = SpatialGrid(int(2 * self.radius))
+
+    def setup(self) -> None:
+        """
+        Set up an aim trainer game, with no targets on screen.
+        """
+        self.begin = False
+        self.targets = []
+        self.spawned = 0
+        self.hit_times = []
+        self.misses = 0
+        self._grid.clear()
+        self.changes += 1
+
+    def start(self) -> None:
+        """
+        Start a new game, putting the first targets on screen.
+        """
+        self.setup()
+        self.begin = True
+        while len(self.targets) < self.targets_at_once and \
+                self.spawned < self.total_targets:
+            self.spawn()
+
+    def spawn(self) -> None:
+        """
+        Add a target at a random position inside area. It can not be hit
+        until it has been presented.
+        """
+        chooser = self.rng if self.rng is not None else random
+        x, y, width, height = self.area
+        target = Target(chooser.uniform(x + self.radius,
+                                        x + width - self.radius),
+                        chooser.uniform(y + self.radius,
+                                        y + height - self.radius),
+                        self.radius)
+        self.targets.append(target)
+        self.spawned += 1
+        self.changes += 1
+
+    def mark_presented(self, now: float) -> None:
+        """
+        Record that every target on screen was presented at time <now>, if it
+        had not been already, and let it be hit from then on.
+        """
+        for target in self.targets:
+            if target.shown_at is None:
+                target.shown_at = now
+                self._grid.insert(target, target.box())
+
+    def in_area(self, position: Tuple[float, float]) -> bool:
+        """
+        Returns whether or not <position> (x, y) is inside area.
+        """
+        x, y, width, height = self.area
+        return x <= position[0] < x + width and y <= position[1] < y + height
+
+    def target_at(self, position: Tuple[float, float]) -> Optional[Target]:
+        """
+        Return the presented target under <position> (the top-most one, if
+        they overlap), or None if there is none.
+        """
+        return self._grid.at(position)
+
+    def click(self, position: Tuple[float, float],
+              now: float) -> Optional[float]:
+        """
+        Handle a click at <position> that arrived at time <now>, and return
+        how long (in seconds) the target it hit had been on screen, or None
+        if it missed. Each hit target is replaced by a new one, and the game
+        ends once every target has been hit.
+        """
+        target = self.target_at(position)
+        if target is None:
+            self.misses += 1
+            return None
+        hit_time = now - target.shown_at
+        self.hit_times.append(hit_time)
+        self.targets.remove(target)
+        self._grid.remove(target)
+        self.changes += 1
+        if self.spawned < self.total_targets:
+            self.spawn()
+        elif not self.targets:
+            self.begin = False
+        return hit_time
+
+    def average_time(self) -> float:
+        """
+        Return the average time (in seconds) it took to hit a target this
+        game.
+        Precondition: len(hit_times) > 0
+        """
+        return sum(self.hit_times) / len(self.hit_times)
+
+    def result_text(self) -> str:
+        """
+        Return the average time per target and the accuracy of the last game.
+        """
+        clicks = len(self.hit_times) + self.misses
+        return str(int(self.average_time() * 1000)) + " ms per target (" + \
+            str(int(len(self.hit_times) / clicks * 100)) + "% accuracy)"
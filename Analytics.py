@@ -0,0 +1,332 @@
+"""
+    File name: Analytics.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+
+    Summarizes the results logs of any number of machines: percentiles,
+    histograms, means and daily trends of every game, printed as JSON.
+    Needs NumPy.
+
+    Usage: python Analytics.py PATH [PATH ...] [--jobs N] [--bins N]
+                               [--output FILE]
+    Each PATH is a results log, or a directory whose *.log files are read.
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy
+from ResultsLog import HEADER, MAGIC, VERSION, RECORD, GAME_IDS
+
+# A results log record, laid out exactly as ResultsLog writes it, so logs can
+# be memory-mapped as arrays of records without copying or parsing them.
+RECORD_DTYPE = numpy.dtype({
+    "names": ["game", "level", "session", "timestamp", "value", "checksum"],
+    "formats": ["u1", "<u4", "<u8", "<f8", "<f8", "<u4"],
+    "offsets": [0, 4, 8, 16, 24, 32],
+    "itemsize": RECORD.size})
+
+# How each game's values are binned: (unit, bin width, number of bins).
+# Times are binned by the millisecond and scores by the point; values past
+# the last bin are counted in it.
+BINS = {GAME_IDS["reaction"]: ("ms", 0.001, 10000),
+        GAME_IDS["number"]: ("points", 1, 1000),
+        GAME_IDS["verbal"]: ("points", 1, 100000),
+        GAME_IDS["aim"]: ("ms", 0.001, 10000)}
+
+# The most records a worker summarizes at a time.
+CHUNK_RECORDS = 4 * 1024 * 1024
+
+SECONDS_PER_DAY = 86400
+
+Task = Tuple[str, int, int]
+
+
+def load(path: str) -> numpy.ndarray:
+    """
+    Return the records of the results log at <path> as a read-only array of
+    RECORD_DTYPE, memory-mapped from the file. Only whole records are
+    included. Checksums are not checked, since ResultsLog cuts damaged
+    records off the end of a log whenever it opens it.
+    Raises ValueError if <path> is not a results log.
+    """
+    size = os.path.getsize(path)
+    if size < HEADER.size:
+        return numpy.empty(0, RECORD_DTYPE)
+    with open(path, 'rb') as log:
+        magic, version, record_size = HEADER.unpack(log.read(HEADER.size))
+    if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+        raise ValueError(path + ' is not a results log')
+    count = (size - HEADER.size) // RECORD.size
+    if count == 0:
+        return numpy.empty(0, RECORD_DTYPE)
+    return numpy.memmap(path, RECORD_DTYPE, 'r', HEADER.size, (count,))
+
+
+class GameSummary:
+    """
+    The running totals of one game's values, which can be merged with the
+    totals of other records, so logs can be summarized in parallel.
+    Percentiles are read from a histogram with fixed bins (see BINS), so
+    they are exact for scores and accurate to half a millisecond for times.
+    === Public Attributes ===
+    game: The id of the game summarized.
+    count: The number of values.
+    total: The sum of the values.
+    low: The smallest value, or None if there are none.
+    high: The largest value, or None if there are none.
+    counts: The number of values in each bin.
+    days: The number of values and their sum on each day (in UTC), keyed by
+        the number of days since the epoch.
+
+    === Representation Invariants ===
+    count == counts.sum()
+    count == sum(day[0] for day in days.values())
+    """
+    game: int
+    count: int
+    total: float
+    low: Optional[float]
+    high: Optional[float]
+    counts: numpy.ndarray
+    days: Dict[int, List[float]]
+
+    def __init__(self, game: int) -> None:
+        """
+        Initialize an empty GameSummary of the game with id <game>.
+        Precondition: game in BINS
+        """
+        self.game = game
+        self.count = 0
+        self.total = 0.0
+        self.low = None
+        self.high = None
+        self.counts = numpy.zeros(BINS[game][2], numpy.int64)
+        self.days = {}
+
+    def add(self, values: numpy.ndarray, timestamps: numpy.ndarray) -> None:
+        """
+        Add <values>, logged at <timestamps> (in seconds since the epoch).
+        """
+        if len(values) == 0:
+            return
+        _, width, bins = BINS[self.game]
+        self.count += len(values)
+        self.total += float(values.sum())
+        low, high = float(values.min()), float(values.max())
+        self.low = low if self.low is None else min(self.low, low)
+        self.high = high if self.high is None else max(self.high, high)
+        # Round to the nearest bin edge first, so whole-number scores are
+        # never pushed into the bin below by floating point error.
+        indices = numpy.floor(values / width + 1e-9).astype(numpy.int64)
+        numpy.clip(indices, 0, bins - 1, out=indices)
+        self.counts += numpy.bincount(indices, minlength=bins)
+        days = (timestamps // SECONDS_PER_DAY).astype(numpy.int64)
+        first = int(days.min())
+        day_counts = numpy.bincount(days - first)
+        day_totals = numpy.bincount(days - first, weights=values)
+        for offset in numpy.flatnonzero(day_counts):
+            day = self.days.setdefault(first + int(offset), [0, 0.0])
+            day[0] += int(day_counts[offset])
+            day[1] += float(day_totals[offset])
+
+    def merge(self, other: "GameSummary") -> None:
+        """
+        Add every value summarized by <other> to this summary.
+        Precondition: other.game == self.game
+        """
+        if other.count == 0:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.low = other.low if self.low is None else min(self.low, other.low)
+        self.high = other.high if self.high is None else \
+            max(self.high, other.high)
+        self.counts += other.counts
+        for number, (count, total) in other.days.items():
+            day = self.days.setdefault(number, [0, 0.0])
+            day[0] += count
+            day[1] += total
+
+    def percentile(self, percent: float) -> float:
+        """
+        Return the <percent>th percentile of the values, using the
+        nearest-rank method.
+        Precondition: self.count > 0
+        """
+        unit, width, _ = BINS[self.game]
+        rank = max(1, math.ceil(percent / 100 * self.count))
+        index = int(numpy.searchsorted(numpy.cumsum(self.counts), rank))
+        if index == len(self.counts) - 1:
+            # The last bin holds every value past it, so its middle means
+            # nothing; the largest value is the best answer left.
+            return self.high
+        if unit == "points":
+            return index * width
+        return (index + 0.5) * width
+
+    def histogram(self, bins: int) -> List[List[float]]:
+        """
+        Return [lower, upper, count] for <bins> equally wide ranges covering
+        every value, built from the fixed bins.
+        Precondition: self.count > 0 and bins > 0
+        """
+        _, width, _ = BINS[self.game]
+        first = int(numpy.flatnonzero(self.counts)[0])
+        last = int(numpy.flatnonzero(self.counts)[-1]) + 1
+        step = max(1, math.ceil((last - first) / bins))
+        result = []
+        for start in range(first, last, step):
+            result.append([start * width, (start + step) * width,
+                           int(self.counts[start:start + step].sum())])
+        return result
+
+    def report(self, bins: int) -> Dict:
+        """
+        Return the summary as a JSON-serializable dictionary, with times in
+        milliseconds and the histogram in <bins> ranges.
+        """
+        unit = BINS[self.game][0]
+        if self.count == 0:
+            return {"count": 0, "unit": unit}
+        scale = 1000 if unit == "ms" else 1
+        histogram = [[lower * scale, upper * scale, count]
+                     for lower, upper, count in self.histogram(bins)]
+        days = {}
+        for number in sorted(self.days):
+            count, total = self.days[number]
+            date = datetime.fromtimestamp(number * SECONDS_PER_DAY,
+                                          timezone.utc).date().isoformat()
+            days[date] = {"count": count, "mean": total / count * scale}
+        return {"count": self.count,
+                "unit": unit,
+                "mean": self.total / self.count * scale,
+                "min": self.low * scale,
+                "p10": self.percentile(10) * scale,
+                "p50": self.percentile(50) * scale,
+                "p90": self.percentile(90) * scale,
+                "p99": self.percentile(99) * scale,
+                "max": self.high * scale,
+                "histogram": histogram,
+                "days": days}
+
+
+def summarize(task: Task) -> Tuple[Dict[int, GameSummary], int]:
+    """
+    Summarize records [start, stop) of the results log named by <task>
+    (path, start, stop) and return the summary of every game, along with the
+    number of records skipped because their game is unknown.
+    """
+    path, start, stop = task
+    records = load(path)[start:stop]
+    summaries = {}
+    games = records["game"]
+    values = records["value"]
+    timestamps = records["timestamp"]
+    for game in BINS:
+        mask = games == game
+        summary = GameSummary(game)
+        summary.add(values[mask], timestamps[mask])
+        summaries[game] = summary
+    known = sum(summary.count for summary in summaries.values())
+    return summaries, len(records) - known
+
+
+def find_logs(paths: List[str]) -> List[str]:
+    """
+    Return the results logs named by <paths>, looking inside directories for
+    their *.log files.
+    """
+    logs = []
+    for path in paths:
+        if os.path.isdir(path):
+            logs.extend(sorted(os.path.join(path, name)
+                               for name in os.listdir(path)
+                               if name.endswith('.log')))
+        else:
+            logs.append(path)
+    return logs
+
+
+def tasks(logs: List[str]) -> Iterator[Task]:
+    """
+    Yield tasks covering every record of <logs>, at most CHUNK_RECORDS
+    records each.
+    """
+    for path in logs:
+        count = len(load(path))
+        for start in range(0, count, CHUNK_RECORDS):
+            yield path, start, min(start + CHUNK_RECORDS, count)
+
+
+def merge(totals: Dict[int, GameSummary],
+          results: Iterator[Tuple[Dict[int, GameSummary], int]]) -> int:
+    """
+    Merge the game summaries in <results> into <totals> and return the total
+    number of records skipped.
+    """
+    skipped = 0
+    for summaries, unknown in results:
+        skipped += unknown
+        for game, summary in summaries.items():
+            totals[game].merge(summary)
+    return skipped
+
+
+def analyze(paths: List[str], jobs: Optional[int] = None,
+            bins: int = 20) -> Dict:
+    """
+    Summarize every record in the results logs named by <paths>, across
+    <jobs> processes (one per CPU by default), and return the report, with
+    histograms of <bins> ranges.
+    """
+    start = time.perf_counter()
+    logs = find_logs(paths)
+    work = list(tasks(logs))
+    totals = {game: GameSummary(game) for game in BINS}
+    if len(work) <= 1 or jobs == 1:
+        skipped = merge(totals, map(summarize, work))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            skipped = merge(totals, executor.map(summarize, work))
+    names = {game_id: name for name, game_id in GAME_IDS.items()}
+    return {"files": len(logs),
+            "records": sum(summary.count for summary in totals.values()) +
+            skipped,
+            "skipped": skipped,
+            "games": {names[game]: summary.report(bins)
+                      for game, summary in totals.items()},
+            "elapsed_s": time.perf_counter() - start}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the analytics from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Summarize the results logs of many machines.")
+    parser.add_argument("paths", nargs="+",
+                        help="results logs, or directories of them")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="processes to use (default: one per CPU)")
+    parser.add_argument("--bins", type=int, default=20,
+                        help="ranges in each histogram")
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args(argv)
+    report = analyze(args.paths, args.jobs, args.bins)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,568 @@
+"""
+    File name: Benchmark.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+
+    Runs the whole game without a monitor (under SDL's dummy video driver),
+    plays a scripted session and prints frame time statistics as JSON.
+
+    Usage: python Benchmark.py [--rounds N] [--reaction-delay SECONDS]
+                               [--aim-targets N] [--paced] [--asyncio]
+                               [--profile FILE] [--output FILE]
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+_IMPORT_START = time.perf_counter()
+from Startup import import_pygame
+import_pygame()
+import pygame
+from AimGame import AimGame, Target, TARGETS_AT_ONCE, TOTAL_TARGETS
+from Button import Button
+from FontManager import FONTS
+from FrameScheduler import FrameScheduler, IDLE, ACTIVE
+from Profiler import Profiler
+from ResultsLog import ResultsLog, ResultsReader
+from Screen import Screen
+from TextCache import TEXT_CACHE
+_IMPORT_TIME = time.perf_counter() - _IMPORT_START
+
+# The number of aim trainer targets on screen at once during the benchmark:
+# far more than in the game, so finding the target under a click is
+# measured where the SpatialGrid matters.
+AIM_TARGETS = 200
+
+# The number of random points the aim trainer's hit testing is timed on.
+HIT_TEST_PROBES = 10000
+
+ScreenCheck = Callable[[Screen], bool]
+ScreenEvents = Callable[[Screen], List[pygame.event.Event]]
+
+
+class Step:
+    """
+    One step of a scripted session.
+    === Public Attributes ===
+    name: The name the step's latency is reported under.
+    ready: Whether the step's events may be sent yet.
+    make_events: Builds the events to send.
+    done: Whether the screen has reacted to the events.
+    """
+    name: str
+    ready: ScreenCheck
+    make_events: ScreenEvents
+    done: ScreenCheck
+
+    def __init__(self, name: str, make_events: ScreenEvents,
+                 done: ScreenCheck,
+                 ready: Optional[ScreenCheck] = None) -> None:
+        """
+        Initialize a Step.
+        """
+        self.name = name
+        self.make_events = make_events
+        self.done = done
+        self.ready = ready if ready is not None else (lambda screen: True)
+
+
+def current_scene(screen: Screen) -> str:
+    """
+    Return the name of the scene <screen> is showing.
+    """
+    return screen.current_scene
+
+
+def click(button: Callable[[Screen], Button]) -> ScreenEvents:
+    """
+    Return an event maker that clicks the middle of the button chosen by
+    <button>.
+    """
+    def make(screen: Screen) -> List[pygame.event.Event]:
+        chosen = button(screen)
+        pos = (int(chosen.x + chosen.width / 2),
+               int(chosen.y + chosen.height / 2))
+        return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos,
+                                   button=1)]
+    return make
+
+
+def find(buttons: str, text: str) -> Callable[[Screen], Button]:
+    """
+    Return a chooser of the button with <text> in the screen's <buttons> list.
+    """
+    def choose(screen: Screen) -> Button:
+        for button in getattr(screen, buttons):
+            if button.text == text:
+                return button
+        raise LookupError(text)
+    return choose
+
+
+def type_text(text: Callable[[Screen], str],
+              enter: bool = True) -> ScreenEvents:
+    """
+    Return an event maker that types the string chosen by <text>, followed by
+    the return key if <enter>.
+    """
+    def make(screen: Screen) -> List[pygame.event.Event]:
+        events = [pygame.event.Event(pygame.KEYDOWN, key=ord(char.lower()),
+                                     unicode=char, mod=0)
+                  for char in text(screen)]
+        if enter:
+            events.append(pygame.event.Event(pygame.KEYDOWN,
+                                             key=pygame.K_RETURN,
+                                             unicode="\r", mod=0))
+        return events
+    return make
+
+
+def in_scene(scene: str) -> ScreenCheck:
+    """
+    Return a check for whether the screen is showing <scene>.
+    """
+    return lambda screen: current_scene(screen) == scene
+
+
+def session(rounds: int, reaction_delay: float) -> Iterator[Step]:
+    """
+    Yield the steps of a session that enters each game, plays <rounds> rounds
+    of it and goes back to the main menu. Reaction clicks are sent
+    <reaction_delay> seconds after "GO!" is presented.
+    """
+    yield Step("intro_key",
+               lambda screen: [pygame.event.Event(pygame.KEYDOWN,
+                                                  key=pygame.K_SPACE,
+                                                  unicode=" ", mod=0)],
+               in_scene("main"))
+    back = Step("back", click(find("reaction_buttons", "BACK")),
+                in_scene("main"))
+
+    yield Step("enter_reaction",
+               click(find("main_menu_buttons", "Reaction Time")),
+               in_scene("reaction"))
+    for _ in range(rounds):
+        yield Step("reaction_start", click(lambda screen: screen.react_button),
+                   lambda screen: screen.react.start)
+        yield Step("reaction_click", click(lambda screen: screen.react_button),
+                   lambda screen: not screen.react.start,
+                   lambda screen: screen.stimulus.presented_at is not None and
+                   time.perf_counter() >=
+                   screen.stimulus.presented_at + reaction_delay)
+    yield back
+
+    yield Step("enter_number",
+               click(find("main_menu_buttons", "Number Memory")),
+               in_scene("number"))
+    yield Step("number_textbox", click(lambda screen: screen.textbox),
+               lambda screen: screen.clicked_textbox)
+    yield Step("number_start", type_text(lambda screen: "start"),
+               lambda screen: screen.numbers.begin)
+    for round_number in range(1, rounds + 1):
+        yield Step("number_answer",
+                   type_text(lambda screen: screen.numbers.curr_num),
+                   lambda screen, points=round_number:
+                   screen.numbers.points == points,
+                   lambda screen: screen.can_type)
+    yield Step("back", click(find("number_buttons", "BACK")),
+               in_scene("main"))
+
+    yield Step("enter_verbal",
+               click(find("main_menu_buttons", "Verbal Memory")),
+               in_scene("verbal"))
+    for round_number in range(1, rounds + 1):
+        yield Step("verbal_answer",
+                   click(lambda screen: find(
+                       "verbal_buttons",
+                       "Shown" if screen.words.curr_word in
+                       screen.words.words_shown else "New")(screen)),
+                   lambda screen, points=round_number:
+                   screen.words.points == points,
+                   lambda screen: screen.words.is_ready())
+    yield Step("back", click(find("verbal_buttons", "BACK")),
+               in_scene("main"))
+
+    yield Step("enter_aim", click(find("main_menu_buttons", "Aim Trainer")),
+               in_scene("aim"))
+    yield Step("aim_start", click(lambda screen: screen.aim_button),
+               lambda screen: screen.aim.begin)
+    for round_number in range(1, min(rounds, TOTAL_TARGETS) + 1):
+        yield Step("aim_hit", hit_target,
+                   lambda screen, hits=round_number:
+                   len(screen.aim.hit_times) == hits,
+                   lambda screen: shown_target(screen) is not None)
+    yield Step("back", click(find("aim_buttons", "BACK")), in_scene("main"))
+
+
+def shown_target(screen: Screen) -> Optional[Target]:
+    """
+    Return a target of the aim trainer that has been presented, or None.
+    """
+    for target in screen.aim.targets:
+        if target.shown_at is not None:
+            return target
+    return None
+
+
+def hit_target(screen: Screen) -> List[pygame.event.Event]:
+    """
+    Return a click on the center of a presented aim trainer target.
+    """
+    target = shown_target(screen)
+    return [pygame.event.Event(pygame.MOUSEBUTTONDOWN,
+                               pos=(round(target.x), round(target.y)),
+                               button=1)]
+
+
+def hit_test_times(aim: AimGame,
+                   probes: int = HIT_TEST_PROBES) -> Dict[str, float]:
+    """
+    Return how long (in microseconds) finding the target under a point takes
+    on average with <aim>'s SpatialGrid, and with a scan of every presented
+    target instead, over <probes> random points in its area.
+    """
+    rng = random.Random(0)
+    x, y, width, height = aim.area
+    points = [(rng.uniform(x, x + width), rng.uniform(y, y + height))
+              for _ in range(probes)]
+    presented = [target for target in reversed(aim.targets)
+                 if target.shown_at is not None]
+    start = time.perf_counter()
+    for point in points:
+        aim.target_at(point)
+    grid = time.perf_counter() - start
+    start = time.perf_counter()
+    for point in points:
+        for target in presented:
+            if target.is_hover(point):
+                break
+    scan = time.perf_counter() - start
+    return {"targets": len(presented),
+            "grid_us": grid / probes * 1e6,
+            "scan_us": scan / probes * 1e6}
+
+
+def counted_since(stats: Dict[str, int], before: Dict[str, int],
+                  counters: Tuple[str, ...]) -> Dict[str, int]:
+    """
+    Return <stats>, with each of its <counters> counted from where it was
+    in <before> rather than from zero.
+    """
+    return {name: value - before[name] if name in counters else value
+            for name, value in stats.items()}
+
+
+def percentile(samples: List[float], percent: float) -> float:
+    """
+    Return the <percent>th percentile of the sorted list <samples>, using
+    the nearest-rank method.
+    Precondition: samples is sorted and not empty.
+    """
+    rank = max(1, math.ceil(percent / 100 * len(samples)))
+    return samples[min(rank, len(samples)) - 1]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Return the count, mean and percentiles of <samples> (in seconds) in
+    milliseconds.
+    """
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+    return {"count": len(ordered),
+            "mean_ms": sum(ordered) / len(ordered) * 1000,
+            "p50_ms": percentile(ordered, 50) * 1000,
+            "p90_ms": percentile(ordered, 90) * 1000,
+            "p99_ms": percentile(ordered, 99) * 1000,
+            "max_ms": ordered[-1] * 1000}
+
+
+class HarnessScheduler(FrameScheduler):
+    """
+    A FrameScheduler that plays a scripted session into the Screen it paces
+    and measures every frame.
+    === Public Attributes ===
+    screen: The screen being driven, set once it has been created.
+    paced: Whether frames are paced as in the real game. If False, every
+        scene runs as fast as possible.
+    step_timeout: The longest time (in seconds) a step may take.
+    frame_times: The time each frame spent drawing and handling events
+        (excluding pacing), per scene, in seconds.
+    frame_counts: The number of frames and the wall clock time spent in each
+        scene.
+    frame_lateness: How late each frame's wait ended compared to when the
+        frame was due, per scene, in seconds.
+    latencies: The time from sending a step's events until the screen
+        reacted, per step name, in seconds.
+    onset_lags: How late each "GO!" of the reaction game was presented
+        compared to when it was due, in seconds.
+    first_frame: The time from the harness starting (just before the Screen
+        is created) until the first frame was presented, in seconds.
+    error: A description of what went wrong, or None.
+    """
+    screen: Optional[Screen]
+    paced: bool
+    step_timeout: float
+    frame_times: Dict[str, List[float]]
+    frame_counts: Dict[str, List[float]]
+    frame_lateness: Dict[str, List[float]]
+    latencies: Dict[str, List[float]]
+    onset_lags: List[float]
+    first_frame: Optional[float]
+    error: Optional[str]
+
+    def __init__(self, steps: Iterator[Step], paced: bool = False,
+                 step_timeout: float = 15.0) -> None:
+        """
+        Initialize a HarnessScheduler that plays <steps>.
+        """
+        if paced:
+            FrameScheduler.__init__(self)
+        else:
+            FrameScheduler.__init__(self, active_fps=0, precise_fps=0)
+        self.screen = None
+        self.paced = paced
+        self.step_timeout = step_timeout
+        self.frame_times = {}
+        self.frame_counts = {}
+        self.frame_lateness = {}
+        self.latencies = {}
+        self.onset_lags = []
+        self.first_frame = None
+        self.error = None
+        self._steps = steps
+        self._step = None
+        self._sent_at = None
+        self._ready_since = None
+        self._started = time.perf_counter()
+        self._frame_end = None
+        self._scene_since = None
+        self._onset_seen = None
+
+    def events(self, mode: str = ACTIVE) -> List[pygame.event.Event]:
+        """
+        Record the frame that just finished, send the script's next events
+        when they are due and return this frame's events.
+        """
+        events = FrameScheduler.events(self, self._end_frame(mode))
+        self._record_wait()
+        return events
+
+    async def wait_events(self, mode: str = ACTIVE) \
+            -> List[pygame.event.Event]:
+        """
+        The same as events(), but awaits the frame's events.
+        """
+        events = await FrameScheduler.wait_events(self, self._end_frame(mode))
+        self._record_wait()
+        return events
+
+    def _end_frame(self, mode: str) -> str:
+        """
+        Record the frame that just finished and move the script along, then
+        return the mode to wait for the frame's events in, given the scene
+        asked for <mode>.
+        """
+        now = time.perf_counter()
+        if self.first_frame is None:
+            self.first_frame = now - self._started
+        scene = current_scene(self.screen)
+        if self._frame_end is not None:
+            self.frame_times.setdefault(scene, []).append(
+                now - self._frame_end)
+        counts = self.frame_counts.setdefault(scene, [0, 0.0])
+        counts[0] += 1
+        if self._scene_since is not None:
+            counts[1] += now - self._scene_since
+        self._scene_since = now
+        self._record_onset()
+        self._advance(now)
+        if not self.paced and mode == IDLE:
+            return ACTIVE
+        return mode
+
+    def _record_wait(self) -> None:
+        """
+        Record how the wait for the frame's events went.
+        """
+        self._frame_end = time.perf_counter()
+        self.frame_lateness.setdefault(current_scene(self.screen),
+                                       []).append(self.lateness)
+
+    def _record_onset(self) -> None:
+        """
+        Record how late the reaction game's "GO!" was presented, the first
+        frame after it was.
+        """
+        stimulus = self.screen.stimulus
+        lag = stimulus.onset_lag()
+        if lag is not None and stimulus.presented_at != self._onset_seen:
+            self._onset_seen = stimulus.presented_at
+            self.onset_lags.append(lag)
+
+    def _advance(self, now: float) -> None:
+        """
+        Move the script along: finish the current step if the screen has
+        reacted, and send the next step's events once it is ready.
+        """
+        if self._step is not None and self._sent_at is not None:
+            if self._step.done(self.screen):
+                self.latencies.setdefault(self._step.name, []).append(
+                    now - self._sent_at)
+                self._step = None
+            elif now - self._sent_at > self.step_timeout:
+                self._fail("step " + self._step.name + " timed out")
+                return
+        if self._step is None:
+            self._step = next(self._steps, None)
+            self._sent_at = None
+            self._ready_since = now
+            if self._step is None:
+                pygame.event.post(pygame.event.Event(pygame.QUIT))
+                return
+        if self._sent_at is None:
+            if self._step.ready(self.screen):
+                for event in self._step.make_events(self.screen):
+                    pygame.event.post(event)
+                self._sent_at = time.perf_counter()
+            elif now - self._ready_since > self.step_timeout:
+                self._fail("step " + self._step.name + " never became ready")
+
+    def _fail(self, error: str) -> None:
+        """
+        Stop the session because of <error>.
+        """
+        self.error = error
+        self._steps = iter(())
+        self._step = None
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    def report(self) -> Dict:
+        """
+        Return the measurements as a JSON-serializable dictionary.
+        """
+        scenes = {}
+        for scene, samples in self.frame_times.items():
+            frames, seconds = self.frame_counts.get(scene, [0, 0.0])
+            scenes[scene] = summarize(samples)
+            scenes[scene]["fps"] = frames / seconds if seconds > 0 else None
+        return {"python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+                "paced": self.paced,
+                "import_ms": _IMPORT_TIME * 1000,
+                "first_frame_ms": None if self.first_frame is None else
+                self.first_frame * 1000,
+                "scenes": scenes,
+                "latency": {name: summarize(samples)
+                            for name, samples in self.latencies.items()},
+                "lateness": {scene: summarize(samples)
+                             for scene, samples in
+                             self.frame_lateness.items()},
+                "stimulus_onset": summarize(self.onset_lags),
+                "error": self.error}
+
+
+def run(rounds: int = 3, reaction_delay: float = 0.2,
+        paced: bool = False, profile: Optional[str] = None,
+        use_asyncio: bool = False, aim_targets: int = AIM_TARGETS) -> Dict:
+    """
+    Play a scripted session of <rounds> rounds per game on a headless Screen,
+    with <aim_targets> aim trainer targets on screen at once, and return the
+    report. The report includes how long hit testing the targets left on
+    screen took, and how many fonts were created and text renders were
+    cached during the session. If <profile> names a file, every frame is
+    profiled, the Chrome trace is written to it and the report includes the
+    profile's summary. The game runs on an asyncio event loop (see
+    Screen.run_game_async) if <use_asyncio>.
+    """
+    fonts = FONTS.stats()
+    text_cache = TEXT_CACHE.stats()
+    scheduler = HarnessScheduler(session(rounds, reaction_delay), paced)
+    profiler = Profiler() if profile else None
+    with tempfile.TemporaryDirectory() as directory:
+        # Keep the session's trials out of the real results log.
+        path = os.path.join(directory, "results.log")
+        screen = Screen(scheduler, ResultsLog(path), profiler,
+                        aim_targets=aim_targets)
+        scheduler.screen = screen
+        start = time.perf_counter()
+        if use_asyncio:
+            asyncio.run(screen.run_game_async())
+        else:
+            screen.run_game()
+        report = scheduler.report()
+        report["asyncio"] = use_asyncio
+        report["rounds"] = rounds
+        report["aim_targets"] = aim_targets
+        report["hit_test"] = hit_test_times(screen.aim)
+        report["total_s"] = time.perf_counter() - start
+        report["fonts"] = counted_since(FONTS.stats(), fonts,
+                                        ("constructed", "lookups", "hits"))
+        report["text_cache"] = counted_since(
+            TEXT_CACHE.stats(), text_cache, ("hits", "misses", "evictions"))
+        reader = ResultsReader(path)
+        report["results_logged"] = len(reader)
+        reader.close()
+    if profiler is not None:
+        profiler.dump(profile)
+        report["profile"] = profiler.summary()
+    pygame.quit()
+    # The shared fonts and rendered text belong to the SDL session that just
+    # ended, and using them in the next one would crash.
+    FONTS.clear()
+    TEXT_CACHE.clear()
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the game headlessly with a scripted session.")
+    parser.add_argument("--rounds", type=int, default=3,
+                        help="rounds to play in each game")
+    parser.add_argument("--reaction-delay", type=float, default=0.2,
+                        help="seconds between GO! and the scripted click")
+    parser.add_argument("--aim-targets", type=int, default=AIM_TARGETS,
+                        help="aim trainer targets on screen at once "
+                             "(%(default)s by default, " +
+                             str(TARGETS_AT_ONCE) + " in the game)")
+    parser.add_argument("--paced", action="store_true",
+                        help="pace frames as in the real game")
+    parser.add_argument("--asyncio", action="store_true",
+                        help="run the game on an asyncio event loop")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="profile every frame and write a Chrome trace "
+                             "to FILE")
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args(argv)
+    if args.aim_targets < 1:
+        parser.error("--aim-targets must be positive")
+    report = run(args.rounds, args.reaction_delay, args.paced, args.profile,
+                 args.asyncio, args.aim_targets)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+    return 1 if report["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,13 +3,36 @@
     Author: Adam Kanoun
     Python Version: 3.9
 """
-from typing import Tuple, Optional, Union
+from typing import Dict, Tuple, Optional, Union
 import pygame
+from TextCache import TEXT_CACHE
+
+# BUTTON STATES
+NORMAL = "normal"
+HOVER = "hover"
+PRESSED = "pressed"
+
+
+def tint(color: Tuple[int, int, int], state: str) -> Tuple:
+    """
+    Return <color> as it looks in <state>: 30% lighter when hovered over and
+    20% darker when pressed.
+    """
+    if state == HOVER:
+        return (color[0] + (255 - color[0]) * 0.3,
+                color[1] + (255 - color[1]) * 0.3,
+                color[2] + (255 - color[2]) * 0.3)
+    if state == PRESSED:
+        return color[0] * 0.8, color[1] * 0.8, color[2] * 0.8
+    return color
 
 
 class Button:
     """
     A class representing a button in pygame.
+    Each state the button is drawn in (NORMAL, HOVER or PRESSED) is rendered
+    into a sprite once, and only rendered again after the button's text,
+    colors, position or size change, so drawing it is a single blit.
     === Public Attributes ===
     text: The text that is displayed on the button.
     text_color: The color of the text on the button in RGB.
@@ -22,6 +45,11 @@ class Button:
     outline: A variable representing the color of the button's outline in RGB.
         Keep in mind, if outline is None, there is no outline.
 
+    === Private Attributes ===
+    _key: The appearance() the sprites and rectangle were made for.
+    _rect: The area covered by the button's sprites.
+    _sprites: The button drawn in each state it has been drawn in so far.
+
     === Representation Invariants ===
     font_size > 0
     x, y >= 0
@@ -36,6 +64,11 @@ class Button:
     width: Union[int, float]
     height: Union[int, float]
     outline: Optional[Tuple[int, int, int]]
+    _key: Optional[Tuple]
+    _rect: pygame.Rect
+    _sprites: Dict[str, pygame.Surface]
+    __slots__ = ("text", "text_color", "font_size", "color", "x", "y",
+                 "width", "height", "outline", "_key", "_rect", "_sprites")
 
     def __init__(self, color: Tuple[int, int, int], x: Union[int, float],
                  y: Union[int, float], width: Union[int, float],
@@ -59,38 +92,98 @@ class Button:
         self.height = height
         self.font_size = font_size
         self.outline = outline
+        self._key = None
+        self._sprites = {}
 
-    def draw_button(self, screen: pygame.Surface) -> None:
+    def appearance(self) -> Tuple:
         """
-        Draw a button on the screen.
+        Return everything that decides how the button looks, so callers can
+        tell when the button changed (new text, new colors, new outline...).
         """
+        return (self.text, tuple(self.text_color), self.font_size,
+                tuple(self.color), self.outline, self.x, self.y, self.width,
+                self.height)
+
+    def _refresh(self) -> None:
+        """
+        Forget the sprites and work out the area they cover again if the
+        button's appearance changed since they were made.
+        """
+        key = self.appearance()
+        if key == self._key:
+            return
+        self._key = key
+        self._sprites = {}
+        pad = 3 if self.outline is not None else 1
+        rect = pygame.Rect(int(self.x) - pad, int(self.y) - pad,
+                           int(self.width) + 2 * pad + 1,
+                           int(self.height) + 2 * pad + 1)
+        if self.text != '':
+            rect.union_ip(self._text_rect())
+        self._rect = rect
+
+    def _text_rect(self) -> pygame.Rect:
+        """
+        Return where the button's text is drawn on the screen.
+        """
+        text = TEXT_CACHE.render(self.text, self.text_color, self.font_size)
+        text_rect = text.get_rect()
+        text_rect.center = ((self.x + (self.width / 2)), self.y +
+                            (self.height / 2))
+        return text_rect
+
+    def _render(self, state: str) -> pygame.Surface:
+        """
+        Return a new sprite of the button in <state>, covering _rect.
+        """
+        rect = self._rect
+        sprite = pygame.Surface(rect.size, pygame.SRCALPHA)
+        # Give the transparent pixels the text's color, so the text's
+        # anti-aliased edges keep their color where they spill past the
+        # button.
+        sprite.fill(tuple(self.text_color[:3]) + (0,))
+        x, y = self.x - rect.x, self.y - rect.y
         if self.outline is not None:
             # Draw a rectangle with color <outline> that is bigger than width
             # and height, to make it seem like it is an outline.
-            pygame.draw.rect(screen, self.outline, (self.x - 2, self.y - 2,
+            pygame.draw.rect(sprite, self.outline, (x - 2, y - 2,
                                                     self.width + 4,
                                                     self.height + 4), 0)
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width,
-                                              self.height), 0)
+        pygame.draw.rect(sprite, tint(self.color, state),
+                         (x, y, self.width, self.height), 0)
+        if self.text != '':
+            text = TEXT_CACHE.render(self.text, self.text_color,
+                                     self.font_size)
+            sprite.blit(text, self._text_rect().move(-rect.x, -rect.y))
+        return sprite
 
-    def draw_text(self, screen: pygame.Surface) -> None:
+    def sprite(self, state: str = NORMAL) -> Tuple[pygame.Surface,
+                                                   pygame.Rect]:
         """
-        Draw the text for the button.
+        Return the button drawn in <state> and where on the screen it goes,
+        rendering it only if it has not been rendered since the button last
+        changed. The sprite is shared, so it must not be drawn on.
         """
-        if self.text != '':
-            button_font = pygame.font.Font('freesansbold.ttf', self.font_size)
-            text = button_font.render(self.text, True, self.text_color)
-            text_rect = text.get_rect()
-            text_rect.center = ((self.x + (self.width / 2)), self.y +
-                                (self.height / 2))
-            screen.blit(text, text_rect)
+        self._refresh()
+        sprite = self._sprites.get(state)
+        if sprite is None:
+            sprite = self._render(state)
+            self._sprites[state] = sprite
+        return sprite, self._rect
+
+    def draw(self, screen: pygame.Surface, state: str = NORMAL) -> None:
+        """
+        Draw the button in <state> on <screen>.
+        """
+        sprite, rect = self.sprite(state)
+        screen.blit(sprite, rect)
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def box(self) -> Tuple[float, float, float, float]:
         """
-        # TODO: Complete docstring
+        Return the area (x, y, width, height) in which the button can be
+        hovered over or clicked.
         """
-        self.draw_button(screen)
-        self.draw_text(screen)
+        return self.x, self.y, self.width, self.height
 
     def is_hover(self, position: Tuple[int, int]) -> bool:
         """
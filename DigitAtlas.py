@@ -0,0 +1,132 @@
+"""
+    File name: DigitAtlas.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+from typing import Dict, List, Optional, Tuple
+import pygame
+from FontManager import FONTS, SANS_FONT
+
+# The font sizes numbers may be drawn at, from largest to smallest.
+NUMBER_SIZES = (60, 48, 36, 28, 22, 18, 14, 11, 9)
+
+# Shown at the end of a number too long to fit even at the smallest size.
+ELLIPSIS = "..."
+
+
+class DigitAtlas:
+    """
+    Pre-rendered glyphs for the digits 0-9, used to lay out and draw numbers
+    of any length as wrapped lines of text.
+    A number is laid out once, at the largest size in NUMBER_SIZES at which it
+    fits the area it is given, and composed into one surface with a single
+    batched Surface.blits call; drawing it every frame is then one blit, no
+    matter how many digits it has.
+    === Public Attributes ===
+    path: The font file the digits are drawn with.
+    layouts: The number of numbers that have been laid out and composed.
+
+    === Private Attributes ===
+    _glyphs: The rendered digits (and ellipsis), keyed by (size, color).
+    _composed_key: The number, color and area of the last composed number.
+    _composed: The last composed number.
+
+    === Representation Invariants ===
+    layouts >= 0
+    """
+    path: str
+    layouts: int
+    _glyphs: Dict[Tuple[int, Tuple[int, ...]], Dict[str, pygame.Surface]]
+    _composed_key: Optional[Tuple]
+    _composed: Optional[pygame.Surface]
+
+    def __init__(self, path: str = SANS_FONT) -> None:
+        """
+        Initialize an empty DigitAtlas drawing with the font at <path>.
+        """
+        self.path = path
+        self.layouts = 0
+        self._glyphs = {}
+        self._composed_key = None
+        self._composed = None
+
+    def glyphs(self, size: int, color: Tuple[int, int, int]) \
+            -> Dict[str, pygame.Surface]:
+        """
+        Return the digits (and the ellipsis) rendered in <color> at point size
+        <size>, rendering all of them the first time they are needed.
+        """
+        key = (size, tuple(color))
+        glyphs = self._glyphs.get(key)
+        if glyphs is None:
+            font = FONTS.get(size, self.path)
+            glyphs = {char: font.render(char, True, color)
+                      for char in "0123456789"}
+            glyphs[ELLIPSIS] = font.render(ELLIPSIS, True, color)
+            self._glyphs[key] = glyphs
+        return glyphs
+
+    def layout(self, length: int, width: int, height: int) \
+            -> Tuple[int, int, int, int]:
+        """
+        Return (size, digits per line, lines, line height) for drawing a
+        number of <length> digits inside a <width> by <height> area, using the
+        largest size in NUMBER_SIZES at which every digit fits. If none fits,
+        the smallest size is used and lines is how many fit.
+        """
+        for size in NUMBER_SIZES:
+            font = FONTS.get(size, self.path)
+            advance = max(font.size(char)[0] for char in "0123456789")
+            line_height = font.get_linesize()
+            per_line = max(1, width // advance)
+            lines = -(-length // per_line)
+            if lines * line_height <= height:
+                return size, per_line, lines, line_height
+        return size, per_line, max(1, height // line_height), line_height
+
+    def render(self, number: str, color: Tuple[int, int, int],
+               width: int, height: int) -> pygame.Surface:
+        """
+        Return <number> drawn in <color> as centered, wrapped lines that fit
+        inside a <width> by <height> area. The result is cached, so drawing the
+        same number again costs nothing.
+        Precondition: number only contains the digits 0-9.
+        """
+        key = (number, tuple(color), width, height)
+        if key == self._composed_key:
+            return self._composed
+        size, per_line, lines, line_height = \
+            self.layout(len(number), width, height)
+        glyphs = self.glyphs(size, color)
+        truncated = lines * per_line < len(number)
+        rows = [number[start:start + per_line]
+                for start in range(0, min(len(number), lines * per_line),
+                                   per_line)]
+        if truncated:
+            # Make room for the ellipsis on the last line.
+            room = glyphs[ELLIPSIS].get_width()
+            last = rows[-1]
+            while last and sum(glyphs[char].get_width() for char in last) + \
+                    room > width:
+                last = last[:-1]
+            rows[-1] = last
+        row_widths = [sum(glyphs[char].get_width() for char in row)
+                      for row in rows]
+        if truncated:
+            row_widths[-1] += glyphs[ELLIPSIS].get_width()
+        surface = pygame.Surface((max(row_widths), len(rows) * line_height),
+                                 pygame.SRCALPHA)
+        sequence: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        for index, row in enumerate(rows):
+            x = (surface.get_width() - row_widths[index]) // 2
+            y = index * line_height
+            for char in row:
+                sequence.append((glyphs[char], (x, y)))
+                x += glyphs[char].get_width()
+            if truncated and index == len(rows) - 1:
+                sequence.append((glyphs[ELLIPSIS], (x, y)))
+        surface.blits(sequence, False)
+        self._composed_key = key
+        self._composed = surface
+        self.layouts += 1
+        return surface
@@ -0,0 +1,100 @@
+"""
+    File name: DirtyRegions.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+from typing import Dict, Hashable, List, Set, Tuple
+import pygame
+
+
+class DirtyRegions:
+    """
+    Keeps track of which parts of the window changed since the last frame, so
+    that only those parts are sent to the display.
+    Every piece of changing content drawn in a frame is reported with track();
+    content whose position or state differs from the previous frame, and
+    content that was drawn last frame but not this one, marks its old and new
+    rectangles dirty.
+    === Public Attributes ===
+    full_updates: The number of frames that updated the whole window.
+    partial_updates: The number of frames that updated only dirty rectangles.
+    skipped_updates: The number of frames in which nothing changed.
+
+    === Private Attributes ===
+    _drawn: The rectangle and state of everything tracked in the last frame.
+    _seen: The keys tracked so far in the current frame.
+    _rects: The rectangles that are dirty in the current frame.
+    _full: Whether the whole window must be updated in the current frame.
+
+    === Representation Invariants ===
+    full_updates, partial_updates, skipped_updates >= 0
+    """
+    full_updates: int
+    partial_updates: int
+    skipped_updates: int
+    _drawn: Dict[Hashable, Tuple[pygame.Rect, Hashable]]
+    _seen: Set[Hashable]
+    _rects: List[pygame.Rect]
+    _full: bool
+
+    def __init__(self) -> None:
+        """
+        Initialize DirtyRegions. The first frame always updates the whole
+        window.
+        """
+        self._drawn = {}
+        self._seen = set()
+        self._rects = []
+        self._full = True
+        self.full_updates = 0
+        self.partial_updates = 0
+        self.skipped_updates = 0
+
+    def track(self, key: Hashable, rect: pygame.Rect,
+              state: Hashable) -> None:
+        """
+        Report that the content identified by <key> was drawn this frame
+        inside <rect>, looking as described by <state>.
+        """
+        self._seen.add(key)
+        rect = pygame.Rect(rect)
+        previous = self._drawn.get(key)
+        if previous is None or previous[0] != rect or previous[1] != state:
+            if previous is not None:
+                self._rects.append(previous[0])
+            self._rects.append(rect)
+            self._drawn[key] = (rect, state)
+
+    def full(self) -> None:
+        """
+        Make the current frame update the whole window (e.g. on a scene
+        transition).
+        """
+        self._full = True
+
+    def present(self) -> None:
+        """
+        Send this frame's dirty rectangles (or the whole window) to the
+        display and start a new frame.
+        """
+        for key in [k for k in self._drawn if k not in self._seen]:
+            self._rects.append(self._drawn.pop(key)[0])
+        self._seen.clear()
+        if self._full:
+            pygame.display.update()
+            self.full_updates += 1
+        elif self._rects:
+            pygame.display.update(self._rects)
+            self.partial_updates += 1
+        else:
+            self.skipped_updates += 1
+        self._rects = []
+        self._full = False
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return how many frames were presented in each way.
+        """
+        return {"full_updates": self.full_updates,
+                "partial_updates": self.partial_updates,
+                "skipped_updates": self.skipped_updates}
@@ -0,0 +1,88 @@
+"""
+    File name: FontManager.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+from typing import Dict, Tuple, Iterable
+import pygame
+
+# FONTS
+SANS_FONT = 'freesansbold.ttf'
+
+
+class FontManager:
+    """
+    A registry of loaded pygame fonts, shared by every Button and Screen so
+    that a font file is only opened and parsed once per size.
+    === Public Attributes ===
+    constructed: The number of pygame.font.Font objects this registry has
+        created.
+    lookups: The number of times a font has been requested.
+    hits: The number of requests answered by an already-loaded font.
+
+    === Private Attributes ===
+    _fonts: The loaded fonts, keyed by (font path, size).
+
+    === Representation Invariants ===
+    constructed, lookups, hits >= 0
+    constructed + hits == lookups
+    constructed >= len(_fonts)
+    """
+    constructed: int
+    lookups: int
+    hits: int
+    _fonts: Dict[Tuple[str, int], pygame.font.Font]
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty FontManager.
+        """
+        self._fonts = {}
+        self.constructed = 0
+        self.lookups = 0
+        self.hits = 0
+
+    def get(self, size: int, path: str = SANS_FONT) -> pygame.font.Font:
+        """
+        Return the font at <path> with point size <size>, loading it only if
+        it has never been requested before.
+        Precondition: pygame.font has been initialized.
+        """
+        self.lookups += 1
+        key = (path, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(path, size)
+            self._fonts[key] = font
+            self.constructed += 1
+        else:
+            self.hits += 1
+        return font
+
+    def preload(self, sizes: Iterable[int], path: str = SANS_FONT) -> None:
+        """
+        Load the font at <path> for every size in <sizes> so none of them are
+        constructed later inside a frame loop.
+        """
+        for size in sizes:
+            if (path, size) not in self._fonts:
+                self._fonts[(path, size)] = pygame.font.Font(path, size)
+                self.constructed += 1
+                self.lookups += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the registry's counters.
+        """
+        return {"constructed": self.constructed, "lookups": self.lookups,
+                "hits": self.hits, "loaded": len(self._fonts)}
+
+    def clear(self) -> None:
+        """
+        Forget every loaded font (e.g. after pygame.quit()).
+        """
+        self._fonts.clear()
+
+
+# The registry shared by the whole game.
+FONTS = FontManager()
@@ -0,0 +1,238 @@
+"""
+    File name: FrameScheduler.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+import time
+import pygame
+
+# FRAME MODES
+IDLE = "idle"
+ACTIVE = "active"
+PRECISE = "precise"
+
+# The events that end a PRECISE frame's input sampling early.
+INPUT_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN, pygame.QUIT)
+
+# The resolution (in seconds) of the clock used to timestamp events.
+CLOCK_RESOLUTION = time.get_clock_info('perf_counter').resolution
+
+# How often (in seconds) an IDLE frame awaited with wait_events() checks the
+# event queue. pygame can only block on its queue by blocking the whole
+# thread, which would stall every other task on the asyncio event loop.
+IDLE_POLL = 0.005
+
+# How long (in seconds) before an awaited ACTIVE or IDLE frame is due it stops
+# sleeping and hands the event loop over until the frame is due instead, as
+# asyncio's sleeps can end up to a millisecond late.
+SLEEP_MARGIN = 0.002
+
+
+class FrameScheduler:
+    """
+    Paces the scene loops and hands them their events.
+    A scene asks for its events in one of three modes:
+        IDLE: The scene only changes in response to input, so block on
+            pygame.event.wait until an event arrives (or idle_timeout passes),
+            capped at active_fps so mouse motion can not flood the loop.
+        ACTIVE: The scene changes over time, so run at most active_fps frames
+            per second, sleeping in between.
+        PRECISE: The scene is timing sensitive, so instead of sleeping until
+            the next frame, keep sampling the event queue until either the
+            frame is due (at up to precise_fps frames per second, or earlier
+            if wake_at() asked for it) or an input event arrives.
+    Every event handed out gets two extra attributes: <arrived>, the
+    time.perf_counter() reading when the event was taken off the queue, and
+    <arrival_error>, how much earlier than <arrived> it may have been queued
+    (the time since the queue was last sampled, plus the clock resolution).
+    Frames can also be ended by awaiting wait_events() instead of calling
+    events(), which paces them the same way without blocking the asyncio
+    event loop it runs on.
+    Besides its events, everything else the game reads from the outside
+    world while it runs (the time, the mouse and whether background work has
+    finished) is read through the scheduler, so a session can be recorded and
+    replayed by a scheduler that overrides now(), pointer() and is_done().
+    === Public Attributes ===
+    active_fps: The frame cap for ACTIVE and IDLE scenes, 0 means no cap.
+    precise_fps: The frame cap for PRECISE scenes, 0 means no cap.
+    idle_timeout: The longest time (in milliseconds) an IDLE scene waits for
+        an event before drawing another frame.
+    clock: The clock used to pace the frames.
+    last_poll: The time.perf_counter() reading when the event queue was last
+        sampled.
+    lateness: How late (in seconds) the last frame's wait ended compared to
+        when the frame was due, e.g. because its work or another task on the
+        event loop ran past it.
+
+    === Representation Invariants ===
+    active_fps, precise_fps >= 0
+    idle_timeout > 0
+    lateness >= 0
+    """
+    active_fps: int
+    precise_fps: int
+    idle_timeout: int
+    clock: pygame.time.Clock
+    last_poll: float
+    lateness: float
+
+    def __init__(self, active_fps: int = 60, precise_fps: int = 240,
+                 idle_timeout: int = 250) -> None:
+        """
+        Initialize a FrameScheduler.
+        Preconditions:
+            active_fps, precise_fps >= 0
+            idle_timeout > 0
+        """
+        self.active_fps = active_fps
+        self.precise_fps = precise_fps
+        self.idle_timeout = idle_timeout
+        self.clock = pygame.time.Clock()
+        self.last_poll = time.perf_counter()
+        self.lateness = 0.0
+        self._frame_start = self.last_poll
+        self._wake_at = None
+
+    def events(self, mode: str = ACTIVE) -> List[pygame.event.Event]:
+        """
+        End the current frame according to <mode> and return the events that
+        arrived since the last frame.
+        """
+        if mode == PRECISE:
+            events = self._sample_until_due()
+            self.clock.tick()
+        else:
+            due = self._due(self.active_fps)
+            self.clock.tick(self.active_fps)
+            self.lateness = max(0.0, time.perf_counter() - due)
+            if mode == IDLE:
+                event = pygame.event.wait(self.idle_timeout)
+                if event.type == pygame.NOEVENT:
+                    events = self._stamp([])
+                else:
+                    events = self._stamp([event] + pygame.event.get())
+            else:
+                events = self._stamp(pygame.event.get())
+        self._frame_start = time.perf_counter()
+        return events
+
+    async def wait_events(self, mode: str = ACTIVE) \
+            -> List[pygame.event.Event]:
+        """
+        The same as events(), but wait for the frame to end by awaiting
+        instead of by blocking, so the other tasks on the running asyncio
+        event loop run in the meantime. A PRECISE frame still samples the
+        event queue until it is due, handing the loop over between samples.
+        """
+        # Imported here so the game only pays for importing asyncio when it
+        # runs on it.
+        import asyncio
+        if mode == PRECISE:
+            due = self._precise_due()
+            events = []
+            while True:
+                batch = self._stamp(pygame.event.get())
+                events.extend(batch)
+                if self.last_poll >= due or \
+                        any(event.type in INPUT_EVENTS for event in batch):
+                    break
+                await asyncio.sleep(0)
+            self.lateness = max(0.0, self.last_poll - due)
+            self.clock.tick()
+        else:
+            due = self._due(self.active_fps)
+            await asyncio.sleep(max(0.0, due - SLEEP_MARGIN -
+                                    time.perf_counter()))
+            while time.perf_counter() < due:
+                await asyncio.sleep(0)
+            self.clock.tick()
+            self.lateness = max(0.0, time.perf_counter() - due)
+            events = self._stamp(pygame.event.get())
+            if mode == IDLE:
+                timeout = self.last_poll + self.idle_timeout / 1000
+                while not events and self.last_poll < timeout:
+                    await asyncio.sleep(min(IDLE_POLL,
+                                            timeout - self.last_poll))
+                    events = self._stamp(pygame.event.get())
+        self._frame_start = time.perf_counter()
+        return events
+
+    def now(self) -> float:
+        """
+        Return the current time.perf_counter() reading, which the game's
+        timing is measured with.
+        """
+        return time.perf_counter()
+
+    def pointer(self) -> Tuple[Tuple[int, int], bool]:
+        """
+        Return where the mouse is and whether its left button is held down.
+        """
+        return pygame.mouse.get_pos(), pygame.mouse.get_pressed()[0]
+
+    def is_done(self, future: Optional[Future]) -> bool:
+        """
+        Return whether the background work behind <future> has finished (or
+        failed). A future that is None has not been started.
+        """
+        return future is not None and future.done()
+
+    def wake_at(self, when: Optional[float]) -> None:
+        """
+        Make the PRECISE frame that is running at time.perf_counter() reading
+        <when> end exactly then, so something scheduled for <when> can be
+        drawn without waiting for the frame to finish.
+        """
+        self._wake_at = when
+
+    def _sample_until_due(self) -> List[pygame.event.Event]:
+        """
+        Keep sampling the event queue until the next PRECISE frame is due or
+        an input event arrives, and return the stamped events.
+        """
+        due = self._precise_due()
+        events = []
+        while True:
+            batch = self._stamp(pygame.event.get())
+            events.extend(batch)
+            if self.last_poll >= due or \
+                    any(event.type in INPUT_EVENTS for event in batch):
+                self.lateness = max(0.0, self.last_poll - due)
+                return events
+
+    def _due(self, fps: int) -> float:
+        """
+        Return the time.perf_counter() reading when the current frame is due
+        to end, at <fps> frames per second (0 means no cap).
+        """
+        if fps > 0:
+            return self._frame_start + 1 / fps
+        return self._frame_start
+
+    def _precise_due(self) -> float:
+        """
+        Return the time.perf_counter() reading when the current PRECISE frame
+        is due to end, taking the time asked for by wake_at() (if any) into
+        account.
+        """
+        due = self._due(self.precise_fps)
+        if self._wake_at is not None and self._wake_at <= due:
+            due = self._wake_at
+            self._wake_at = None
+        return due
+
+    def _stamp(self, events: List[pygame.event.Event]) \
+            -> List[pygame.event.Event]:
+        """
+        Give each of <events>, just taken off the queue, its arrival time and
+        arrival error.
+        """
+        now = time.perf_counter()
+        error = now - self.last_poll + CLOCK_RESOLUTION
+        for event in events:
+            event.arrived = now
+            event.arrival_error = error
+        self.last_poll = now
+        return events
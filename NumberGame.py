@@ -4,6 +4,33 @@
     Python Version: 3.9
 """
 import random
+from typing import Optional
+
+# Maps a random byte to an ASCII digit, or deletes it if it is one of the
+# last 6 byte values, so every digit is equally likely.
+_DIGIT_TABLE = bytes(ord('0') + value % 10 for value in range(256))
+_UNEVEN_BYTES = bytes(range(250, 256))
+
+
+def random_digits(length: int, rng: Optional[random.Random] = None) -> str:
+    """
+    Return a random string of <length> decimal digits that does not start
+    with 0, using <rng> (the random module by default).
+    The digits are made from batches of random bytes, so no big integers are
+    involved and the cost grows linearly with <length>.
+    Precondition: length >= 1
+    """
+    chooser = rng if rng is not None else random
+    first = 255
+    while first >= 252:
+        first = chooser.getrandbits(8)
+    digits = bytearray([ord('1') + first % 9])
+    while len(digits) < length:
+        # Ask for a few more bytes than needed, since some are dropped.
+        needed = length - len(digits)
+        batch = chooser.randbytes(needed + needed // 32 + 8)
+        digits += batch.translate(_DIGIT_TABLE, _UNEVEN_BYTES)
+    return digits[:length].decode('ascii')
 
 
 class NumberGame:
@@ -12,37 +39,47 @@ class NumberGame:
     === Public Attributes ===
     points: The number of answers the user has gotten correct.
     curr_num: The current number displayed on screen.
-    lower_bound: The smallest number that should be tested this round.
+    length: The number of digits in the next number to be tested.
     time_on_screen: The amount of time that the number will be displayed on
         screen (in seconds).
+    first_time_on_screen: The time_on_screen of the first number of a game.
+    time_step: How much longer (in seconds) each number is displayed than
+        the one before it.
     begin: Represents whether or not the game has begun.
+    rng: The random number generator numbers are made with, or None to use
+        the random module.
 
     === Representation Invariants ===
     points > 0
-    lower_bound >= 1
-    lower_bound  must be a multiple of 10
+    length >= 1
     time_on_screen > 0
+    first_time_on_screen > 0
+    time_step >= 0
     """
     points: int = 0
     curr_num: str
-    lower_bound: int = 1
+    length: int = 1
     time_on_screen: float = 1.7
+    first_time_on_screen: float = 1.7
+    time_step: float = 0.2
     begin: bool = False
+    rng: Optional[random.Random] = None
 
-    def __init__(self) -> None:
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
         """
-        Initialize the NumberGame class
+        Initialize the NumberGame class, making numbers with <rng> (the random
+        module by default).
         """
-        pass
+        self.rng = rng
 
     def setup(self) -> None:
         """
         Sets up a NumberGame
         """
         self.points = 0
-        self.lower_bound = 1
+        self.length = 1
         self.assign_number_string()
-        self.time_on_screen = 1.7
+        self.time_on_screen = self.first_time_on_screen
         self.begin = False
 
     def assign_number_string(self) -> None:
@@ -50,9 +87,8 @@ class NumberGame:
         Create a number of length points + 1 digits and assigns it to
         curr_num.
         """
-        self.curr_num = \
-            str(random.randint(self.lower_bound, (self.lower_bound * 10) - 1))
-        self.lower_bound *= 10
+        self.curr_num = random_digits(self.length, self.rng)
+        self.length += 1
 
     def is_correct(self, answer: str) -> bool:
         """
@@ -69,6 +105,6 @@ class NumberGame:
         if self.is_correct(answer):
             self.points += 1
             self.assign_number_string()
-            self.time_on_screen += 0.2
+            self.time_on_screen += self.time_step
         else:
             self.setup()
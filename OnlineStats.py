@@ -0,0 +1,239 @@
+"""
+    File name: OnlineStats.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+import math
+from typing import Dict, List
+
+
+class RunningStats:
+    """
+    The mean, variance and range of a stream of values, updated in O(1) time
+    and memory per value with Welford's algorithm, which stays accurate even
+    when the values are large and close together.
+    === Public Attributes ===
+    count: The number of values added.
+    mean: The mean of the values, or 0 if there are none.
+    low: The smallest value, or inf if there are none.
+    high: The largest value, or -inf if there are none.
+
+    === Private Attributes ===
+    _squares: The sum of the squared differences between each value and the
+        mean.
+
+    === Representation Invariants ===
+    count >= 0
+    _squares >= 0
+    """
+    count: int
+    mean: float
+    low: float
+    high: float
+    _squares: float
+
+    def __init__(self) -> None:
+        """
+        Initialize RunningStats with no values.
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.low = math.inf
+        self.high = -math.inf
+        self._squares = 0.0
+
+    def add(self, value: float) -> None:
+        """
+        Add <value> to the stream.
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._squares += delta * (value - self.mean)
+        self.low = min(self.low, value)
+        self.high = max(self.high, value)
+
+    def variance(self) -> float:
+        """
+        Return the sample variance of the values, or 0 if there are fewer
+        than two.
+        """
+        if self.count < 2:
+            return 0.0
+        return self._squares / (self.count - 1)
+
+    def stddev(self) -> float:
+        """
+        Return the sample standard deviation of the values, or 0 if there are
+        fewer than two.
+        """
+        return math.sqrt(self.variance())
+
+    def state(self) -> Dict:
+        """
+        Return everything needed to rebuild these RunningStats with
+        from_state(), e.g. after saving them as JSON.
+        """
+        return {"count": self.count, "mean": self.mean, "low": self.low,
+                "high": self.high, "squares": self._squares}
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "RunningStats":
+        """
+        Return the RunningStats whose state() was <state>.
+        """
+        stats = cls()
+        stats.count = state["count"]
+        stats.mean = state["mean"]
+        stats.low = state["low"]
+        stats.high = state["high"]
+        stats._squares = state["squares"]
+        return stats
+
+
+class QuantileSketch:
+    """
+    An estimate of one quantile (e.g. the median) of a stream of values, kept
+    in fixed memory with the P-squared algorithm of Jain and Chlamtac: five
+    markers track the minimum, the quantile, the maximum and the points half
+    way between them, and are nudged along a parabola as values arrive, so no
+    value is ever stored or scanned again. The estimate is exact for up to
+    five values.
+    === Public Attributes ===
+    quantile: The quantile estimated, between 0 and 1 (0.5 for the median).
+    count: The number of values added.
+
+    === Private Attributes ===
+    _heights: The value at each marker, in increasing order (only the first
+        count while count < 5).
+    _positions: The position of each marker among the values seen so far,
+        counting from 1.
+    _desired: Where each marker should be.
+    _increments: How far each desired position moves per value added.
+
+    === Representation Invariants ===
+    0 < quantile < 1
+    count >= 0
+    len(_heights) == min(count, 5)
+    """
+    quantile: float
+    count: int
+    _heights: List[float]
+    _positions: List[int]
+    _desired: List[float]
+    _increments: List[float]
+
+    def __init__(self, quantile: float = 0.5) -> None:
+        """
+        Initialize a QuantileSketch of the <quantile> quantile with no
+        values.
+        Precondition: 0 < quantile < 1
+        """
+        self.quantile = quantile
+        self.count = 0
+        self._heights = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * quantile, 1 + 4 * quantile,
+                         3 + 2 * quantile, 5]
+        self._increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, value: float) -> None:
+        """
+        Add <value> to the stream.
+        """
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+        # Find the cell the value falls in, stretching the ends if needed.
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+        for marker in range(cell + 1, 5):
+            self._positions[marker] += 1
+        for marker in range(5):
+            self._desired[marker] += self._increments[marker]
+        # Move each middle marker one position towards where it should be.
+        for marker in range(1, 4):
+            offset = self._desired[marker] - self._positions[marker]
+            if (offset >= 1 and self._positions[marker + 1] -
+                    self._positions[marker] > 1) or \
+                    (offset <= -1 and self._positions[marker - 1] -
+                     self._positions[marker] < -1):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(marker, step)
+                if not heights[marker - 1] < height < heights[marker + 1]:
+                    height = self._linear(marker, step)
+                heights[marker] = height
+                self._positions[marker] += step
+
+    def _parabolic(self, marker: int, step: int) -> float:
+        """
+        Return the height of <marker> moved by <step> positions, predicted
+        from a parabola through it and its neighbours.
+        """
+        heights, positions = self._heights, self._positions
+        below = positions[marker] - positions[marker - 1]
+        above = positions[marker + 1] - positions[marker]
+        span = positions[marker + 1] - positions[marker - 1]
+        return heights[marker] + step / span * (
+            (below + step) * (heights[marker + 1] - heights[marker]) / above +
+            (above - step) * (heights[marker] - heights[marker - 1]) / below)
+
+    def _linear(self, marker: int, step: int) -> float:
+        """
+        Return the height of <marker> moved by <step> positions, predicted
+        from a straight line to the neighbour it moves towards.
+        """
+        heights, positions = self._heights, self._positions
+        return heights[marker] + step * \
+            (heights[marker + step] - heights[marker]) / \
+            (positions[marker + step] - positions[marker])
+
+    def value(self) -> float:
+        """
+        Return the estimated quantile of the values.
+        Precondition: count > 0
+        """
+        if self.count > 5:
+            return self._heights[2]
+        # Few enough values to have kept them all, so take the exact one
+        # (interpolating between the two nearest).
+        heights = self._heights
+        rank = self.quantile * (len(heights) - 1)
+        lower = int(rank)
+        if lower + 1 >= len(heights):
+            return heights[lower]
+        return heights[lower] + (rank - lower) * \
+            (heights[lower + 1] - heights[lower])
+
+    def state(self) -> Dict:
+        """
+        Return everything needed to rebuild this QuantileSketch with
+        from_state(), e.g. after saving it as JSON.
+        """
+        return {"quantile": self.quantile, "count": self.count,
+                "heights": list(self._heights),
+                "positions": list(self._positions),
+                "desired": list(self._desired)}
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "QuantileSketch":
+        """
+        Return the QuantileSketch whose state() was <state>.
+        """
+        sketch = cls(state["quantile"])
+        sketch.count = state["count"]
+        sketch._heights = list(state["heights"])
+        sketch._positions = list(state["positions"])
+        sketch._desired = list(state["desired"])
+        return sketch
@@ -0,0 +1,267 @@
+"""
+    File name: Profiler.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+import functools
+import json
+import math
+import os
+import threading
+import time
+from array import array
+from typing import Callable, Dict, List, Tuple
+
+# The environment variable that turns profiling on when it names the file
+# the trace is written to (the same as passing --profile FILE to main.py).
+PROFILE_ENV = "BENCHMARK_GAME_PROFILE"
+
+# The name frames are recorded under.
+FRAME = "frame"
+
+Sample = Tuple[str, float, float, int]
+
+
+class Profiler:
+    """
+    Times each phase of every frame (drawing, text rendering, presenting,
+    waiting for events, event handlers...) and keeps the most recent samples
+    in a fixed-size ring buffer, so profiling a kiosk for hours uses no more
+    memory than profiling it for a minute.
+    Phases are timed by wrapping the functions that run them with timed(),
+    so nothing is timed (and nothing costs anything) unless a Profiler is
+    given to the Screen. Phases nest: a sample covers everything its function
+    called, including other phases. A phase run by a coroutine function lasts
+    until the coroutine finishes, including the time spent awaiting.
+    === Public Attributes ===
+    capacity: The number of samples kept.
+    frame_budget: The longest time (in seconds) a frame's work can take
+        without the frame being dropped.
+    recorded: The number of samples recorded, including those since
+        overwritten.
+    frames: The number of frames recorded.
+    dropped: The number of frames whose work (everything but waiting for
+        events) took longer than frame_budget.
+
+    === Private Attributes ===
+    _names: The name of each sample in the ring buffer.
+    _starts: The time.perf_counter() reading when each sample started.
+    _durations: How long (in seconds) each sample took.
+    _frame_numbers: The frame each sample was recorded in.
+    _next: Where in the ring buffer the next sample goes.
+    _waited: How long (in seconds) the current frame spent waiting.
+    _origin: The time.perf_counter() reading traces are timed from.
+
+    === Representation Invariants ===
+    capacity > 0
+    frame_budget > 0
+    0 <= _next < capacity
+    0 <= dropped <= frames
+    """
+    capacity: int
+    frame_budget: float
+    recorded: int
+    frames: int
+    dropped: int
+    _names: List[str]
+    _starts: array
+    _durations: array
+    _frame_numbers: array
+    _next: int
+    _waited: float
+    _origin: float
+
+    def __init__(self, capacity: int = 100000,
+                 frame_budget: float = 1 / 60) -> None:
+        """
+        Initialize a Profiler keeping the last <capacity> samples, which
+        counts frames taking longer than <frame_budget> seconds as dropped.
+        Preconditions:
+            capacity > 0
+            frame_budget > 0
+        """
+        self.capacity = capacity
+        self.frame_budget = frame_budget
+        self.recorded = 0
+        self.frames = 0
+        self.dropped = 0
+        self._names = [""] * capacity
+        self._starts = array('d', bytes(8 * capacity))
+        self._durations = array('d', bytes(8 * capacity))
+        self._frame_numbers = array('q', bytes(8 * capacity))
+        self._next = 0
+        self._waited = 0.0
+        self._origin = time.perf_counter()
+
+    def record(self, name: str, start: float, duration: float) -> None:
+        """
+        Record a sample of the phase <name>, which started at
+        time.perf_counter() reading <start> and took <duration> seconds,
+        overwriting the oldest sample if the ring buffer is full.
+        """
+        index = self._next
+        self._names[index] = name
+        self._starts[index] = start
+        self._durations[index] = duration
+        self._frame_numbers[index] = self.frames
+        self._next = index + 1 if index + 1 < self.capacity else 0
+        self.recorded += 1
+
+    def timed(self, name: str, function: Callable,
+              waiting: bool = False) -> Callable:
+        """
+        Return <function> (a function or coroutine function) wrapped so each
+        call is recorded as a sample of the phase <name>. The time spent in
+        it does not count towards the frame's work if <waiting>.
+        """
+        clock = time.perf_counter
+
+        def finish(start: float) -> None:
+            duration = clock() - start
+            if waiting:
+                self._waited += duration
+            self.record(name, start, duration)
+
+        if _is_coroutine_function(function):
+            @functools.wraps(function)
+            async def timed_coroutine(*args, **kwargs):
+                start = clock()
+                try:
+                    return await function(*args, **kwargs)
+                finally:
+                    finish(start)
+            return timed_coroutine
+
+        @functools.wraps(function)
+        def timed_function(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                finish(start)
+        return timed_function
+
+    def frame(self, function: Callable) -> Callable:
+        """
+        Return <function>, which runs one frame (or is a coroutine function
+        whose coroutines do), wrapped so each call is recorded as a frame and
+        checked against frame_budget.
+        """
+        clock = time.perf_counter
+
+        def finish(start: float) -> None:
+            duration = clock() - start
+            if duration - self._waited > self.frame_budget:
+                self.dropped += 1
+            self.record(FRAME, start, duration)
+            self.frames += 1
+
+        if _is_coroutine_function(function):
+            @functools.wraps(function)
+            async def timed_frame_coroutine(*args, **kwargs):
+                self._waited = 0.0
+                start = clock()
+                try:
+                    return await function(*args, **kwargs)
+                finally:
+                    finish(start)
+            return timed_frame_coroutine
+
+        @functools.wraps(function)
+        def timed_frame(*args, **kwargs):
+            self._waited = 0.0
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                finish(start)
+        return timed_frame
+
+    def samples(self) -> List[Sample]:
+        """
+        Return the samples in the ring buffer as (name, start, duration,
+        frame) tuples, oldest first.
+        """
+        count = min(self.recorded, self.capacity)
+        first = self._next - count
+        result = []
+        for offset in range(count):
+            index = (first + offset) % self.capacity
+            result.append((self._names[index], self._starts[index],
+                           self._durations[index],
+                           self._frame_numbers[index]))
+        return result
+
+    def summary(self) -> Dict:
+        """
+        Return the count, median (p50), 99th percentile (p99) and longest
+        duration of each phase in the ring buffer (in milliseconds), along
+        with the number of frames recorded and dropped.
+        """
+        durations = {}
+        for name, _, duration, _ in self.samples():
+            durations.setdefault(name, []).append(duration)
+        phases = {}
+        for name in sorted(durations):
+            samples = sorted(durations[name])
+            phases[name] = {
+                "count": len(samples),
+                "p50_ms": _nearest_rank(samples, 50) * 1000,
+                "p99_ms": _nearest_rank(samples, 99) * 1000,
+                "max_ms": samples[-1] * 1000,
+                "total_ms": math.fsum(samples) * 1000}
+        return {"frames": self.frames,
+                "dropped_frames": self.dropped,
+                "frame_budget_ms": self.frame_budget * 1000,
+                "samples_recorded": self.recorded,
+                "samples_kept": min(self.recorded, self.capacity),
+                "phases": phases}
+
+    def chrome_trace(self) -> Dict:
+        """
+        Return the samples in the ring buffer in Chrome's trace event format,
+        which chrome://tracing and Perfetto can open.
+        """
+        pid = os.getpid()
+        tid = threading.get_ident()
+        events = []
+        for name, start, duration, frame in self.samples():
+            events.append({"name": name,
+                           "cat": FRAME if name == FRAME else "phase",
+                           "ph": "X",
+                           "ts": (start - self._origin) * 1e6,
+                           "dur": duration * 1e6,
+                           "pid": pid,
+                           "tid": tid,
+                           "args": {"frame": frame}})
+        return {"traceEvents": events,
+                "displayTimeUnit": "ms",
+                "otherData": self.summary()}
+
+    def dump(self, path: str) -> None:
+        """
+        Write the samples in the ring buffer to <path> as a Chrome trace,
+        with the summary included as its metadata.
+        """
+        with open(path, "w") as trace:
+            json.dump(self.chrome_trace(), trace)
+
+
+def _is_coroutine_function(function: Callable) -> bool:
+    """
+    Return whether <function> is a coroutine function.
+    """
+    # Imported here so the game only pays for importing inspect when it is
+    # profiled.
+    import inspect
+    return inspect.iscoroutinefunction(function)
+
+
+def _nearest_rank(samples: List[float], percent: float) -> float:
+    """
+    Return the <percent>th percentile of the sorted <samples>, using the
+    nearest-rank method.
+    Precondition: len(samples) > 0
+    """
+    rank = max(1, math.ceil(percent / 100 * len(samples)))
+    return samples[rank - 1]
@@ -4,6 +4,21 @@
     Python Version: 3.9
 """
 import random
+from typing import Optional
+from OnlineStats import RunningStats, QuantileSketch
+
+# The supported ways of drawing a wait time.
+WAIT_DISTRIBUTIONS = ("uniform", "exponential")
+
+# OUTLIER LIMITS: reactions faster than MIN_REACTION (in seconds) were
+# guessed rather than seen, and slower than MAX_REACTION were lapses of
+# attention. Once a session has counted OUTLIER_WARMUP trials, reactions more
+# than OUTLIER_SDS standard deviations from its mean are rejected too. The
+# warm-up must be shorter than a session for the rest of it to be checked.
+MIN_REACTION = 0.1
+MAX_REACTION = 1.5
+OUTLIER_WARMUP = 3
+OUTLIER_SDS = 3
 
 
 class ReactionGame:
@@ -13,26 +28,74 @@ class ReactionGame:
     start: Represents if the game has started or not, specifically, when the
         user first clicks to launch the game.
     wait_time: Represents the interval of time (in seconds) between the
-        "wait" time and "go" time.
+        "wait" time and "go" time. It is drawn from a continuous distribution,
+        so it is not limited to whole seconds.
+    min_wait: The shortest possible wait_time (in seconds).
+    max_wait: The longest possible wait_time (in seconds).
+    wait_distribution: How wait_time is drawn between min_wait and max_wait,
+        either "uniform", or "exponential" for a non-aging wait (the chance
+        of "go" coming in the next instant does not grow the longer the user
+        has waited, so it can not be anticipated).
+    mean_extra_wait: For the "exponential" distribution, the average time (in
+        seconds) added to min_wait.
     failed: Represents whether or not the user clicked too early, if they did
         the user failed this attempt.
     reaction_speed: Represents the interval of time (in seconds) between the
-        "go" time and the "click".
+        "go" time and the "click", measured with a monotonic clock.
+    measurement_error: Represents how much reaction_speed may overestimate
+        the real reaction time (in seconds), because the click can only be
+        timestamped when the event queue is sampled.
+    trials: The number of reaction times a session counts.
+    stats: The mean and standard deviation of the reaction times counted
+        this session, updated as each one is recorded.
+    median: The median of the reaction times counted this session.
+    rejected: The number of outliers recorded this session, which are not
+        counted.
+    counted: Whether the last reaction time recorded was counted.
+    rng: The random number generator wait times are drawn with, or None to
+        use the random module.
 
     === Representation Invariants ===
-    wait_time > 1
+    0 < min_wait <= wait_time <= max_wait
+    wait_distribution in WAIT_DISTRIBUTIONS
+    mean_extra_wait > 0
     reaction_speed > 0
+    measurement_error >= 0
+    trials >= 1
+    rejected >= 0
     """
     start: bool = False
-    wait_time: int
+    wait_time: float
+    min_wait: float = 1.0
+    max_wait: float = 5.0
+    wait_distribution: str = "uniform"
+    mean_extra_wait: float = 1.5
     failed: bool = False
     reaction_speed: float
+    measurement_error: float
+    trials: int = 5
+    stats: RunningStats
+    median: QuantileSketch
+    rejected: int = 0
+    counted: bool = False
+    rng: Optional[random.Random] = None
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        """
+        Initialize ReactionGame, drawing wait times with <rng> (the random
+        module by default).
+        """
+        self.rng = rng
+        self.new_session()
 
-    def __init__(self) -> None:
+    def new_session(self) -> None:
         """
-        Initialize ReactionGame
+        Start a new session of trials, forgetting the last one's statistics.
         """
-        pass
+        self.stats = RunningStats()
+        self.median = QuantileSketch(0.5)
+        self.rejected = 0
+        self.counted = False
 
     def setup(self) -> None:
         """
@@ -44,6 +107,84 @@ class ReactionGame:
 
     def generate_wait_time(self) -> None:
         """
-        Generate a random wait time.
+        Generate a random wait time from wait_distribution.
+        """
+        chooser = self.rng if self.rng is not None else random
+        if self.wait_distribution == "exponential":
+            wait = self.min_wait + \
+                chooser.expovariate(1 / self.mean_extra_wait)
+            # Draw again rather than clamp, so no wait piles up at max_wait.
+            while wait > self.max_wait:
+                wait = self.min_wait + \
+                    chooser.expovariate(1 / self.mean_extra_wait)
+            self.wait_time = wait
+        else:
+            self.wait_time = chooser.uniform(self.min_wait, self.max_wait)
+
+    def record(self, reaction_speed: float, measurement_error: float) -> None:
+        """
+        Record a reaction time of <reaction_speed> seconds, which may be up to
+        <measurement_error> seconds longer than the real one, and count it
+        towards the session unless it is an outlier.
+        """
+        self.reaction_speed = reaction_speed
+        self.measurement_error = measurement_error
+        self.start = False
+        self.counted = not self.is_outlier(reaction_speed)
+        if self.counted:
+            self.stats.add(reaction_speed)
+            self.median.add(reaction_speed)
+        else:
+            self.rejected += 1
+
+    def is_outlier(self, reaction_speed: float) -> bool:
+        """
+        Return whether a reaction time of <reaction_speed> seconds is too
+        fast or too slow to count towards the session.
+        """
+        if not MIN_REACTION <= reaction_speed <= MAX_REACTION:
+            return True
+        return self.stats.count >= OUTLIER_WARMUP and \
+            abs(reaction_speed - self.stats.mean) > \
+            OUTLIER_SDS * self.stats.stddev()
+
+    def session_done(self) -> bool:
+        """
+        Return whether the session has counted all of its trials.
+        """
+        return self.stats.count >= self.trials
+
+    def result_text(self) -> str:
+        """
+        Return the last reaction time and its error bound, in milliseconds.
+        """
+        text = str(int(self.reaction_speed * 1000)) + " ms (\u00b1" + \
+            format(self.measurement_error * 1000, ".1f") + " ms)"
+        if not self.counted:
+            text += ", not counted"
+        return text
+
+    def session_text(self) -> str:
+        """
+        Return the session's average reaction time, in milliseconds.
+        Precondition: stats.count > 0
+        """
+        return "Average: " + str(int(self.stats.mean * 1000)) + " ms"
+
+    def stats_text(self) -> str:
+        """
+        Return the session's progress and statistics so far, in milliseconds.
         """
-        self.wait_time = random.randint(1, 5)
+        if self.session_done():
+            text = str(self.trials) + " trials"
+        else:
+            text = "Trial " + str(self.stats.count + 1) + " of " + \
+                str(self.trials)
+        if self.stats.count > 0:
+            text += "   mean " + str(int(self.stats.mean * 1000)) + \
+                " ms   median " + str(int(self.median.value() * 1000)) + \
+                " ms   sd " + format(self.stats.stddev() * 1000, ".1f") + \
+                " ms"
+        if self.rejected > 0:
+            text += "   " + str(self.rejected) + " rejected"
+        return text
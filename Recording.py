@@ -0,0 +1,583 @@
+"""
+    File name: Recording.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+
+    Replays a recorded play session (record one with
+    python main.py --record FILE) and prints a per-frame timing report as
+    JSON, so different versions of the game can be compared on exactly the
+    same session.
+
+    Usage: python Recording.py FILE [--realtime] [--window] [--asyncio]
+                                    [--profile FILE] [--output FILE]
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+import zlib
+from concurrent.futures import Future, wait
+from typing import Dict, Iterator, List, Optional, Tuple
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from Startup import import_pygame
+import_pygame()
+import pygame
+from FontManager import FONTS
+from FrameScheduler import FrameScheduler, ACTIVE
+from Profiler import Profiler
+from ResultsLog import ResultsLog
+from Screen import Screen
+from TextCache import TEXT_CACHE
+
+# What the first line of a recording says it is, and the version of the
+# format it is written in.
+FORMAT = "benchmark-game-recording"
+VERSION = 1
+
+# The kinds of input a frame can read, as tagged in a recording.
+TIME = "t"
+POINTER = "p"
+DONE = "d"
+
+# A recorded frame: what the game read during it (in order), its events,
+# when they were handed out, how long its work took and the checksum of the
+# game's state at its end.
+Frame = Dict
+
+
+class SessionRecorder(FrameScheduler):
+    """
+    A FrameScheduler that paces the game as usual while writing everything
+    the game reads from the outside world to a recording, so the session can
+    be replayed exactly: each frame's events (with their arrival times),
+    every reading of the clock and the mouse, and when background work
+    finished. The games' random number generators are seeded from seed,
+    which the recording starts with.
+    A recording is a gzip-compressed file of JSON lines: a header, then one
+    line per frame. Each frame also records how long its work took and a
+    checksum of the game's state at its end, which replays are compared
+    with.
+    === Public Attributes ===
+    path: The path of the recording.
+    seed: What the games' random number generators are seeded from (see
+        Screen.game_rng).
+    screen: The screen being recorded, set once it has been created.
+    frames: The number of frames recorded.
+
+    === Private Attributes ===
+    _file: The recording, open for writing, or None once closed.
+    _inputs: What the game has read since the last frame was recorded.
+    _frame_end: The time.perf_counter() reading when the last frame's
+        events were handed out, or None before the first frame.
+    """
+    path: str
+    seed: int
+    screen: Optional[Screen]
+    frames: int
+    _file: Optional[gzip.GzipFile]
+    _inputs: List[list]
+    _frame_end: Optional[float]
+
+    def __init__(self, path: str, seed: Optional[int] = None) -> None:
+        """
+        Start recording to <path> (replacing it if it exists) a session whose
+        games are seeded from <seed> (a random one if it is None).
+        """
+        FrameScheduler.__init__(self)
+        self.path = path
+        self.seed = seed if seed is not None else \
+            int.from_bytes(os.urandom(8), 'little')
+        self.screen = None
+        self.frames = 0
+        self._inputs = []
+        self._frame_end = None
+        self._file = gzip.open(path, 'wt', encoding='utf-8')
+        self._write({"format": FORMAT, "version": VERSION,
+                     "seed": self.seed, "pygame": pygame.version.ver,
+                     "recorded_at": time.time()})
+
+    def now(self) -> float:
+        """
+        Return the current time, recording it.
+        """
+        reading = FrameScheduler.now(self)
+        self._inputs.append([TIME, reading])
+        return reading
+
+    def pointer(self) -> Tuple[Tuple[int, int], bool]:
+        """
+        Return where the mouse is and whether its left button is held down,
+        recording them.
+        """
+        position, down = FrameScheduler.pointer(self)
+        self._inputs.append([POINTER, position[0], position[1], down])
+        return position, down
+
+    def is_done(self, future: Optional[Future]) -> bool:
+        """
+        Return whether the background work behind <future> has finished,
+        recording the answer.
+        """
+        done = FrameScheduler.is_done(self, future)
+        self._inputs.append([DONE, done])
+        return done
+
+    def events(self, mode: str = ACTIVE) -> List[pygame.event.Event]:
+        """
+        End the current frame according to <mode> and return its events,
+        recording the frame.
+        """
+        work, state = self._end_frame()
+        events = FrameScheduler.events(self, mode)
+        self._record(events, work, state)
+        return events
+
+    async def wait_events(self, mode: str = ACTIVE) \
+            -> List[pygame.event.Event]:
+        """
+        The same as events(), but awaits the frame's events.
+        """
+        work, state = self._end_frame()
+        events = await FrameScheduler.wait_events(self, mode)
+        self._record(events, work, state)
+        return events
+
+    def _end_frame(self) -> Tuple[Optional[float], Optional[int]]:
+        """
+        Return how long (in seconds) the frame's work took, if there was a
+        frame before it, and the checksum of the game's state at its end.
+        """
+        now = time.perf_counter()
+        work = None if self._frame_end is None else now - self._frame_end
+        state = None if self.screen is None else state_checksum(self.screen)
+        return work, state
+
+    def _record(self, events: List[pygame.event.Event],
+                work: Optional[float], state: Optional[int]) -> None:
+        """
+        Write the frame that just ended, with <events>, to the recording.
+        """
+        self._frame_end = time.perf_counter()
+        self._write({"inputs": self._inputs,
+                     "events": [encode_event(event) for event in events],
+                     "at": self.last_poll, "work": work, "state": state})
+        self._inputs = []
+        self.frames += 1
+
+    def _write(self, line: Dict) -> None:
+        """
+        Append <line> to the recording.
+        """
+        self._file.write(json.dumps(line, separators=(',', ':')) + '\n')
+
+    def close(self) -> None:
+        """
+        Write out what the game read after the last frame and close the
+        recording.
+        """
+        if self._file is not None:
+            self._write({"inputs": self._inputs, "events": None})
+            self._inputs = []
+            self._file.close()
+            self._file = None
+
+
+class SessionReplayer(FrameScheduler):
+    """
+    A FrameScheduler that plays a recording back into the Screen it paces.
+    Instead of the real ones, the game is handed the recorded events, clock
+    and mouse readings, and background work finishing when it did, and its
+    games are seeded as they were, so the session plays out exactly as it was
+    recorded. Frames are handed out as fast as the game can draw them, or at
+    the pace they were recorded at if realtime.
+    If the game reads something the recording does not have at that point
+    (e.g. the game's code changed), it is handed the last value of that kind
+    instead, and the mismatch is counted. Each frame's game state is checked
+    against the recording's checksum.
+    === Public Attributes ===
+    path: The path of the recording.
+    seed: What the recorded games' random number generators were seeded
+        from.
+    realtime: Whether frames are handed out at the pace they were recorded
+        at.
+    screen: The screen being driven, set once it has been created.
+    frames: The number of frames replayed.
+    frame_times: The scene, how long (in seconds) the frame's work took and
+        how long it took when recorded, for each frame replayed after the
+        first.
+    mismatches: The number of times the game read something the recording
+        did not have.
+    first_mismatch: The frame of the first mismatch, or None.
+    diverged_at: The first frame whose game state did not match the
+        recording's, or None.
+
+    === Private Attributes ===
+    _lines: The recording's lines not read yet.
+    _frame: The recorded frame being played, or None once the recording has
+        run out.
+    _next: The index of the next of _frame's inputs to hand out.
+    _last: The last input of each kind handed out.
+    _origin: The time.perf_counter() reading the replay's first frame was
+        handed out at, or None before then.
+    _recorded_origin: When the recording's first frame was handed out.
+    _frame_end: The time.perf_counter() reading when the last frame's
+        events were handed out, or None before the first frame.
+    """
+    path: str
+    seed: int
+    realtime: bool
+    screen: Optional[Screen]
+    frames: int
+    frame_times: List[Tuple[str, float, Optional[float]]]
+    mismatches: int
+    first_mismatch: Optional[int]
+    diverged_at: Optional[int]
+    _lines: Iterator[Dict]
+    _frame: Optional[Frame]
+    _next: int
+    _last: Dict[str, list]
+    _origin: Optional[float]
+    _recorded_origin: Optional[float]
+    _frame_end: Optional[float]
+
+    def __init__(self, path: str, realtime: bool = False) -> None:
+        """
+        Open the recording at <path> to be replayed, at the pace it was
+        recorded at if <realtime>.
+        Raises ValueError if <path> is not a recording.
+        """
+        FrameScheduler.__init__(self, active_fps=0, precise_fps=0)
+        self.path = path
+        self.realtime = realtime
+        self.screen = None
+        self.frames = 0
+        self.frame_times = []
+        self.mismatches = 0
+        self.first_mismatch = None
+        self.diverged_at = None
+        self._lines = read_recording(path)
+        header = next(self._lines, None)
+        if header is None or header.get("format") != FORMAT or \
+                header.get("version") != VERSION:
+            raise ValueError(path + " is not a recording")
+        self.seed = header["seed"]
+        self._frame = next(self._lines, None)
+        self._next = 0
+        self._last = {TIME: [TIME, 0.0], POINTER: [POINTER, 0, 0, False],
+                      DONE: [DONE, False]}
+        self._origin = None
+        self._recorded_origin = None
+        self._frame_end = None
+
+    def now(self) -> float:
+        """
+        Return the recorded time.
+        """
+        return self._read(TIME)[1]
+
+    def pointer(self) -> Tuple[Tuple[int, int], bool]:
+        """
+        Return the recorded mouse position and left button state.
+        """
+        _, x, y, down = self._read(POINTER)
+        return (x, y), down
+
+    def is_done(self, future: Optional[Future]) -> bool:
+        """
+        Return whether the background work behind <future> had finished at
+        this point of the recording, waiting for it to finish now if it had.
+        """
+        done = self._read(DONE)[1] and future is not None
+        if done:
+            wait([future])
+        return done
+
+    def _read(self, kind: str) -> list:
+        """
+        Return the next recorded input, which should be of <kind>, or the
+        last one of that kind if it is not.
+        """
+        inputs = [] if self._frame is None else self._frame["inputs"]
+        if self._next < len(inputs) and inputs[self._next][0] == kind:
+            self._last[kind] = inputs[self._next]
+            self._next += 1
+        else:
+            self._mismatch()
+        return self._last[kind]
+
+    def _mismatch(self) -> None:
+        """
+        Count a mismatch between what the game read and the recording.
+        """
+        self.mismatches += 1
+        if self.first_mismatch is None:
+            self.first_mismatch = self.frames
+
+    def events(self, mode: str = ACTIVE) -> List[pygame.event.Event]:
+        """
+        Return the recorded frame's events, once it is due if realtime.
+        """
+        self._end_frame()
+        if self.realtime and self._frame is not None:
+            time.sleep(max(0.0, self._due() - time.perf_counter()))
+        return self._next_frame()
+
+    async def wait_events(self, mode: str = ACTIVE) \
+            -> List[pygame.event.Event]:
+        """
+        The same as events(), but awaits the recorded frame being due.
+        """
+        self._end_frame()
+        if self.realtime and self._frame is not None:
+            await asyncio.sleep(max(0.0, self._due() - time.perf_counter()))
+        else:
+            await asyncio.sleep(0)
+        return self._next_frame()
+
+    def _due(self) -> float:
+        """
+        Return the time.perf_counter() reading the recorded frame is due to
+        be handed out at.
+        """
+        if self._origin is None:
+            return time.perf_counter()
+        return self._origin + self._frame["at"] - self._recorded_origin
+
+    def _end_frame(self) -> None:
+        """
+        Time the frame that just ended and check its game state against the
+        recording's.
+        """
+        now = time.perf_counter()
+        frame = self._frame
+        if frame is None or frame["events"] is None:
+            # The game went on past the end of the recording.
+            self._mismatch()
+            return
+        if self._frame_end is not None:
+            self.frame_times.append((self.screen.current_scene,
+                                     now - self._frame_end, frame["work"]))
+        if self._next < len(frame["inputs"]):
+            self._mismatch()
+        if self.diverged_at is None and frame.get("state") is not None and \
+                frame["state"] != state_checksum(self.screen):
+            self.diverged_at = self.frames
+
+    def _next_frame(self) -> List[pygame.event.Event]:
+        """
+        Hand out the recorded frame's events and move on to the next frame.
+        Once the recording has run out (or the window is closed), the game
+        is told to quit.
+        """
+        quit_event = pygame.event.Event(pygame.QUIT)
+        real = pygame.event.get()
+        self._stamp(real)
+        self._frame_end = time.perf_counter()
+        frame = self._frame
+        if frame is None or frame["events"] is None or \
+                any(event.type == pygame.QUIT for event in real):
+            return [quit_event]
+        if self._origin is None:
+            self._origin = self._frame_end
+            self._recorded_origin = frame["at"]
+        self.frames += 1
+        self._frame = next(self._lines, None)
+        self._next = 0
+        return [decode_event(event) for event in frame["events"]]
+
+    def report(self) -> Dict:
+        """
+        Return how the replay went and how long each frame took, compared
+        with the recording, as a JSON-serializable dictionary.
+        """
+        scenes = {}
+        for scene, work, recorded in self.frame_times:
+            replayed, original = scenes.setdefault(scene, ([], []))
+            replayed.append(work)
+            if recorded is not None:
+                original.append(recorded)
+        return {"recording": self.path,
+                "seed": self.seed,
+                "realtime": self.realtime,
+                "frames": self.frames,
+                "matches": self.mismatches == 0 and
+                self.diverged_at is None,
+                "mismatches": self.mismatches,
+                "first_mismatch": self.first_mismatch,
+                "diverged_at": self.diverged_at,
+                "scenes": {scene: {"work": summarize(replayed),
+                                   "recorded_work": summarize(original)}
+                           for scene, (replayed, original) in
+                           scenes.items()},
+                "frame_times": [
+                    {"frame": frame, "scene": scene,
+                     "work_ms": work * 1000,
+                     "recorded_work_ms": None if recorded is None else
+                     recorded * 1000}
+                    for frame, (scene, work, recorded) in
+                    enumerate(self.frame_times, 1)]}
+
+
+def encode_event(event: pygame.event.Event) -> list:
+    """
+    Return <event> as it is written to a recording. Attributes that can not
+    be written (e.g. window objects) are left out.
+    """
+    attributes = {}
+    for name, value in event.dict.items():
+        if isinstance(value, tuple):
+            value = list(value)
+        if value is None or isinstance(value, (bool, int, float, str, list)):
+            attributes[name] = value
+    return [event.type, attributes]
+
+
+def decode_event(encoded: list) -> pygame.event.Event:
+    """
+    Return the event <encoded> was written from.
+    """
+    kind, attributes = encoded
+    return pygame.event.Event(kind, {
+        name: tuple(value) if isinstance(value, list) else value
+        for name, value in attributes.items()})
+
+
+def read_recording(path: str) -> Iterator[Dict]:
+    """
+    Yield each line of the recording at <path>. A recording cut short (e.g.
+    because the game was killed) ends at its last whole line.
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as recording:
+        try:
+            for line in recording:
+                yield json.loads(line)
+        except (EOFError, zlib.error, ValueError):
+            return
+
+
+def game_state(screen: Screen) -> Tuple:
+    """
+    Return the parts of <screen>'s state that a session's input decides:
+    the scene, and the progress, scores and challenges of every game.
+    """
+    react, numbers = screen.react, screen.numbers
+    words, aim = screen.words, screen.aim
+    return (screen.current_scene, screen.game_running,
+            screen.results.logged,
+            react.start, react.failed, getattr(react, 'wait_time', None),
+            react.stats.count, react.stats.mean, react.rejected,
+            numbers.begin, numbers.points, getattr(numbers, 'curr_num', None),
+            words.endless, words.points, getattr(words, 'curr_word', None),
+            aim.begin, aim.misses, tuple(aim.hit_times),
+            tuple((target.x, target.y) for target in aim.targets))
+
+
+def state_checksum(screen: Screen) -> int:
+    """
+    Return a checksum of game_state(<screen>).
+    """
+    return zlib.crc32(repr(game_state(screen)).encode())
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Return the count, mean and percentiles of <samples> (in seconds) in
+    milliseconds.
+    """
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def percentile(percent: float) -> float:
+        rank = max(1, math.ceil(percent / 100 * len(ordered)))
+        return ordered[rank - 1] * 1000
+    return {"count": len(ordered),
+            "mean_ms": math.fsum(ordered) / len(ordered) * 1000,
+            "p50_ms": percentile(50),
+            "p90_ms": percentile(90),
+            "p99_ms": percentile(99),
+            "max_ms": ordered[-1] * 1000}
+
+
+def replay(path: str, realtime: bool = False, window: bool = False,
+           use_asyncio: bool = False, profile: Optional[str] = None) -> Dict:
+    """
+    Replay the recording at <path> (at the pace it was recorded at if
+    <realtime>, in a window if <window>, on an asyncio event loop if
+    <use_asyncio>) and return the report. If <profile> names a file, every
+    frame is profiled, the Chrome trace is written to it and the report
+    includes the profile's summary.
+    Raises ValueError if <path> is not a recording.
+    """
+    if not window:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+    replayer = SessionReplayer(path, realtime)
+    profiler = Profiler() if profile else None
+    with tempfile.TemporaryDirectory() as directory:
+        # Keep the replayed trials out of the real results log.
+        results = ResultsLog(os.path.join(directory, "results.log"))
+        screen = Screen(replayer, results, profiler, seed=replayer.seed)
+        replayer.screen = screen
+        start = time.perf_counter()
+        if use_asyncio:
+            asyncio.run(screen.run_game_async())
+        else:
+            screen.run_game()
+        report = replayer.report()
+        report["asyncio"] = use_asyncio
+        report["total_s"] = time.perf_counter() - start
+    if profiler is not None:
+        profiler.dump(profile)
+        report["profile"] = profiler.summary()
+    pygame.quit()
+    # Let the next replay in this process start from fresh fonts and text, as
+    # the cached ones died with pygame.
+    FONTS.clear()
+    TEXT_CACHE.clear()
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Replay a recording from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Replay a recorded session and time every frame.")
+    parser.add_argument("recording",
+                        help="a recording made with main.py --record")
+    parser.add_argument("--realtime", action="store_true",
+                        help="replay at the pace the session was recorded "
+                             "at instead of as fast as possible")
+    parser.add_argument("--window", action="store_true",
+                        help="show the replay in a window")
+    parser.add_argument("--asyncio", action="store_true",
+                        help="run the game on an asyncio event loop")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="profile every frame and write a Chrome trace "
+                             "to FILE")
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args(argv)
+    try:
+        report = replay(args.recording, args.realtime, args.window,
+                        args.asyncio, args.profile)
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 2
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+    return 0 if report["matches"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
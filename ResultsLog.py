@@ -0,0 +1,329 @@
+"""
+    File name: ResultsLog.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+import atexit
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import BinaryIO, Iterator, NamedTuple, Optional, Union
+
+# The header of a results log: magic, format version and record size.
+HEADER = struct.Struct("<4sHH")
+MAGIC = b"RLOG"
+VERSION = 1
+
+# A record: game id, level, session id, timestamp (in seconds since the
+# epoch), value and the CRC-32 of everything before it (the record's body).
+RECORD = struct.Struct("<B3xIQddI")
+BODY = struct.Struct(RECORD.format[:-1])
+CHECKSUM = struct.Struct("<I")
+
+# The id each game is logged under, keyed by the name of its scene.
+GAME_IDS = {"reaction": 1, "number": 2, "verbal": 3, "aim": 4}
+
+
+class Result(NamedTuple):
+    """
+    One logged trial.
+    === Public Attributes ===
+    game: The id of the game played, from GAME_IDS.
+    level: The level the trial was played at (see ResultsLog).
+    session: The id of the session the trial was played in.
+    timestamp: When the trial was logged, in seconds since the epoch.
+    value: The trial's score, or its time in seconds.
+    """
+    game: int
+    level: int
+    session: int
+    timestamp: float
+    value: float
+
+
+class ResultsLog:
+    """
+    An append-only file of fixed-size binary records, one per trial played.
+    The games log:
+        reaction: value is the reaction time (in seconds), level is 0.
+        number: value is the score of a finished game, level is the number
+            of digits in the number that ended it.
+        verbal: value is the score of a finished game, level is 1 in endless
+            mode and 0 otherwise.
+        aim: value is the time (in seconds) a target took to hit, level is
+            which target of the game it was, counting from 1.
+    Logging a trial only packs it into a buffer in memory. A background thread
+    appends the buffer to the file every flush_interval seconds, so the frame
+    loop never waits on the disk, at the cost of losing the last
+    flush_interval seconds of trials if the game is killed.
+    Every record is written whole and carries a checksum, so when a log is
+    opened again, a record that was cut short or garbled by a crash is found
+    at the end of the file and cut off.
+    === Public Attributes ===
+    path: The path of the log file.
+    session: The id every trial logged by this ResultsLog is tagged with.
+    flush_interval: How often (in seconds) the buffer is written out.
+    max_buffer: The size (in bytes) at which the buffer is written out
+        without waiting for flush_interval.
+    logged: The number of trials logged by this ResultsLog.
+
+    === Private Attributes ===
+    _fd: The log file, opened for appending.
+    _buffer: The records logged but not written to the file yet.
+    _buffer_lock: Guards _buffer.
+    _write_lock: Makes sure buffers are written to the file in order.
+    _wake: Set to make the flusher write the buffer out early.
+    _closed: Set once the log has been closed.
+    _flusher: The thread writing the buffer out.
+
+    === Representation Invariants ===
+    flush_interval > 0
+    max_buffer > 0
+    len(_buffer) % RECORD.size == 0
+    """
+    path: str
+    session: int
+    flush_interval: float
+    max_buffer: int
+    logged: int
+    _fd: int
+    _buffer: bytearray
+    _buffer_lock: threading.Lock
+    _write_lock: threading.Lock
+    _wake: threading.Event
+    _closed: threading.Event
+    _flusher: threading.Thread
+
+    def __init__(self, path: str = 'results.log',
+                 flush_interval: float = 1.0,
+                 session: Optional[int] = None,
+                 max_buffer: int = 64 * 1024) -> None:
+        """
+        Open the results log at <path> (creating it if it does not exist) and
+        start writing it out every <flush_interval> seconds. Trials are
+        tagged with <session>, or with a random session id if it is None.
+        Raises ValueError if <path> is not a results log.
+        Preconditions:
+            flush_interval > 0
+            max_buffer > 0
+            session is None or 0 <= session < 2 ** 64
+        """
+        self.path = path
+        self.session = session if session is not None else \
+            int.from_bytes(os.urandom(8), 'little')
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.logged = 0
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_APPEND |
+                           getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            self._repair()
+        except BaseException:
+            os.close(self._fd)
+            raise
+        self._buffer = bytearray()
+        self._buffer_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop,
+                                         name="results-flusher", daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def _repair(self) -> None:
+        """
+        Write the header of a new log, or cut off any records at the end of an
+        existing log that were not written whole.
+        """
+        size = os.fstat(self._fd).st_size
+        if size < HEADER.size:
+            # Empty, or the game was killed while writing the header.
+            os.ftruncate(self._fd, 0)
+            self._write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+            return
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        magic, version, record_size = \
+            HEADER.unpack(os.read(self._fd, HEADER.size))
+        if magic != MAGIC or version != VERSION or \
+                record_size != RECORD.size:
+            raise ValueError(self.path + ' is not a results log')
+        end = HEADER.size + (size - HEADER.size) // RECORD.size * RECORD.size
+        while end > HEADER.size:
+            os.lseek(self._fd, end - RECORD.size, os.SEEK_SET)
+            if _is_intact(os.read(self._fd, RECORD.size)):
+                break
+            end -= RECORD.size
+        if end != size:
+            os.ftruncate(self._fd, end)
+
+    def record(self, game: str, value: float, level: int = 0,
+               timestamp: Optional[float] = None) -> None:
+        """
+        Log a trial of <game> (a key of GAME_IDS) with <value> at <level>,
+        at <timestamp> (in seconds since the epoch, now by default). This only
+        buffers the trial, so it is cheap enough to call during a frame.
+        Precondition: 0 <= level < 2 ** 32
+        """
+        body = BODY.pack(GAME_IDS[game], level, self.session,
+                         time.time() if timestamp is None else timestamp,
+                         value)
+        with self._buffer_lock:
+            self._buffer += body
+            self._buffer += CHECKSUM.pack(zlib.crc32(body))
+            self.logged += 1
+            full = len(self._buffer) >= self.max_buffer
+        if full:
+            self._wake.set()
+
+    def flush(self) -> None:
+        """
+        Write every buffered trial to the file.
+        """
+        with self._write_lock:
+            with self._buffer_lock:
+                data = bytes(self._buffer)
+                self._buffer.clear()
+            if data and self._fd >= 0:
+                self._write(data)
+
+    def _write(self, data: bytes) -> None:
+        """
+        Append all of <data> to the file.
+        """
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view):]
+
+    def _flush_loop(self) -> None:
+        """
+        Write the buffer out every flush_interval seconds (or as soon as it
+        is full) until the log is closed.
+        """
+        while not self._closed.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self) -> None:
+        """
+        Write out every buffered trial, make sure it has reached the disk and
+        close the file. Nothing can be logged afterwards.
+        """
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._wake.set()
+        self._flusher.join()
+        self.flush()
+        with self._write_lock:
+            os.fsync(self._fd)
+            os.close(self._fd)
+            self._fd = -1
+        atexit.unregister(self.close)
+
+
+def _is_intact(record: bytes) -> bool:
+    """
+    Return whether <record> is a whole record whose checksum matches.
+    """
+    return len(record) == RECORD.size and \
+        CHECKSUM.unpack_from(record, BODY.size)[0] == \
+        zlib.crc32(record[:BODY.size])
+
+
+class ResultsReader:
+    """
+    A read-only, memory-mapped view of the records in a results log, so logs
+    of millions of trials can be read without loading or parsing them.
+    Only whole records are read, so a log can be read while it is still
+    being written to.
+    === Public Attributes ===
+    path: The path of the log file.
+
+    === Private Attributes ===
+    _file: The open log file, or None if it is empty.
+    _data: The whole log, memory-mapped (or empty).
+    _count: The number of whole records in the log.
+
+    === Representation Invariants ===
+    _count >= 0
+    """
+    path: str
+    _file: Optional[BinaryIO]
+    _data: Union[mmap.mmap, bytes]
+    _count: int
+
+    def __init__(self, path: str = 'results.log') -> None:
+        """
+        Open the results log at <path> for reading.
+        Raises ValueError if <path> is not a results log.
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        if size < HEADER.size:
+            # A log that is still being created.
+            self._file.close()
+            self._file = None
+            self._data = b''
+            self._count = 0
+            return
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size = HEADER.unpack_from(self._data)
+        if magic != MAGIC or version != VERSION or \
+                record_size != RECORD.size:
+            self.close()
+            raise ValueError(path + ' is not a results log')
+        self._count = (size - HEADER.size) // RECORD.size
+
+    def __len__(self) -> int:
+        """
+        Return the number of records in the log.
+        """
+        return self._count
+
+    def __getitem__(self, index: int) -> Result:
+        """
+        Return the record at <index>.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('record index out of range')
+        return Result._make(BODY.unpack_from(
+            self._data, HEADER.size + index * RECORD.size))
+
+    def __iter__(self) -> Iterator[Result]:
+        """
+        Yield every intact record in the log, in the order they were logged.
+        """
+        return self.records()
+
+    def records(self, verify: bool = True) -> Iterator[Result]:
+        """
+        Yield the records in the log, in the order they were logged, skipping
+        any whose checksum does not match if <verify>.
+        """
+        end = HEADER.size + self._count * RECORD.size
+        for offset in range(HEADER.size, end, RECORD.size):
+            fields = RECORD.unpack_from(self._data, offset)
+            if verify and fields[-1] != \
+                    zlib.crc32(self._data[offset:offset + BODY.size]):
+                continue
+            yield Result._make(fields[:-1])
+
+    def close(self) -> None:
+        """
+        Release the memory-mapped log. The reader can not be used afterwards.
+        """
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b''
+        self._count = 0
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,127 @@
+"""
+    File name: Scene.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import pygame
+from Button import Button
+from SpatialGrid import SpatialGrid
+
+EventHandler = Callable[[pygame.event.Event], None]
+
+
+class Scene:
+    """
+    One scene of the game, described as tables instead of as a loop: how the
+    scene is set up, how a frame of it is drawn and paced, and which handler
+    each type of event (and which action each click on a button) is
+    dispatched to.
+    === Public Attributes ===
+    name: The name the scene is registered under.
+    build: Creates what only the scene needs (e.g. its buttons), the first
+        time it is switched to, so scenes that are never played cost nothing
+        at start up.
+    built: Whether build has been run.
+    enter: Sets the scene up every time it is switched to.
+    draw: Draws one frame of the scene.
+    presented: Called once a frame of the scene has been sent to the display.
+    mode: Returns the FrameScheduler mode the scene's next frame is paced in.
+    handlers: The handler of every event type the scene responds to.
+    buttons: The scene's buttons, in the order they are drawn.
+    grid: Finds which of the scene's buttons is under a point.
+    actions: The action run when one of the scene's buttons is clicked, keyed
+        by the button's id.
+    allowed: The event types let onto pygame's event queue while the scene
+        runs. Every other event type is dropped before it reaches the queue.
+
+    === Representation Invariants ===
+    Every key of actions is the id of a button in buttons.
+    Every button in buttons is in grid, and does not move once added.
+    Every key of handlers is in allowed.
+    """
+    name: str
+    build: Callable[[], None]
+    built: bool
+    enter: Callable[[], None]
+    draw: Callable[[], None]
+    presented: Callable[[], None]
+    mode: Callable[[], str]
+    handlers: Dict[int, EventHandler]
+    buttons: List[Button]
+    grid: SpatialGrid
+    actions: Dict[int, EventHandler]
+    allowed: Tuple[int, ...]
+
+    def __init__(self, name: str, draw: Callable[[], None],
+                 mode: Callable[[], str], handlers: Dict[int, EventHandler],
+                 buttons: List[Button], allowed: Sequence[int] = (),
+                 enter: Optional[Callable[[], None]] = None,
+                 presented: Optional[Callable[[], None]] = None,
+                 build: Optional[Callable[[], None]] = None) -> None:
+        """
+        Initialize a Scene. Mouse clicks are handled by click() unless
+        <handlers> says otherwise. Every handled event type is allowed onto
+        the queue, along with any extra types in <allowed> (e.g. ones that
+        only need to wake an idle scene up).
+        """
+        self.name = name
+        self.draw = draw
+        self.mode = mode
+        # Clicks go to the clicked button's action, unless the scene handles
+        # them itself.
+        self.handlers = {pygame.MOUSEBUTTONDOWN: self.click}
+        self.handlers.update(handlers)
+        self.buttons = buttons
+        self.grid = SpatialGrid()
+        for button in buttons:
+            self.grid.insert(button, button.box())
+        self.actions = {}
+        self.allowed = tuple(sorted(set(self.handlers) | set(allowed)))
+        self.build = build if build is not None else (lambda: None)
+        self.built = False
+        self.enter = enter if enter is not None else (lambda: None)
+        self.presented = presented if presented is not None else \
+            (lambda: None)
+
+    def start(self) -> None:
+        """
+        Set the scene up to be switched to, building it first if this is the
+        first time.
+        """
+        if not self.built:
+            self.built = True
+            self.build()
+        self.enter()
+
+    def add_button(self, button: Button, action: EventHandler) -> None:
+        """
+        Add <button> to the scene, running <action> when it is clicked.
+        """
+        self.buttons.append(button)
+        self.grid.insert(button, button.box())
+        self.actions[id(button)] = action
+
+    def button_at(self, position: Tuple[int, int]) -> Optional[Button]:
+        """
+        Return the button at <position>, or None if there is none.
+        """
+        return self.grid.at(position)
+
+    def dispatch(self, event: pygame.event.Event) -> None:
+        """
+        Run the handler for <event>'s type, if the scene has one.
+        """
+        handler = self.handlers.get(event.type)
+        if handler is not None:
+            handler(event)
+
+    def click(self, event: pygame.event.Event) -> None:
+        """
+        Run the action of the button clicked by the mouse <event>, if any.
+        """
+        button = self.button_at(event.pos)
+        if button is not None:
+            action = self.actions.get(id(button))
+            if action is not None:
+                action(event)
@@ -0,0 +1,58 @@
+"""
+    File name: SceneLayers.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+from typing import Callable, Dict, Hashable, Tuple
+import pygame
+
+LayerKey = Tuple[str, Hashable, Tuple[int, int]]
+
+
+class LayerCache:
+    """
+    A cache of pre-composed static scene layers. A layer holds everything in a
+    scene that does not change from frame to frame (background, titles,
+    descriptions, idle buttons) so a scene only has to blit one surface and
+    then draw its dynamic content on top.
+    === Public Attributes ===
+    builds: The number of layers that have been composed.
+
+    === Private Attributes ===
+    _layers: The composed layers, keyed by (scene name, layout variant,
+        window size).
+
+    === Representation Invariants ===
+    builds >= len(_layers)
+    """
+    builds: int
+    _layers: Dict[LayerKey, pygame.Surface]
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty LayerCache.
+        """
+        self._layers = {}
+        self.builds = 0
+
+    def get(self, name: str, variant: Hashable, size: Tuple[int, int],
+            builder: Callable[[pygame.Surface], None]) -> pygame.Surface:
+        """
+        Return the layer of scene <name> for layout <variant> at window size
+        <size>, composing it with <builder> if it is not cached yet.
+        Layers for other window sizes of the same scene are dropped, since
+        they can not be used again until the window is resized back.
+        """
+        key = (name, variant, size)
+        layer = self._layers.get(key)
+        if layer is None:
+            for old in [k for k in self._layers
+                        if k[0] == name and k[2] != size]:
+                del self._layers[old]
+            layer = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()
+            builder(layer)
+            self._layers[key] = layer
+            self.builds += 1
+        return layer
@@ -0,0 +1,204 @@
+"""
+    File name: ScoreClient.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+# The environment variable giving the URL of the score server to submit to,
+# e.g. http://scores.local:8765.
+SCORE_SERVER_ENV = "BENCHMARK_GAME_SCORE_SERVER"
+
+
+class ScoreClient:
+    """
+    Submits the scores played on a kiosk to a ScoreServer, in batches.
+    Submitting a score only queues it in memory, so it is cheap enough to do
+    during a frame. A background thread sends the queue to the server every
+    flush_interval seconds (or as soon as batch_size scores are waiting)
+    over one kept-alive connection. If the server can not be reached, the
+    batch is sent again (with the same id, so it is only counted once) after
+    a delay that doubles with every failure, up to max_backoff seconds. If
+    more than max_pending scores are waiting, the oldest are dropped.
+    === Public Attributes ===
+    url: The URL of the score server.
+    kiosk: The name the scores are submitted under.
+    batch_size: The most scores sent in one batch.
+    flush_interval: How often (in seconds) waiting scores are sent.
+    max_pending: The most scores kept waiting to be sent.
+    timeout: How long (in seconds) to wait for the server to answer.
+    max_backoff: The longest (in seconds) to wait before sending again after
+        the server could not be reached.
+    sent: The number of scores the server accepted.
+    rejected: The number of scores the server turned away.
+    dropped: The number of scores dropped without being sent.
+    failures: The number of times a batch could not be sent.
+
+    === Private Attributes ===
+    _pending: The scores waiting to be sent, oldest first.
+    _retry: The id and scores of the batch that could not be sent, or None.
+    _lock: Guards _pending and dropped.
+    _wake: Set to make the sender send early.
+    _closed: Set once the client has been closed.
+    _sender: The thread sending the scores.
+
+    === Representation Invariants ===
+    batch_size > 0
+    flush_interval > 0
+    len(_pending) <= max_pending
+    """
+    url: str
+    kiosk: str
+    batch_size: int
+    flush_interval: float
+    max_pending: int
+    timeout: float
+    max_backoff: float
+    sent: int
+    rejected: int
+    dropped: int
+    failures: int
+    _pending: Deque[Dict]
+    _retry: Optional[Tuple[str, List[Dict]]]
+    _lock: threading.Lock
+    _wake: threading.Event
+    _closed: threading.Event
+    _sender: threading.Thread
+
+    def __init__(self, url: str, kiosk: str = "", batch_size: int = 100,
+                 flush_interval: float = 2.0, max_pending: int = 10000,
+                 timeout: float = 5.0, max_backoff: float = 60.0) -> None:
+        """
+        Initialize a ScoreClient submitting scores to the score server at
+        <url> under the name <kiosk>, and start sending them.
+        Preconditions:
+            batch_size > 0
+            flush_interval > 0
+            max_pending >= batch_size
+        """
+        self.url = url
+        self.kiosk = kiosk
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+        self.sent = 0
+        self.rejected = 0
+        self.dropped = 0
+        self.failures = 0
+        self._pending = deque()
+        self._retry = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._sender = threading.Thread(target=self._send_loop,
+                                        name="score-sender", daemon=True)
+        self._sender.start()
+
+    def submit(self, game: str, score: float,
+               timestamp: Optional[float] = None) -> None:
+        """
+        Queue <score> in <game>, played at <timestamp> (in seconds since the
+        epoch, now by default), to be sent to the server. This never waits
+        on the network.
+        """
+        entry = {"game": game, "score": score,
+                 "timestamp": time.time() if timestamp is None else timestamp}
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                self._pending.popleft()
+                self.dropped += 1
+            self._pending.append(entry)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def pending(self) -> int:
+        """
+        Return the number of scores waiting to be sent.
+        """
+        with self._lock:
+            return len(self._pending) + \
+                (len(self._retry[1]) if self._retry is not None else 0)
+
+    def _next_batch(self) -> Optional[Tuple[str, List[Dict]]]:
+        """
+        Return the id and scores of the next batch to send, or None if no
+        scores are waiting.
+        """
+        if self._retry is not None:
+            return self._retry
+        with self._lock:
+            if not self._pending:
+                return None
+            count = min(self.batch_size, len(self._pending))
+            scores = [self._pending.popleft() for _ in range(count)]
+        return os.urandom(8).hex(), scores
+
+    def _send_loop(self) -> None:
+        """
+        Send the waiting scores every flush_interval seconds (or as soon as
+        a batch is full) until the client is closed, backing off while the
+        server can not be reached.
+        """
+        # Imported here so the game only pays for importing http.client when
+        # scores are submitted.
+        import http.client
+        import urllib.parse
+        parts = urllib.parse.urlsplit(self.url)
+        connection_class = http.client.HTTPSConnection \
+            if parts.scheme == "https" else http.client.HTTPConnection
+        connection = connection_class(parts.netloc, timeout=self.timeout)
+        path = parts.path.rstrip("/") + "/scores"
+        backoff = 0.0
+        while True:
+            self._wake.wait(backoff if backoff else self.flush_interval)
+            self._wake.clear()
+            closing = self._closed.is_set()
+            batch = self._next_batch()
+            while batch is not None:
+                body = json.dumps({"kiosk": self.kiosk, "batch": batch[0],
+                                   "scores": batch[1]})
+                try:
+                    connection.request("POST", path, body,
+                                       {"Content-Type": "application/json"})
+                    response = connection.getresponse()
+                    answer = json.loads(response.read() or b"{}")
+                except (OSError, http.client.HTTPException, ValueError):
+                    connection.close()
+                    self._retry = batch
+                    self.failures += 1
+                    backoff = min(self.max_backoff,
+                                  backoff * 2 if backoff else 1.0)
+                    break
+                self._retry = None
+                backoff = 0.0
+                if response.status == 200:
+                    self.sent += answer.get("accepted", 0)
+                    self.rejected += answer.get("rejected", 0)
+                else:
+                    # The server will never take this batch; sending it
+                    # again would only hold up the ones after it.
+                    self.rejected += len(batch[1])
+                batch = self._next_batch()
+            if closing:
+                break
+        connection.close()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Send every waiting score (waiting at most <timeout> seconds, or the
+        client's timeout if it is None, for the server) and stop sending.
+        Scores can not be submitted afterwards.
+        """
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._wake.set()
+        self._sender.join(self.timeout if timeout is None else timeout)
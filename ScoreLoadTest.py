@@ -0,0 +1,225 @@
+"""
+    File name: ScoreLoadTest.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+
+    Measures how many scores a ScoreServer takes per second: a number of
+    simulated kiosks submit batches of random scores to it as fast as it
+    answers, each over one kept-alive connection, and the throughput and
+    latency of their requests are printed as JSON.
+    Unless --url is given, a ScoreServer is started in this process (on the
+    same event loop as the kiosks) and checked afterwards to have counted
+    every score submitted.
+
+    Usage: python ScoreLoadTest.py [--url URL] [--clients N] [--batch N]
+                                   [--seconds S] [--seed N] [--output FILE]
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+import urllib.parse
+from typing import Dict, List, Optional, Tuple
+
+from ScoreServer import GAMES, LOWER_IS_BETTER, ScoreServer
+
+# The number of different request bodies each kiosk cycles through, so
+# building them is not part of what is measured.
+BODIES = 64
+
+
+def percentile(samples: List[float], percent: float) -> float:
+    """
+    Return the <percent>th percentile of the sorted list <samples>, using
+    the nearest-rank method.
+    Precondition: samples is sorted and not empty.
+    """
+    rank = max(1, math.ceil(percent / 100 * len(samples)))
+    return samples[min(rank, len(samples)) - 1]
+
+
+def random_scores(rng: random.Random, count: int) -> List[Dict]:
+    """
+    Return <count> random scores of random games, drawn from <rng>.
+    """
+    scores = []
+    for _ in range(count):
+        game = rng.choice(GAMES)
+        if game in LOWER_IS_BETTER:
+            score = round(rng.lognormvariate(-1.3, 0.3), 4)
+        else:
+            score = rng.randint(0, 30)
+        scores.append({"game": game, "score": score,
+                       "timestamp": round(time.time(), 3)})
+    return scores
+
+
+def request_parts(host: str, path: str, kiosk: str,
+                  scores: List[Dict]) -> Tuple[bytes, bytes]:
+    """
+    Return the bytes of a request submitting <scores> from <kiosk> to
+    <path> on <host>, split where its batch id goes. Every batch id is 16
+    hexadecimal digits long, so the Content-Length is known beforehand.
+    """
+    head, tail = json.dumps({"kiosk": kiosk, "batch": "",
+                             "scores": scores}).split('"batch": ""')
+    head += '"batch": "'
+    tail = '"' + tail
+    length = len(head.encode()) + 16 + len(tail.encode())
+    request = "POST " + path + " HTTP/1.1\r\nHost: " + host + "\r\n" + \
+        "Content-Type: application/json\r\n" + \
+        "Content-Length: " + str(length) + "\r\n\r\n" + head
+    return request.encode(), tail.encode()
+
+
+async def read_response(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    """
+    Read one HTTP response from <reader> and return its status and body.
+    Raises ConnectionError if the server closed the connection.
+    """
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("the server closed the connection")
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    return int(status_line.split()[1]), await reader.readexactly(length)
+
+
+async def kiosk(number: int, host: str, port: int, path: str,
+                batch: int, seed: int, deadline: float,
+                latencies: List[float], counts: Dict[str, int]) -> None:
+    """
+    Submit batches of <batch> scores to the server on <host> at <port> as
+    kiosk <number>, one after another until time.perf_counter() passes
+    <deadline>, adding how long each took to <latencies> and tallying them
+    in <counts>.
+    """
+    rng = random.Random(str(seed) + ":" + str(number))
+    name = "kiosk-" + str(number)
+    bodies = [request_parts(host, path, name, random_scores(rng, batch))
+              for _ in range(BODIES)]
+    reader, writer = await asyncio.open_connection(host, port)
+    sent = 0
+    try:
+        while time.perf_counter() < deadline:
+            head, tail = bodies[sent % BODIES]
+            batch_id = format(number, "06x") + format(sent, "010x")
+            start = time.perf_counter()
+            writer.write(head + batch_id.encode() + tail)
+            status, body = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            sent += 1
+            if status == 200:
+                answer = json.loads(body)
+                counts["requests"] += 1
+                counts["accepted"] += answer["accepted"]
+                counts["rejected"] += answer["rejected"]
+            else:
+                counts["errors"] += 1
+    finally:
+        writer.close()
+
+
+async def load_test(url: Optional[str], clients: int, batch: int,
+                    seconds: float, seed: int) -> Dict:
+    """
+    Submit scores to the score server at <url> (or to one started here if
+    it is None) from <clients> kiosks, in batches of <batch>, for <seconds>
+    seconds, and return the throughput and latency of the requests.
+    """
+    server = None
+    if url is None:
+        server = ScoreServer()
+        host, path = "127.0.0.1", "/scores"
+        port = await server.start(host, 0)
+    else:
+        parts = urllib.parse.urlsplit(url)
+        host, port = parts.hostname, parts.port or 80
+        path = parts.path.rstrip("/") + "/scores"
+    latencies = []
+    counts = {"requests": 0, "accepted": 0, "rejected": 0, "errors": 0}
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*[
+            kiosk(number, host, port, path, batch, seed,
+                  start + seconds, latencies, counts)
+            for number in range(clients)])
+    finally:
+        elapsed = time.perf_counter() - start
+        if server is not None:
+            await server.close()
+    latencies.sort()
+    report = {"url": url, "clients": clients, "batch": batch,
+              "seconds": elapsed,
+              "requests": counts["requests"],
+              "scores": counts["accepted"] + counts["rejected"],
+              "rejected": counts["rejected"],
+              "errors": counts["errors"],
+              "requests_per_second": counts["requests"] / elapsed,
+              "submissions_per_second": counts["accepted"] / elapsed,
+              "latency": {"count": 0}}
+    if latencies:
+        report["latency"] = {
+            "count": len(latencies),
+            "mean_ms": sum(latencies) / len(latencies) * 1000,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p90_ms": percentile(latencies, 90) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "max_ms": latencies[-1] * 1000}
+    if server is not None:
+        report["server_accepted"] = server.accepted
+        report["consistent"] = server.accepted == counts["accepted"] and \
+            sum(board.stats.count for board in
+                server.leaderboards.values()) == counts["accepted"]
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the load test from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Measure how many scores a score server takes per "
+                    "second.")
+    parser.add_argument("--url",
+                        help="the score server to test (default: start one "
+                             "in this process)")
+    parser.add_argument("--clients", type=int, default=32,
+                        help="the number of kiosks submitting at once")
+    parser.add_argument("--batch", type=int, default=50,
+                        help="the number of scores in each batch")
+    parser.add_argument("--seconds", type=float, default=5.0,
+                        help="how long to submit scores for")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="what the random scores are drawn from")
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args(argv)
+    if args.clients < 1 or args.batch < 1 or args.seconds <= 0:
+        parser.error("--clients, --batch and --seconds must be positive")
+    try:
+        report = asyncio.run(load_test(args.url, args.clients, args.batch,
+                                       args.seconds, args.seed))
+    except OSError as error:
+        print(error, file=sys.stderr)
+        return 2
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+    return 1 if report["errors"] or not report.get("consistent", True) \
+        else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,605 @@
+"""
+    File name: ScoreServer.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+
+    A small HTTP score service that kiosks running the game submit their
+    scores to. It keeps a leaderboard of every game in memory and saves them
+    to disk every so often, so a restarted server carries on where it left
+    off.
+
+    Usage: python ScoreServer.py [--host HOST] [--port PORT] [--top K]
+                                 [--snapshot FILE] [--snapshot-interval S]
+
+    Requests (and responses) are JSON:
+        POST /scores: Submit a batch of scores, e.g.
+            {"kiosk": "lobby", "batch": "5f2c...",
+             "scores": [{"game": "number", "score": 12,
+                         "timestamp": 1700000000.0}]}
+            A batch sent again with the same id is only counted once.
+        GET /leaderboard: Every game's leaderboard.
+        GET /leaderboard/GAME: The leaderboard of GAME.
+"""
+import argparse
+import asyncio
+import heapq
+import json
+import math
+import os
+import signal
+import sys
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from OnlineStats import QuantileSketch, RunningStats
+from ResultsLog import GAME_IDS
+
+# The games scores are kept for, and those whose best scores are the lowest
+# (times, in seconds) rather than the highest (points).
+GAMES = tuple(GAME_IDS)
+LOWER_IS_BETTER = frozenset(("reaction", "aim"))
+
+# The quantiles of every game's scores that are estimated.
+QUANTILES = (0.5, 0.9, 0.99)
+
+# The port the server listens on by default.
+DEFAULT_PORT = 8765
+
+# The largest request body (in bytes) the server reads.
+MAX_BODY = 1 << 20
+
+# How many of the latest batch ids are remembered, so a batch a kiosk sends
+# again (because it never got the answer) is not counted twice.
+RECENT_BATCHES = 100000
+
+# What the snapshot file says it is, and the version of its format.
+SNAPSHOT_FORMAT = "benchmark-game-scores"
+SNAPSHOT_VERSION = 1
+
+# The reason phrase of each HTTP status the server answers with.
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 413: "Payload Too Large"}
+
+Entry = Tuple[float, int, Dict]
+
+
+class HTTPError(Exception):
+    """
+    A request the server can not answer, with the HTTP status to answer it
+    with instead.
+    === Public Attributes ===
+    status: The HTTP status of the error.
+    """
+    status: int
+
+    def __init__(self, status: int, message: str) -> None:
+        """
+        Initialize an HTTPError with <status> and <message>.
+        """
+        Exception.__init__(self, message)
+        self.status = status
+
+
+class Leaderboard:
+    """
+    The best scores of one game and the distribution of all of them, in
+    fixed memory however many are submitted.
+    The best k scores are kept in a heap with the worst of them on top, so a
+    score that does not make the board is turned away in O(1) time and one
+    that does replaces the top in O(log k). The count, mean and quantiles of
+    every score are kept by OnlineStats without storing the scores.
+    === Public Attributes ===
+    game: The game the scores are of.
+    k: The number of best scores kept.
+    lower_is_better: Whether lower scores are better.
+    stats: The count, mean and range of every score submitted.
+    sketches: An estimate of each of QUANTILES of every score submitted.
+
+    === Private Attributes ===
+    _heap: The best k scores, as (key, order, entry) tuples: key is higher
+        for better scores and order is higher for earlier ones, so ties go to
+        the score submitted first.
+    _submitted: The number of scores submitted, which gives each its order.
+
+    === Representation Invariants ===
+    k > 0
+    len(_heap) <= k
+    len(sketches) == len(QUANTILES)
+    """
+    game: str
+    k: int
+    lower_is_better: bool
+    stats: RunningStats
+    sketches: List[QuantileSketch]
+    _heap: List[Entry]
+    _submitted: int
+
+    def __init__(self, game: str, k: int = 10) -> None:
+        """
+        Initialize an empty Leaderboard of <game> keeping the best <k>
+        scores.
+        Precondition: k > 0
+        """
+        self.game = game
+        self.k = k
+        self.lower_is_better = game in LOWER_IS_BETTER
+        self.stats = RunningStats()
+        self.sketches = [QuantileSketch(quantile) for quantile in QUANTILES]
+        self._heap = []
+        self._submitted = 0
+
+    def add(self, score: float, kiosk: str, timestamp: float) -> None:
+        """
+        Add <score>, played on <kiosk> at <timestamp> (in seconds since the
+        epoch), to the leaderboard.
+        """
+        self.stats.add(score)
+        for sketch in self.sketches:
+            sketch.add(score)
+        self._submitted += 1
+        key = -score if self.lower_is_better else score
+        order = -self._submitted
+        heap = self._heap
+        if len(heap) < self.k:
+            heapq.heappush(heap, (key, order, {"score": score, "kiosk": kiosk,
+                                               "timestamp": timestamp}))
+        elif (key, order) > heap[0][:2]:
+            heapq.heapreplace(heap, (key, order,
+                                     {"score": score, "kiosk": kiosk,
+                                      "timestamp": timestamp}))
+
+    def top(self) -> List[Dict]:
+        """
+        Return the best scores, best first.
+        """
+        return [dict(entry, rank=rank) for rank, (_, _, entry) in
+                enumerate(sorted(self._heap, reverse=True), 1)]
+
+    def report(self) -> Dict:
+        """
+        Return the leaderboard, with the count, mean and estimated quantiles
+        of every score, as a JSON-serializable dictionary.
+        """
+        count = self.stats.count
+        return {"game": self.game,
+                "better": "lower" if self.lower_is_better else "higher",
+                "count": count,
+                "mean": self.stats.mean if count else None,
+                "quantiles": {
+                    "p" + format(sketch.quantile * 100, "g"):
+                    sketch.value() if count else None
+                    for sketch in self.sketches},
+                "top": self.top()}
+
+    def state(self) -> Dict:
+        """
+        Return everything needed to rebuild this Leaderboard with
+        from_state().
+        """
+        return {"game": self.game, "k": self.k,
+                "submitted": self._submitted,
+                "stats": self.stats.state(),
+                "sketches": [sketch.state() for sketch in self.sketches],
+                "heap": [list(item) for item in self._heap]}
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "Leaderboard":
+        """
+        Return the Leaderboard whose state() was <state>.
+        """
+        board = cls(state["game"], state["k"])
+        board._submitted = state["submitted"]
+        board.stats = RunningStats.from_state(state["stats"])
+        board.sketches = [QuantileSketch.from_state(sketch)
+                          for sketch in state["sketches"]]
+        board._heap = [tuple(item) for item in state["heap"]]
+        heapq.heapify(board._heap)
+        return board
+
+
+class ScoreServer:
+    """
+    An asyncio HTTP server keeping a Leaderboard of every game.
+    Every request is handled on one event loop, and nothing is awaited while
+    a leaderboard changes, so no locks are needed. Connections are kept
+    alive between requests, so a kiosk (or a load test) does not pay for a
+    new connection per batch. Every snapshot_interval seconds, the
+    leaderboards are copied on the loop and written to disk in an executor,
+    so saving never holds up submissions.
+    === Public Attributes ===
+    leaderboards: The leaderboard of every game, keyed by game.
+    snapshot_path: Where the leaderboards are saved, or None if they are
+        not.
+    snapshot_interval: How often (in seconds) the leaderboards are saved.
+    batches: The number of batches submitted, not counting repeats.
+    accepted: The number of scores added to a leaderboard.
+    rejected: The number of scores turned away as malformed.
+
+    === Private Attributes ===
+    _recent: The ids of the latest batches submitted, with what they were
+        answered with, oldest first.
+    _changed: Whether the leaderboards changed since they were last saved.
+    _server: The listening server, or None if it has not been started.
+    _snapshots: The task saving the leaderboards, or None.
+    _connections: The task serving each connection, keyed by its stream.
+
+    === Representation Invariants ===
+    set(leaderboards) == set(GAMES)
+    len(_recent) <= RECENT_BATCHES
+    snapshot_interval > 0
+    """
+    leaderboards: Dict[str, Leaderboard]
+    snapshot_path: Optional[str]
+    snapshot_interval: float
+    batches: int
+    accepted: int
+    rejected: int
+    _recent: "OrderedDict[str, Dict[str, int]]"
+    _changed: bool
+    _server: Optional[asyncio.AbstractServer]
+    _snapshots: Optional[asyncio.Task]
+    _connections: Dict[asyncio.StreamWriter, asyncio.Task]
+
+    def __init__(self, k: int = 10, snapshot_path: Optional[str] = None,
+                 snapshot_interval: float = 30.0) -> None:
+        """
+        Initialize a ScoreServer keeping the best <k> scores of every game,
+        saving them to <snapshot_path> every <snapshot_interval> seconds (if
+        it is given) and picking up from the snapshot there, if there is
+        one.
+        Raises ValueError if <snapshot_path> is not a snapshot of scores.
+        Preconditions:
+            k > 0
+            snapshot_interval > 0
+        """
+        self.leaderboards = {game: Leaderboard(game, k) for game in GAMES}
+        self.snapshot_path = snapshot_path
+        self.snapshot_interval = snapshot_interval
+        self.batches = 0
+        self.accepted = 0
+        self.rejected = 0
+        self._recent = OrderedDict()
+        self._changed = False
+        self._server = None
+        self._snapshots = None
+        self._connections = {}
+        if snapshot_path is not None and os.path.exists(snapshot_path):
+            self._load(snapshot_path)
+
+    def _load(self, path: str) -> None:
+        """
+        Pick up the leaderboards from the snapshot at <path>.
+        """
+        with open(path) as snapshot:
+            try:
+                state = json.load(snapshot)
+            except ValueError:
+                state = None
+        if not isinstance(state, dict) or \
+                state.get("format") != SNAPSHOT_FORMAT or \
+                state.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(path + ' is not a snapshot of scores')
+        for game, board in state["leaderboards"].items():
+            if game in self.leaderboards:
+                self.leaderboards[game] = Leaderboard.from_state(board)
+        self.batches = state["batches"]
+        self.accepted = state["accepted"]
+        self.rejected = state["rejected"]
+
+    def submit(self, batch: Dict) -> Dict[str, int]:
+        """
+        Add the scores in <batch> to the leaderboards and return how many
+        were accepted and rejected. Scores of unknown games, or that are not
+        finite numbers, are rejected. A batch whose id has been seen before
+        is answered as it was the first time, without adding it again.
+        Raises ValueError if <batch> is not a batch of scores.
+        """
+        if not isinstance(batch, dict) or \
+                not isinstance(batch.get("scores"), list):
+            raise ValueError("a batch needs a list of scores")
+        batch_id = batch.get("batch")
+        if batch_id is not None:
+            batch_id = str(batch_id)
+            if batch_id in self._recent:
+                return dict(self._recent[batch_id], repeated=True)
+        kiosk = str(batch.get("kiosk", ""))
+        now = time.time()
+        accepted = 0
+        for score in batch["scores"]:
+            try:
+                board = self.leaderboards[score["game"]]
+                value = float(score["score"])
+                timestamp = float(score.get("timestamp", now))
+            except (KeyError, TypeError, ValueError, AttributeError):
+                continue
+            if math.isfinite(value):
+                board.add(value, kiosk, timestamp)
+                accepted += 1
+        answer = {"accepted": accepted,
+                  "rejected": len(batch["scores"]) - accepted}
+        self.batches += 1
+        self.accepted += answer["accepted"]
+        self.rejected += answer["rejected"]
+        self._changed = self._changed or accepted > 0
+        if batch_id is not None:
+            self._recent[batch_id] = answer
+            if len(self._recent) > RECENT_BATCHES:
+                self._recent.popitem(last=False)
+        return answer
+
+    def report(self, game: Optional[str] = None) -> Dict:
+        """
+        Return the leaderboard of <game>, or of every game (with the
+        server's totals) if it is None.
+        Raises KeyError if <game> is not a game.
+        """
+        if game is not None:
+            return self.leaderboards[game].report()
+        return {"batches": self.batches,
+                "accepted": self.accepted,
+                "rejected": self.rejected,
+                "leaderboards": {game: board.report() for game, board in
+                                 self.leaderboards.items()}}
+
+    def state(self) -> Dict:
+        """
+        Return the snapshot of the leaderboards, as a JSON-serializable
+        dictionary.
+        """
+        return {"format": SNAPSHOT_FORMAT, "version": SNAPSHOT_VERSION,
+                "saved_at": time.time(),
+                "batches": self.batches,
+                "accepted": self.accepted,
+                "rejected": self.rejected,
+                "leaderboards": {game: board.state() for game, board in
+                                 self.leaderboards.items()}}
+
+    def answer(self, method: str, target: str,
+               body: bytes) -> Tuple[int, Dict]:
+        """
+        Return the HTTP status and JSON payload answering the request for
+        <target> with <method> and <body>.
+        """
+        path = target.split("?", 1)[0].rstrip("/")
+        parts = path.split("/")[1:]
+        if path == "/scores":
+            if method != "POST":
+                return 405, {"error": "scores can only be POSTed"}
+            try:
+                return 200, self.submit(json.loads(body))
+            except ValueError as error:
+                return 400, {"error": str(error)}
+        if parts[:1] == ["leaderboard"] and len(parts) <= 2:
+            if method != "GET":
+                return 405, {"error": "leaderboards can only be read"}
+            game = parts[1] if len(parts) == 2 else None
+            if game is not None and game not in self.leaderboards:
+                return 404, {"error": "there is no game called " + game}
+            return 200, self.report(game)
+        return 404, {"error": "nothing at " + path}
+
+    async def handle(self, reader: asyncio.StreamReader,
+                     writer: asyncio.StreamWriter) -> None:
+        """
+        Answer every request on the connection of <reader> and <writer>,
+        until the client closes it or asks for it to be closed.
+        """
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HTTPError as error:
+                    writer.write(encode_response(
+                        error.status, {"error": str(error)}, False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, target, headers, body = request
+                status, payload = self.answer(method, target, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(encode_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1",
+                    port: int = DEFAULT_PORT) -> int:
+        """
+        Start serving on <host> at <port> (any free port if it is 0) and
+        saving snapshots, and return the port served on.
+        """
+        self._server = await asyncio.start_server(self.handle, host, port)
+        if self.snapshot_path is not None:
+            self._snapshots = asyncio.ensure_future(self._snapshot_loop())
+        return self._server.sockets[0].getsockname()[1]
+
+    async def _snapshot_loop(self) -> None:
+        """
+        Save the leaderboards every snapshot_interval seconds. A snapshot
+        that could not be written is reported and tried again next time.
+        """
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            try:
+                await self.save()
+            except OSError as error:
+                print("Could not save the leaderboards: " + str(error),
+                      file=sys.stderr, flush=True)
+
+    async def save(self) -> None:
+        """
+        Save the leaderboards to snapshot_path, if they changed since they
+        were last saved. The snapshot is written in an executor, and
+        atomically, so a crash while saving leaves the last one whole.
+        """
+        if self.snapshot_path is None or not self._changed:
+            return
+        # Cleared before writing, so scores submitted during the write mark
+        # the leaderboards changed again.
+        self._changed = False
+        text = json.dumps(self.state())
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, write_atomically,
+                                       self.snapshot_path, text)
+        except BaseException:
+            self._changed = True
+            raise
+
+    async def close(self) -> None:
+        """
+        Stop serving, close every connection and save the leaderboards one
+        last time.
+        """
+        if self._snapshots is not None:
+            self._snapshots.cancel()
+            self._snapshots = None
+        if self._server is not None:
+            self._server.close()
+            tasks = list(self._connections.values())
+            for writer in list(self._connections):
+                writer.close()
+            # Closing a stream ends its task's wait for the next request.
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+        await self.save()
+
+
+async def read_request(reader: asyncio.StreamReader) \
+        -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+    """
+    Read one HTTP request from <reader> and return its method, target,
+    headers (with lowercase names) and body, or None if the connection was
+    closed before it started.
+    Raises HTTPError if the request is malformed or too large.
+    """
+    line = await read_line(reader)
+    if not line:
+        return None
+    request_line = line.decode("latin-1").split()
+    if len(request_line) != 3:
+        raise HTTPError(400, "malformed request line")
+    method, target, _ = request_line
+    headers = {}
+    while True:
+        line = await read_line(reader)
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise HTTPError(400, "malformed Content-Length")
+    if length > MAX_BODY:
+        raise HTTPError(413, "the body is larger than " + str(MAX_BODY) +
+                        " bytes")
+    body = await reader.readexactly(length) if length > 0 else b""
+    return method, target, headers, body
+
+
+async def read_line(reader: asyncio.StreamReader) -> bytes:
+    """
+    Read one line of a request from <reader>, or b"" if the connection was
+    closed.
+    Raises HTTPError if the line is longer than <reader>'s limit.
+    """
+    try:
+        return await reader.readline()
+    except (ValueError, asyncio.LimitOverrunError):
+        raise HTTPError(413, "the request line or a header is too long")
+
+
+def encode_response(status: int, payload: Dict, keep_alive: bool) -> bytes:
+    """
+    Return the HTTP response with <status> and the JSON <payload>, saying
+    whether the connection is kept alive (<keep_alive>).
+    """
+    body = json.dumps(payload).encode()
+    head = "HTTP/1.1 " + str(status) + " " + REASONS[status] + "\r\n" + \
+        "Content-Type: application/json\r\n" + \
+        "Content-Length: " + str(len(body)) + "\r\n" + \
+        "Connection: " + ("keep-alive" if keep_alive else "close") + \
+        "\r\n\r\n"
+    return head.encode("latin-1") + body
+
+
+def write_atomically(path: str, text: str) -> None:
+    """
+    Replace the file at <path> with <text>, so that it always holds either
+    the old or the new text, even if the machine crashes while writing.
+    """
+    temporary = path + '.' + str(os.getpid()) + '.tmp'
+    with open(temporary, 'w') as output:
+        output.write(text)
+        output.flush()
+        os.fsync(output.fileno())
+    os.replace(temporary, path)
+
+
+async def serve(server: ScoreServer, host: str, port: int) -> None:
+    """
+    Run <server> on <host> at <port> until the process is interrupted or
+    terminated.
+    """
+    port = await server.start(host, port)
+    print("Serving scores on http://" + host + ":" + str(port), flush=True)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signal_number, stop.set)
+        except (NotImplementedError, RuntimeError):
+            # Not on Windows; Ctrl+C still stops the server there.
+            pass
+    try:
+        await stop.wait()
+    finally:
+        await server.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the score server from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Collect the scores of kiosks running the game.")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="the address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                        help="the port to listen on")
+    parser.add_argument("--top", type=int, default=10,
+                        help="the number of best scores kept per game")
+    parser.add_argument("--snapshot", metavar="FILE",
+                        help="save the leaderboards to FILE, and pick them "
+                             "up from it when started")
+    parser.add_argument("--snapshot-interval", type=float, default=30.0,
+                        metavar="SECONDS",
+                        help="how often to save the leaderboards")
+    args = parser.parse_args(argv)
+    if args.top < 1 or args.snapshot_interval <= 0:
+        parser.error("--top and --snapshot-interval must be positive")
+    try:
+        server = ScoreServer(args.top, args.snapshot,
+                             args.snapshot_interval)
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 2
+    try:
+        asyncio.run(serve(server, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,12 +4,26 @@
     Python Version: 3.9
 """
 import pygame
-import time
-from typing import Tuple, List
-from Button import Button
+import random
+from concurrent.futures import Executor
+from typing import Tuple, List, Optional, Dict
+from Button import Button, NORMAL, HOVER, PRESSED
+from Scene import Scene
 from ReactionGame import ReactionGame
 from NumberGame import NumberGame
 from VerbalGame import VerbalGame
+from AimGame import AimGame, TARGETS_AT_ONCE, TOTAL_TARGETS
+from FontManager import FONTS, SANS_FONT
+from TextCache import TEXT_CACHE
+from DigitAtlas import DigitAtlas, NUMBER_SIZES
+from SceneLayers import LayerCache
+from DirtyRegions import DirtyRegions
+from FrameScheduler import FrameScheduler, IDLE, ACTIVE, PRECISE
+from StimulusScheduler import StimulusScheduler, STIMULUS_EVENT
+from ResultsLog import ResultsLog
+from ScoreClient import ScoreClient
+from Profiler import Profiler
+from Startup import StartupTimeline
 
 # COLOR CONSTANTS
 BLUE = (0, 0, 255)
@@ -27,8 +41,36 @@ JADE = (0, 163, 108)
 ALT_RED = (245, 31, 10)
 ORANGE = (255, 165, 0)
 
-# FONTS
-SANS_FONT = 'freesansbold.ttf'
+# FONT SIZES used by the screen and its buttons, loaded once at start up.
+# Only the intro's are loaded before it is shown; the rest are loaded once it
+# is on screen.
+FONT_SIZES = (20, 30, 35, 40, 45, 50, 60, 70, 100) + NUMBER_SIZES
+INTRO_FONT_SIZES = (100, 35)
+
+# The area (width, height) the number game's number is drawn in.
+NUMBER_AREA = (640, 230)
+
+# The area (x, y, width, height) the aim trainer's targets appear in.
+AIM_AREA = (40, 180, 1200, 500)
+
+# The number of threads the game's disk work runs on while it runs on asyncio.
+BACKGROUND_WORKERS = 2
+
+# The events idle scenes with buttons let through, so hovering over or
+# letting go of a button wakes them up to redraw it.
+POINTER_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP)
+
+# The events telling the game that part of the window was uncovered and must
+# be drawn again, which every scene lets through.
+EXPOSE_EVENTS = (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE)
+
+# SCENE NAMES
+INTRO = "intro"
+MAIN_MENU = "main"
+REACTION = "reaction"
+NUMBER = "number"
+VERBAL = "verbal"
+AIM = "aim"
 
 
 class Screen:
@@ -42,43 +84,65 @@ class Screen:
     screen: The display of the game.
     game_running: A boolean representing whether or not the main game loop is
         running.
-    intro_running: A boolean representing whether or not the game introduction
-        scene is running.
-    main_running: A boolean representing whether or not the main menu screen
-        is running.
-    reaction_running: A boolean representing whether or not the reaction game
-        is running.
-    number_running: A boolean representing whether or not the number game
-        is running.
-    verbal_running: A boolean representing whether or not the verbal game
-        is running.
+    current_scene: The name of the scene that is running.
+    scenes: Every scene of the game, keyed by name.
+    mouse_pos: Where the mouse was at the start of the current frame.
+    hovered: The button of the current scene under mouse_pos, or None.
+    mouse_down: Whether the left mouse button was held down at the start of
+        the current frame.
     main_menu_buttons: A list of all the buttons in the main menu.
     reaction_buttons: A list of all the buttons in the reaction game.
     number_buttons: A list of all the buttons in the number game.
     verbal_buttons: A list of all the buttons in the verbal game.
+    aim_buttons: A list of all the buttons in the aim trainer.
     words: An attribute that runs the VerbalGame class and has vital attributes
-        and methods for the verbal game to work.
+        and methods for the verbal game to work. Its words are loaded in the
+        background while the other scenes run.
     clicked_textbox: Represents whether the text box in the verbal game has
         been clicked.
     textbox: Represents the text box in the verbal game.
+    endless_button: Represents the verbal game's button that switches endless
+        mode on and off.
     numbers: An attribute that runs the NumberGame class and has vital
         attributes and methods for the number game to work.
     can_type: Represents whether or not the user can type on the textbox.
     react: An attribute that runs the ReactGame class and has vital attributes
         and methods for the react game to work.
     react_button: Represents the main button in the reaction game.
+    aim: An attribute that runs the AimGame class and has vital attributes
+        and methods for the aim trainer to work.
+    aim_button: Represents the button that starts the aim trainer.
+    layers: The cache of each scene's pre-composed static content.
+    dirty: The tracker of which parts of the window changed this frame.
+    scheduler: Paces every scene loop and hands it its events.
+    stimulus: Schedules and times the reaction game's "GO!".
+    digits: Lays out and draws the number game's numbers, however long.
+    results: The log every trial played is recorded in.
+    profiler: Times every phase of every frame, or None if the game is not
+        being profiled.
+    timeline: Records when each step of starting the game finished, or None
+        if start up is not being timed.
+    background: The executor the game's disk work (e.g. loading the verbal
+        game's words) runs in while run_game_async() runs, or None if each
+        piece of work gets a thread of its own.
+    seed: What each game's random number generator was seeded from, or None
+        if the games use the random module.
+    scores: Submits the score of every finished game to a score server, or
+        None if scores are not submitted.
 
     === Private Attributes ===
-    _start_time: Used in both the number game and the reaction game, this
-        attribute represents a necessary start time. For the number game, this
-        is used to calculate how long the displayed number should be shown.
-        For the reaction game, this is used to calculate everything after
-        the first click to start the game.
+    _start_time: Used in the number game, this attribute represents a
+        necessary start time. It is used to calculate how long the displayed
+        number should be shown.
+    _words_set_up: Whether the verbal game has its words and a game set up.
+    _warmed_up: Whether the work put off until the intro was on screen has
+        been done.
+    _changing_buttons: The buttons whose look changes other than when
+        hovered (e.g. the reaction game's main button), which are never baked
+        into a scene's static layer.
 
     === Representation Invariants ===
-        Exactly one of the following attributes may be True at a time.
-        intro_running, main_running, reaction_running, number_running,
-        verbal_running.
+        current_scene in scenes
 
         SCREEN_WIDTH, SCREEN_HEIGHT > 0
         _start_time >= 0
@@ -88,49 +152,189 @@ class Screen:
     screen: pygame.Surface
     BACKGROUND: Tuple[int, int, int] = LIGHT_YELLOW
     game_running: bool = True
-    intro_running: bool = True
-    main_running: bool = False
-    reaction_running: bool = False
-    number_running: bool = False
-    verbal_running: bool = False
+    current_scene: str = INTRO
+    scenes: Dict[str, Scene]
+    mouse_pos: Tuple[int, int] = (0, 0)
+    hovered: Optional[Button] = None
+    mouse_down: bool = False
     main_menu_buttons: List[Button]
     reaction_buttons: List[Button]
     number_buttons: List[Button]
     verbal_buttons: List[Button]
-    words: VerbalGame = VerbalGame()
+    aim_buttons: List[Button]
+    words: VerbalGame
     clicked_textbox: bool = False
     textbox: Button
-    numbers: NumberGame = NumberGame()
+    endless_button: Button
+    numbers: NumberGame
     _start_time: float = 0
+    _words_set_up: bool = False
+    _warmed_up: bool = False
+    _changing_buttons: List[Button]
     can_type: bool = True
-    react: ReactionGame = ReactionGame()
+    react: ReactionGame
     react_button: Button
+    aim: AimGame
+    aim_button: Button
+    layers: LayerCache
+    dirty: DirtyRegions
+    scheduler: FrameScheduler
+    stimulus: StimulusScheduler
+    digits: DigitAtlas
+    results: ResultsLog
+    profiler: Optional[Profiler]
+    timeline: Optional[StartupTimeline]
+    background: Optional[Executor] = None
+    seed: Optional[int]
+    scores: Optional[ScoreClient]
 
     # INITIALIZER
-    def __init__(self) -> None:
+    def __init__(self, scheduler: Optional[FrameScheduler] = None,
+                 results: Optional[ResultsLog] = None,
+                 profiler: Optional[Profiler] = None,
+                 timeline: Optional[StartupTimeline] = None,
+                 seed: Optional[int] = None,
+                 scores: Optional[ScoreClient] = None,
+                 aim_targets: int = TARGETS_AT_ONCE) -> None:
         """
-        Initialize the Screen.
+        Initialize the Screen, pacing its frames with <scheduler> (or with a
+        default FrameScheduler if none is given) and recording every trial in
+        <results> (or in results.log if none is given). Every frame is timed
+        by <profiler>, and each step of starting up is recorded in
+        <timeline>, if they are given. If <seed> is given, each game gets its
+        own random number generator seeded from it, so the same input plays
+        out the same way again. The score of every finished game is submitted
+        with <scores>, if it is given. The aim trainer shows <aim_targets>
+        targets at a time, in games of at least TOTAL_TARGETS targets.
+        Only what the intro needs is set up here; the verbal game's words and
+        the other fonts are loaded once the intro is on screen, and each
+        scene's buttons are created the first time it is entered.
         """
-        # Set up pygame
-        pygame.init()
+        self.timeline = timeline
+        self.seed = seed
+        self.scores = scores
+        self.words = VerbalGame(self.game_rng(VERBAL))
+        self.numbers = NumberGame(self.game_rng(NUMBER))
+        self.react = ReactionGame(self.game_rng(REACTION))
+        self.aim = AimGame(AIM_AREA, self.game_rng(AIM), aim_targets,
+                           max(aim_targets, TOTAL_TARGETS))
 
+        # Set up the only parts of pygame the game uses: the display (which
+        # brings the event queue and timers with it) and fonts. Audio,
+        # joysticks and the rest are never started.
+        pygame.display.init()
+        pygame.font.init()
         self.screen = pygame.display.set_mode(
             (self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        self.mark("display ready")
+        FONTS.preload(INTRO_FONT_SIZES, SANS_FONT)
+        self.mark("intro fonts loaded")
+
+        self.layers = LayerCache()
+        self.dirty = DirtyRegions()
+        self.scheduler = scheduler if scheduler is not None else \
+            FrameScheduler()
+        self.stimulus = StimulusScheduler()
+        self.digits = DigitAtlas()
+        self.results = results if results is not None else ResultsLog()
 
         # Create the lists
+        self._changing_buttons = []
         self.main_menu_buttons = []
         self.reaction_buttons = []
         self.number_buttons = []
         self.verbal_buttons = []
+        self.aim_buttons = []
 
-        # Create and append all the buttons
-        self.create_main_menu_buttons()
-        self.create_reaction_buttons()
-        self.create_number_buttons()
-        self.create_verbal_buttons()
+        # Create the scenes. Their buttons are added when they are built.
+        self.create_scenes()
+
+        self.profiler = profiler
+        if profiler is not None:
+            self.instrument(profiler)
 
         # Update/Flip the display.
         pygame.display.flip()
+        self.mark("screen created")
+
+    def game_rng(self, name: str) -> Optional[random.Random]:
+        """
+        Return the random number generator of the game called <name>, or
+        None if the games use the random module.
+        """
+        if self.seed is None:
+            return None
+        return random.Random(str(self.seed) + ":" + name)
+
+    def submit_score(self, game: str, score: float) -> None:
+        """
+        Submit <score> in the game called <game> to the score server, if
+        scores are submitted. This only queues the score, so it never holds
+        a frame up.
+        """
+        if self.scores is not None:
+            self.scores.submit(game, score)
+
+    def mark(self, step: str) -> None:
+        """
+        Record in timeline (if there is one) that <step> has just finished.
+        """
+        if self.timeline is not None:
+            self.timeline.mark(step)
+
+    # Create the scenes
+    def create_scenes(self) -> None:
+        """
+        Creates every scene and its dispatch table. Each scene's buttons are
+        added by its create_*_buttons method, the first time it is entered.
+        """
+        scenes = [
+            Scene(INTRO, self.draw_intro_frame, lambda: IDLE,
+                  {pygame.KEYDOWN: self.intro_key_handler,
+                   pygame.MOUSEBUTTONDOWN: self.leave_intro,
+                   pygame.MOUSEWHEEL: self.leave_intro,
+                   pygame.QUIT: self.quit_handler},
+                  [], presented=self.intro_presented),
+            Scene(MAIN_MENU, self.draw_main_menu_frame, lambda: IDLE,
+                  {pygame.KEYDOWN: self.escape_handler,
+                   pygame.QUIT: self.quit_handler},
+                  self.main_menu_buttons, POINTER_EVENTS,
+                  build=self.create_main_menu_buttons),
+            Scene(REACTION, self.draw_reaction_frame,
+                  lambda: PRECISE if self.react.start else IDLE,
+                  {STIMULUS_EVENT: self.stimulus_handler,
+                   pygame.KEYDOWN: self.escape_handler,
+                   pygame.QUIT: self.quit_handler},
+                  self.reaction_buttons, POINTER_EVENTS,
+                  enter=self.setup_reaction_game,
+                  presented=self.reaction_presented,
+                  build=self.create_reaction_buttons),
+            # pygame fills in the text typed by a key press from the text
+            # input event that follows it, so those must not be dropped.
+            Scene(NUMBER, self.draw_number_frame, lambda: ACTIVE,
+                  {pygame.MOUSEBUTTONDOWN: self.number_click_handler,
+                   pygame.KEYDOWN: self.number_key_handler,
+                   pygame.QUIT: self.quit_handler},
+                  self.number_buttons, (pygame.TEXTINPUT,),
+                  enter=self.setup_number_game,
+                  build=self.create_number_buttons),
+            Scene(VERBAL, self.draw_verbal_frame,
+                  lambda: IDLE if self._words_set_up else ACTIVE,
+                  {pygame.KEYDOWN: self.escape_handler,
+                   pygame.QUIT: self.quit_handler},
+                  self.verbal_buttons, POINTER_EVENTS,
+                  enter=self.setup_verbal_game,
+                  build=self.create_verbal_buttons),
+            Scene(AIM, self.draw_aim_frame,
+                  lambda: PRECISE if self.aim.begin else IDLE,
+                  {pygame.MOUSEBUTTONDOWN: self.aim_click_handler,
+                   pygame.KEYDOWN: self.escape_handler,
+                   pygame.QUIT: self.quit_handler},
+                  self.aim_buttons, POINTER_EVENTS,
+                  enter=self.setup_aim_game, presented=self.aim_presented,
+                  build=self.create_aim_buttons)
+        ]
+        self.scenes = {scene.name: scene for scene in scenes}
 
     # Create all the buttons
     def create_main_menu_buttons(self) -> None:
@@ -139,24 +343,33 @@ class Screen:
         """
         # Create main_menu's buttons
         reaction_time_button = Button(LIGHT_BROWN,
-                                      (self.SCREEN_WIDTH / 2) - 500,
+                                      (self.SCREEN_WIDTH / 2) - 575,
                                       (self.SCREEN_HEIGHT / 3), 250, 250, 30,
                                       "Reaction Time", BLACK, BLACK)
         number_memory_button = Button(LIGHT_BROWN,
-                                      (self.SCREEN_WIDTH / 2) - 125,
+                                      (self.SCREEN_WIDTH / 2) - 275,
                                       self.SCREEN_HEIGHT / 3, 250, 250, 30,
                                       "Number Memory", BLACK, BLACK)
         verbal_memory_button = Button(LIGHT_BROWN,
-                                      (self.SCREEN_WIDTH / 2) + 250,
+                                      (self.SCREEN_WIDTH / 2) + 25,
                                       self.SCREEN_HEIGHT / 3, 250, 250, 30,
                                       "Verbal Memory", BLACK, BLACK)
+        aim_trainer_button = Button(LIGHT_BROWN,
+                                    (self.SCREEN_WIDTH / 2) + 325,
+                                    self.SCREEN_HEIGHT / 3, 250, 250, 30,
+                                    "Aim Trainer", BLACK, BLACK)
         back_button = Button(BLACK, 15, 20, 100, 30, 20, "BACK", WHITE, WHITE)
 
-        # Append main_menu's buttons
-        self.main_menu_buttons.append(reaction_time_button)
-        self.main_menu_buttons.append(number_memory_button)
-        self.main_menu_buttons.append(verbal_memory_button)
-        self.main_menu_buttons.append(back_button)
+        # Add main_menu's buttons
+        menu = self.scenes[MAIN_MENU]
+        menu.add_button(reaction_time_button,
+                        lambda event: self.switch_to(REACTION))
+        menu.add_button(number_memory_button,
+                        lambda event: self.switch_to(NUMBER))
+        menu.add_button(verbal_memory_button,
+                        lambda event: self.switch_to(VERBAL))
+        menu.add_button(aim_trainer_button, lambda event: self.switch_to(AIM))
+        menu.add_button(back_button, lambda event: self.switch_to(INTRO))
 
     def create_reaction_buttons(self) -> None:
         """
@@ -168,8 +381,10 @@ class Screen:
                                  "Click to Begin!", DARK_BROWN, DARK_BROWN)
         back_button = Button(BLACK, 15, 20, 100, 30, 20, "BACK", WHITE, WHITE)
         self.react_button = reaction_button
-        self.reaction_buttons.append(back_button)
-        self.reaction_buttons.append(reaction_button)
+        self._changing_buttons.append(reaction_button)
+        reaction = self.scenes[REACTION]
+        reaction.add_button(back_button, self.reaction_back_action)
+        reaction.add_button(reaction_button, self.react_button_action)
 
     def create_number_buttons(self) -> None:
         """
@@ -181,8 +396,10 @@ class Screen:
                             DARK_GREY)
         back_button = Button(BLACK, 15, 20, 100, 30, 20, "BACK", WHITE, WHITE)
         self.textbox = input_rect
-        self.number_buttons.append(back_button)
-        self.number_buttons.append(input_rect)
+        self._changing_buttons.append(input_rect)
+        number = self.scenes[NUMBER]
+        number.add_button(back_button, lambda event: self.switch_to(MAIN_MENU))
+        number.add_button(input_rect, self.textbox_action)
 
     def create_verbal_buttons(self) -> None:
         """
@@ -195,344 +412,472 @@ class Screen:
                             self.SCREEN_HEIGHT / 3, 225, 75, 30,
                             "New", WHITE, WHITE)
         back_button = Button(BLACK, 15, 20, 100, 30, 20, "BACK", WHITE, WHITE)
-        self.verbal_buttons.append(back_button)
-        self.verbal_buttons.append(shown_button)
-        self.verbal_buttons.append(new_button)
+        endless_button = Button(DARK_GREY, self.SCREEN_WIDTH - 215, 20, 200,
+                                30, 20, "Endless: Off", WHITE, WHITE)
+        self.endless_button = endless_button
+        self._changing_buttons.append(endless_button)
+        verbal = self.scenes[VERBAL]
+        verbal.add_button(back_button, lambda event: self.switch_to(MAIN_MENU))
+        verbal.add_button(shown_button,
+                          lambda event: self.verbal_answer("Shown"))
+        verbal.add_button(new_button, lambda event: self.verbal_answer("New"))
+        verbal.add_button(endless_button, self.endless_action)
+
+    def create_aim_buttons(self) -> None:
+        """
+        Creates the aim trainer's buttons
+        """
+        start_button = Button(LIGHT_BROWN, (self.SCREEN_WIDTH / 2) - 350,
+                              AIM_AREA[1] + AIM_AREA[3] / 2 - 75, 700, 150,
+                              45, "Click to Begin!", DARK_BROWN, DARK_BROWN)
+        back_button = Button(BLACK, 15, 20, 100, 30, 20, "BACK", WHITE, WHITE)
+        self.aim_button = start_button
+        self._changing_buttons.append(start_button)
+        aim = self.scenes[AIM]
+        aim.add_button(back_button, lambda event: self.switch_to(MAIN_MENU))
+        aim.add_button(start_button, self.aim_button_action)
 
     # Helpful methods.
     @staticmethod
-    def text_obj(text: str, color: Tuple[int, int, int], font) -> Tuple:
+    def text_obj(text: str, color: Tuple[int, int, int], size: int) -> Tuple:
         """
-        Convert the string <text> into a text object in the game.
+        Convert the string <text> into a text object in the game, written in
+        SANS_FONT with point size <size>.
         """
-        screen_text = font.render(text, True, color)
+        screen_text = TEXT_CACHE.render(text, color, size, SANS_FONT)
         return screen_text, screen_text.get_rect()
 
-    def draw_background(self) -> None:
+    def draw_background(self, surface: pygame.Surface) -> None:
+        """
+        Simply draws the background color on <surface>.
+        """
+        surface.fill(self.BACKGROUND)
+
+    def draw_static_layer(self, name: str, variant, builder) -> None:
+        """
+        Blit the static layer of scene <name> (in layout <variant>) onto the
+        screen. The layer is composed once by calling <builder> with a blank
+        surface, and is composed again only when the layout variant or the
+        window size changes.
+        """
+        layer = self.layers.get(name, variant, self.screen.get_size(),
+                                builder)
+        self.screen.blit(layer, (0, 0))
+        self.dirty.track("layer", self.screen.get_rect(),
+                         (name, variant, id(layer)))
+
+    def button_state(self, button: Button) -> str:
+        """
+        Return the state <button> is drawn in this frame.
+        """
+        if button is not self.hovered:
+            return NORMAL
+        return PRESSED if self.mouse_down else HOVER
+
+    def draw_buttons(self, buttons: List[Button]) -> None:
+        """
+        Draw every button in <buttons> that differs from its idle look, all
+        with one batched blit, and report the area of each one that looks
+        different from the last frame as dirty.
+        """
+        sequence = []
+        for button in buttons:
+            state = self.button_state(button)
+            if self.is_static_button(button) and state == NORMAL:
+                continue
+            sprite, rect = button.sprite(state)
+            sequence.append((sprite, rect))
+            self.dirty.track(("button", id(button)), rect,
+                             (button.appearance(), state))
+        self.screen.blits(sequence, False)
+
+    def blit_text(self, key: str, text: str, color: Tuple[int, int, int],
+                  size: int, center: Tuple[float, float]) -> None:
+        """
+        Draw <text> centered at <center> on the screen and report its area as
+        dirty if it changed since the last frame. <key> names this piece of
+        text within the scene.
+        """
+        screen_text, text_rect = self.text_obj(text, color, size)
+        text_rect.center = center
+        self.screen.blit(screen_text, text_rect)
+        self.dirty.track(("text", key), text_rect, (text, color, size))
+
+    def is_static_button(self, button: Button) -> bool:
+        """
+        Return whether <button> only ever changes appearance when hovered, so
+        its idle look can be baked into a scene's static layer.
+        """
+        return all(button is not changing
+                   for changing in self._changing_buttons)
+
+    def draw_idle_buttons(self, surface: pygame.Surface,
+                          buttons: List[Button]) -> None:
+        """
+        Draw the idle look of every static button in <buttons> on <surface>.
+        """
+        for button in buttons:
+            if self.is_static_button(button):
+                button.draw(surface)
+
+    def switch_to(self, name: str) -> None:
+        """
+        Leave the current scene for the scene called <name>.
+        """
+        self.current_scene = name
+
+    def quit_handler(self, event: pygame.event.Event) -> None:
+        """
+        Ends the game, for the quit <event>.
+        """
+        self.game_running = False
+
+    def escape_handler(self, event: pygame.event.Event) -> None:
         """
-        Simply draws the background color.
+        Ends the game if the key press <event> is the escape key.
         """
-        self.screen.fill(self.BACKGROUND)
+        if event.key == pygame.K_ESCAPE:
+            self.game_running = False
 
     # Game Intro methods
-    def draw_game_intro(self) -> None:
+    def draw_game_intro(self, surface: pygame.Surface) -> None:
         """
         A helper method for game_intro.
-        This method draws the text and background for the game intro.
+        This method draws the text and background for the game intro on
+        <surface>.
         """
-        intro_font = pygame.font.Font(SANS_FONT, 100)
-        sub_font = pygame.font.Font(SANS_FONT, 35)
-        text, text_rect = self.text_obj("Adam's Benchmark Tests", BLACK,
-                                        intro_font)
+        self.draw_background(surface)
+        text, text_rect = self.text_obj("Adam's Benchmark Tests", BLACK, 100)
         subtext, subtext_rect = self.text_obj("Press Any Key to Begin", GREY,
-                                              sub_font)
+                                              35)
         text_rect.center = (self.SCREEN_WIDTH / 2), (self.SCREEN_HEIGHT / 2)
         subtext_rect.center = (self.SCREEN_WIDTH / 2), \
                               (2 * self.SCREEN_HEIGHT / 3)
-        self.screen.blit(text, text_rect)
-        self.screen.blit(subtext, subtext_rect)
-
-    def game_intro(self) -> None:
-        """
-        Runs the opening scene.
-        """
-        while self.intro_running and self.game_running:
-            self.draw_background()
-            self.draw_game_intro()
-            pygame.display.update()
-            for event in pygame.event.get():
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.intro_running = False
-                        self.game_running = False
-                    else:
-                        self.intro_running = False
-                        self.main_running = True
-                elif event.type == pygame.MOUSEBUTTONDOWN or \
-                        event.type == pygame.MOUSEWHEEL:
-                    self.intro_running = False
-                    self.main_running = True
-                if event.type == pygame.QUIT:
-                    self.intro_running = False
-                    self.game_running = False
+        surface.blit(text, text_rect)
+        surface.blit(subtext, subtext_rect)
+
+    def draw_intro_frame(self) -> None:
+        """
+        Draws a frame of the opening scene.
+        """
+        self.draw_static_layer("intro", None, self.draw_game_intro)
+
+    def intro_key_handler(self, event: pygame.event.Event) -> None:
+        """
+        Ends the game if the key press <event> is the escape key, and goes to
+        the main menu for any other key.
+        """
+        if event.key == pygame.K_ESCAPE:
+            self.game_running = False
+        else:
+            self.switch_to(MAIN_MENU)
+
+    def intro_presented(self) -> None:
+        """
+        Once the intro is on screen, starts the work it did not need to wait
+        for: loading the verbal game's words (in the background) and the
+        rest of the fonts.
+        """
+        if self._warmed_up:
+            return
+        self._warmed_up = True
+        self.mark("intro presented")
+        self.words.load_async(self.background)
+        FONTS.preload(FONT_SIZES, SANS_FONT)
+        self.mark("fonts loaded")
+
+    def leave_intro(self, event: pygame.event.Event) -> None:
+        """
+        Goes to the main menu, for the mouse <event>.
+        """
+        self.switch_to(MAIN_MENU)
 
     # Main Menu methods
-    def draw_main_menu_text(self) -> None:
+    def draw_main_menu_text(self, surface: pygame.Surface) -> None:
         """
-        Draws the main menu text
+        Draws the main menu's static layer (background, text and idle buttons)
+        on <surface>.
         """
-        main_menu_font = pygame.font.Font(SANS_FONT, 60)
-        text, text_rect = self.text_obj("Choose any game!", BLACK,
-                                        main_menu_font)
+        self.draw_background(surface)
+        text, text_rect = self.text_obj("Choose any game!", BLACK, 60)
         text_rect.center = (self.SCREEN_WIDTH / 2), \
                            (self.SCREEN_HEIGHT / 12)
-        self.screen.blit(text, text_rect)
-
-    def main_menu_button_event_handler(self) -> None:
-        """
-        Precondition: the mouse is hovering over <button> on the main menu.
-        A helper for draw_main_menu_buttons
-        """
-        for button in self.main_menu_buttons:
-            if button.is_hover(pygame.mouse.get_pos()):
-                self.main_running = False
-                if button.text == "Reaction Time":
-                    self.reaction_running = True
-                elif button.text == "Number Memory":
-                    self.number_running = True
-                elif button.text == "Verbal Memory":
-                    self.verbal_running = True
-                elif button.text == "BACK":
-                    self.intro_running = True
-                else:
-                    # Something may be wrong, so stay on main menu.
-                    self.main_running = True
+        surface.blit(text, text_rect)
+        self.draw_idle_buttons(surface, self.main_menu_buttons)
 
     def draw_main_menu_buttons(self) -> None:
         """
-        Draws the main menu buttons.
-        """
-        for button in self.main_menu_buttons:
-            orig_button_color = button.color
-            if button.is_hover(pygame.mouse.get_pos()):
-                button.color = (button.color[0] + (255 -
-                                                   button.color[0]) * 0.3,
-                                button.color[1] + (255 -
-                                                   button.color[1]) * 0.3,
-                                button.color[2] + (255 -
-                                                   button.color[2]) * 0.3)
-            button.draw(self.screen)
-            button.color = orig_button_color
-
-    def main_menu(self) -> None:
-        """
-        Runs the main menu scene.
-        """
-        while self.main_running and self.game_running:
-            self.draw_background()
-            self.draw_main_menu_text()
-            self.draw_main_menu_buttons()
-            pygame.display.update()
-            for event in pygame.event.get():
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    self.main_menu_button_event_handler()
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.main_running = False
-                        self.game_running = False
-                if event.type == pygame.QUIT:
-                    self.main_running = False
-                    self.game_running = False
+        Draws the main menu buttons that differ from their idle look.
+        """
+        self.draw_buttons(self.main_menu_buttons)
+
+    def draw_main_menu_frame(self) -> None:
+        """
+        Draws a frame of the main menu scene.
+        """
+        self.draw_static_layer("main_menu", None, self.draw_main_menu_text)
+        self.draw_main_menu_buttons()
 
     # Reaction Game's methods
-    def draw_reaction_text(self) -> None:
+    def draw_reaction_text(self, surface: pygame.Surface) -> None:
         """
-        Draws the reaction game's text.
+        Draws the reaction game's static layer (background, text and idle
+        buttons) on <surface>.
         """
-        title_font = pygame.font.Font(SANS_FONT, 60)
-        text, text_rect = self.text_obj("Reaction Time Test", BLACK,
-                                        title_font)
+        self.draw_background(surface)
+        text, text_rect = self.text_obj("Reaction Time Test", BLACK, 60)
         text_rect.center = (self.SCREEN_WIDTH / 2), \
                            (self.SCREEN_HEIGHT / 12)
-        desc_font = pygame.font.Font(SANS_FONT, 20)
-        description = 'As soon as the screen changes color and you see the' \
-                      ' word "Go!", click as fast as you can to find your' \
-                      ' reaction speed.'
-        desc_text, desc_rect = self.text_obj(description, DARK_BROWN,
-                                             desc_font)
+        description = 'As soon as you see the word "Go!", click as fast as' \
+                      ' you can. Your reaction speed is the average of ' + \
+                      str(self.react.trials) + ' tries.'
+        desc_text, desc_rect = self.text_obj(description, DARK_BROWN, 20)
         desc_rect.center = (self.SCREEN_WIDTH / 2, self.SCREEN_HEIGHT / 6)
-        self.screen.blit(text, text_rect)
-        self.screen.blit(desc_text, desc_rect)
-
-    def reaction_button_event_handler(self) -> None:
-        """
-        The event handler for the buttons of the reaction game.
-        """
-        for button in self.reaction_buttons:
-            if button.is_hover(pygame.mouse.get_pos()):
-                if button.text == "BACK":
-                    self.reaction_running = False
-                    self.main_running = True
-                elif button == self.react_button:
-                    if self.react.start is False and self.react.failed:
-                        self.react.setup()
-                    elif self.react.start is False:
-                        self.react_button.color = ALT_RED
-                        self.react_button.outline = RED
-                        self.react_button.text_color = WHITE
-                        self.react_button.font_size = 70
-                        self.react_button.text = "Wait!"
-                        self.react.start = True
-                        self._start_time = time.time()
-                    elif time.time() - self._start_time < self.react.wait_time:
-                        self.react.failed = True
-                        self.react.start = False
-                    elif time.time() - self._start_time > self.react.wait_time:
-                        self.react.reaction_speed = time.time() - \
-                                                    self._start_time - \
-                                                    self.react.wait_time
-                        self.react_button.text = \
-                            str(int(self.react.reaction_speed * 1000)) + " ms"
-                        self.react.start = False
-                else:
-                    # Something may be wrong, so stay on reaction game.
-                    self.reaction_running = True
+        surface.blit(text, text_rect)
+        surface.blit(desc_text, desc_rect)
+        self.draw_idle_buttons(surface, self.reaction_buttons)
+
+    def cancel_stimulus(self) -> None:
+        """
+        Forgets the reaction game's armed "GO!", if any, along with the frame
+        deadline it asked the scheduler for.
+        """
+        self.stimulus.cancel()
+        self.scheduler.wake_at(None)
+
+    def reaction_back_action(self, event: pygame.event.Event) -> None:
+        """
+        Goes back to the main menu from the reaction game, for the click
+        <event>.
+        """
+        self.cancel_stimulus()
+        self.switch_to(MAIN_MENU)
+
+    def react_button_action(self, event: pygame.event.Event) -> None:
+        """
+        The action of the reaction game's main button, for the click <event>.
+        The click is timed from <event>'s arrival time rather than from when
+        it is handled, and measured from when "GO!" was actually presented,
+        so slow frames do not inflate the reaction time.
+        """
+        if self.react.start is False and self.react.failed:
+            self.react.setup()
+        elif self.react.start is False:
+            if self.react.session_done():
+                self.react.new_session()
+            self.react_button.color = ALT_RED
+            self.react_button.outline = RED
+            self.react_button.text_color = WHITE
+            self.react_button.font_size = 70
+            self.react_button.text = "Wait!"
+            self.react.start = True
+            self.react.generate_wait_time()
+            self.stimulus.arm(self.react.wait_time, self.scheduler.now())
+            self.scheduler.wake_at(self.stimulus.due_at)
+        elif self.stimulus.presented_at is None or \
+                event.arrived < self.stimulus.presented_at:
+            self.react.failed = True
+            self.react.start = False
+            self.cancel_stimulus()
+        else:
+            self.react.record(event.arrived - self.stimulus.presented_at,
+                              event.arrival_error)
+            if self.react.session_done():
+                self.react_button.text = self.react.session_text()
+                self.submit_score(REACTION, self.react.stats.mean)
+            else:
+                self.react_button.text = self.react.result_text()
+            self.results.record(REACTION, self.react.reaction_speed)
+
+    def stimulus_handler(self, event: pygame.event.Event) -> None:
+        """
+        Fires "GO!" if it is due, for the stimulus timer's <event>.
+        """
+        self.stimulus.check(event.arrived)
 
     def draw_reaction_buttons(self) -> None:
         """
         Draws the buttons required for the reaction game.
         """
-        for button in self.reaction_buttons:
-            if time.time() - self._start_time >= self.react.wait_time and \
-                    self.react.start:
-                if button == self.react_button:
-                    self.react_button.color = JADE
-                    self.react_button.text = "GO!"
-                    self.react_button.outline = GREEN
-            elif self.react.failed is True:
-                self.react_button.text = "Woah! Try again!"
-                self.react_button.color = ORANGE
-                self.react_button.outline = ORANGE
-                self.react_button.text_color = RED
-            orig_button_color = button.color
-            if button.is_hover(pygame.mouse.get_pos()):
-                button.color = (button.color[0] + (255 -
-                                                   button.color[0]) * 0.3,
-                                button.color[1] + (255 -
-                                                   button.color[1]) * 0.3,
-                                button.color[2] + (255 -
-                                                   button.color[2]) * 0.3)
-            button.draw(self.screen)
-            button.color = orig_button_color
-
-    def reaction_game(self) -> None:
-        """
-        Runs the reaction time benchmark/game.
+        self.stimulus.check(self.scheduler.now())
+        if self.stimulus.fired and self.react.start:
+            self.react_button.color = JADE
+            self.react_button.text = "GO!"
+            self.react_button.outline = GREEN
+        elif self.react.failed is True:
+            self.react_button.text = "Woah! Try again!"
+            self.react_button.color = ORANGE
+            self.react_button.outline = ORANGE
+            self.react_button.text_color = RED
+        self.draw_buttons(self.reaction_buttons)
+
+    def draw_reaction_stats(self) -> None:
+        """
+        Draws the session's progress and statistics under the reaction
+        game's button, once a trial has been recorded.
+        """
+        if self.react.stats.count > 0 or self.react.rejected > 0:
+            self.blit_text("stats", self.react.stats_text(), DARK_BROWN, 20,
+                           (self.SCREEN_WIDTH / 2, self.SCREEN_HEIGHT - 20))
+
+    def setup_reaction_game(self) -> None:
+        """
+        Sets up the reaction time benchmark/game, starting a new session.
         """
         self.react.setup()
+        self.react.new_session()
+        self.cancel_stimulus()
         self.react_button.text = "Click to Begin!"
         self.react_button.font_size = 45
         self.react_button.outline = DARK_BROWN
         self.react_button.color = LIGHT_BROWN
         self.react_button.text_color = DARK_BROWN
-        while self.reaction_running and self.game_running:
-            self.draw_background()
-            self.draw_reaction_text()
-            self.draw_reaction_buttons()
-            pygame.display.update()
-            for event in pygame.event.get():
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    self.reaction_button_event_handler()
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.reaction_running = False
-                        self.game_running = False
-                if event.type == pygame.QUIT:
-                    self.reaction_running = False
-                    self.game_running = False
+
+    def draw_reaction_frame(self) -> None:
+        """
+        Draws a frame of the reaction time benchmark/game.
+        """
+        self.draw_static_layer("reaction", None, self.draw_reaction_text)
+        self.draw_reaction_buttons()
+        self.draw_reaction_stats()
+
+    def reaction_presented(self) -> None:
+        """
+        Records when "GO!" was first presented, once a frame showing it has
+        been sent to the display.
+        """
+        if self.stimulus.fired and self.react.start:
+            self.stimulus.mark_presented(self.scheduler.now())
 
     # Number game's methods
-    def draw_number_text(self) -> None:
+    def draw_number_static(self, surface: pygame.Surface) -> None:
         """
-        Draws the number game's text.
+        Draws the number game's static layer (background, text, the score
+        heading once the game has begun and idle buttons) on <surface>.
         """
-        title_font = pygame.font.Font(SANS_FONT, 60)
-        text, text_rect = self.text_obj("Number Memory Test", BLACK,
-                                        title_font)
+        self.draw_background(surface)
+        text, text_rect = self.text_obj("Number Memory Test", BLACK, 60)
         text_rect.center = (self.SCREEN_WIDTH / 2), \
                            (self.SCREEN_HEIGHT / 12)
-        desc_font = pygame.font.Font(SANS_FONT, 20)
         description = 'Try to remember as many digits as possible!' \
                       ' The numbers of digits increase at every level.'
-        desc_text, desc_rect = self.text_obj(description, DARK_BROWN,
-                                             desc_font)
+        desc_text, desc_rect = self.text_obj(description, DARK_BROWN, 20)
         desc_rect.center = (self.SCREEN_WIDTH / 2, self.SCREEN_HEIGHT / 6)
         if self.numbers.begin is True:
-            point_text, point_rect = self.text_obj("Score", ALT_RED, title_font)
+            point_text, point_rect = self.text_obj("Score", ALT_RED, 60)
             point_rect.center = \
                 (self.SCREEN_WIDTH / 1.19, self.SCREEN_HEIGHT / 4)
-            pygame.draw.line(self.screen, ALT_RED,
+            pygame.draw.line(surface, ALT_RED,
                              (self.SCREEN_WIDTH / 1.3,
                               self.SCREEN_HEIGHT / 3.4),
                              (self.SCREEN_WIDTH / 1.1,
                               self.SCREEN_HEIGHT / 3.4),
                              3)
-            num_font = pygame.font.Font(SANS_FONT, 70)
-            num_text, num_rect = self.text_obj(str(self.numbers.points),
-                                               ALT_RED, num_font)
-            num_rect.center = \
-                (self.SCREEN_WIDTH / 1.19, self.SCREEN_HEIGHT / 2.7)
-            self.screen.blit(point_text, point_rect)
-            self.screen.blit(num_text, num_rect)
-        if time.time() - self._start_time < self.numbers.time_on_screen:
+            surface.blit(point_text, point_rect)
+        surface.blit(text, text_rect)
+        surface.blit(desc_text, desc_rect)
+        self.draw_idle_buttons(surface, self.number_buttons)
+
+    def draw_number_text(self) -> None:
+        """
+        Draws the number game's changing text (the score and the number).
+        """
+        if self.numbers.begin is True:
+            self.blit_text("score", str(self.numbers.points), ALT_RED, 70,
+                           (self.SCREEN_WIDTH / 1.19,
+                            self.SCREEN_HEIGHT / 2.7))
+        if self.scheduler.now() - self._start_time < \
+                self.numbers.time_on_screen:
             self.can_type = False
-            number_font = pygame.font.Font(SANS_FONT, 60)
-            number, number_rect = \
-                self.text_obj(self.numbers.curr_num, BLACK, number_font)
+            number = self.digits.render(self.numbers.curr_num, BLACK,
+                                        *NUMBER_AREA)
+            number_rect = number.get_rect()
             number_rect.center = \
                 (self.SCREEN_WIDTH / 2), (self.SCREEN_HEIGHT / 2)
             self.screen.blit(number, number_rect)
+            self.dirty.track(("text", "number"), number_rect,
+                             self.numbers.curr_num)
         else:
             self.can_type = True
-        self.screen.blit(text, text_rect)
-        self.screen.blit(desc_text, desc_rect)
-
-    def number_button_event_handler(self) -> None:
-        """
-        The event handler for the buttons of the number game.
-        """
-        for button in self.number_buttons:
-            if button.is_hover(pygame.mouse.get_pos()):
-                if button.text == "BACK":
-                    self.number_running = False
-                    self.main_running = True
-                elif button == self.textbox:
-                    self.textbox.outline = BLUE
-                    self.clicked_textbox = True
-                    self.textbox.font_size = 50
+
+    def textbox_action(self, event: pygame.event.Event) -> None:
+        """
+        Lets the user type in the number game's text box, for the click
+        <event>.
+        """
+        self.textbox.outline = BLUE
+        self.clicked_textbox = True
+        self.textbox.font_size = 50
+        self.textbox.text = ""
+        self.textbox.text_color = BLACK
+
+    def number_click_handler(self, event: pygame.event.Event) -> None:
+        """
+        The event handler for clicks in the number game, for the click
+        <event>. Clicking anywhere but the text box puts its hint back.
+        """
+        number = self.scenes[NUMBER]
+        if number.button_at(event.pos) is not self.textbox:
+            self.textbox.text_color = DARK_GREY
+            self.textbox.font_size = 40
+            if self.numbers.begin is False:
+                self.textbox.text = 'Write "start" and press enter to begin!'
+            else:
+                self.textbox.text = 'Write the number here!'
+            self.clicked_textbox = False
+        number.click(event)
+
+    def draw_number_buttons(self) -> None:
+        """
+        Draws the number game's buttons that differ from their idle look.
+        """
+        if self.hovered is self.textbox:
+            self.textbox.outline = BLUE
+        elif self.clicked_textbox is False:
+            self.textbox.outline = None
+        self.draw_buttons(self.number_buttons)
+
+    def number_key_handler(self, event: pygame.event.Event) -> None:
+        """
+        The event handler for key presses in the number game, for the key
+        press <event>.
+        """
+        if event.key == pygame.K_ESCAPE:
+            self.game_running = False
+        elif event.key == pygame.K_BACKSPACE and self.clicked_textbox:
+            self.textbox.text = self.textbox.text[:-1]
+        elif event.key == pygame.K_RETURN and self.clicked_textbox \
+                and self.numbers.begin is False:
+            if self.textbox.text.lower() == "start":
+                self._start_time = self.scheduler.now()
+                self.textbox.text = ""
+                self.numbers.begin = True
+                self.can_type = False
+        elif event.key == pygame.K_RETURN and self.clicked_textbox \
+                and self.numbers.begin is True:
+            if self.textbox.text.strip().isnumeric():
+                temp = self.textbox.text
+                if self.numbers.is_correct(self.textbox.text.strip()):
+                    self._start_time = self.scheduler.now()
                     self.textbox.text = ""
-                    self.textbox.text_color = BLACK
                 else:
-                    # Something may be wrong, so stay on reaction game.
-                    self.number_running = True
-            else:
-                if self.clicked_textbox is False \
-                        and self.numbers.begin is False:
-                    self.textbox.text_color = DARK_GREY
-                    self.textbox.font_size = 40
-                    self.textbox.text = \
-                        'Write "start" and press enter to begin!'
-                elif self.clicked_textbox is False and self.numbers.begin:
+                    self.results.record(NUMBER, self.numbers.points,
+                                        len(self.numbers.curr_num))
+                    self.submit_score(NUMBER, self.numbers.points)
+                    self._start_time = 0
                     self.textbox.text_color = DARK_GREY
                     self.textbox.font_size = 40
-                    self.textbox.text = \
-                        'Write the number here!'
-                self.clicked_textbox = False
+                    self.clicked_textbox = False
+                    self.textbox.text = 'Click again and write "start"'
+                    self.can_type = True
+                self.numbers.answer(temp.strip())
+        else:
+            if self.clicked_textbox and self.can_type:
+                self.textbox.text += event.unicode
 
-    def draw_number_buttons(self) -> None:
+    def setup_number_game(self) -> None:
         """
-        Draws the buttons required for the number game.
-        """
-        for button in self.number_buttons:
-            orig_button_color = button.color
-            if button.is_hover(pygame.mouse.get_pos()):
-                button.color = (button.color[0] + (255 -
-                                                   button.color[0]) * 0.3,
-                                button.color[1] + (255 -
-                                                   button.color[1]) * 0.3,
-                                button.color[2] + (255 -
-                                                   button.color[2]) * 0.3)
-            if button.color == WHITE and \
-                    button.is_hover(pygame.mouse.get_pos()):
-                button.outline = BLUE
-            elif button.color == WHITE and self.clicked_textbox is False:
-                button.outline = None
-            button.draw(self.screen)
-            button.color = orig_button_color
-
-    def number_game(self) -> None:
-        """
-        Runs the number memory benchmark/game.
+        Sets up the number memory benchmark/game.
         """
         self.numbers.setup()
         self._start_time = 0
@@ -541,148 +886,354 @@ class Screen:
         self.textbox.text = 'Write "start" and press enter to begin!'
         self.clicked_textbox = False
         self.can_type = True
-        while self.number_running and self.game_running:
-            self.draw_background()
-            self.draw_number_text()
-            self.draw_number_buttons()
-            pygame.display.update()
-            for event in pygame.event.get():
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    self.number_button_event_handler()
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.number_running = False
-                        self.game_running = False
-                    elif event.key == pygame.K_BACKSPACE and \
-                            self.clicked_textbox:
-                        self.textbox.text = self.textbox.text[:-1]
-                    elif event.key == pygame.K_RETURN and self.clicked_textbox \
-                            and self.numbers.begin is False:
-                        if self.textbox.text.lower() == "start":
-                            self._start_time = time.time()
-                            self.textbox.text = ""
-                            self.numbers.begin = True
-                            self.can_type = False
-                    elif event.key == pygame.K_RETURN and self.clicked_textbox \
-                            and self.numbers.begin is True:
-                        if self.textbox.text.strip().isnumeric():
-                            temp = self.textbox.text
-                            if self.numbers.is_correct(
-                                    self.textbox.text.strip()):
-                                self._start_time = time.time()
-                                self.textbox.text = ""
-                            else:
-                                self._start_time = 0
-                                self.textbox.text_color = DARK_GREY
-                                self.textbox.font_size = 40
-                                self.clicked_textbox = False
-                                self.textbox.text = \
-                                    'Click again and write "start"'
-                                self.can_type = True
-                            self.numbers.answer(temp.strip())
-                    else:
-                        if self.clicked_textbox and self.can_type:
-                            self.textbox.text += event.unicode
-                if event.type == pygame.QUIT:
-                    self.number_running = False
-                    self.game_running = False
+
+    def draw_number_frame(self) -> None:
+        """
+        Draws a frame of the number memory benchmark/game.
+        """
+        self.draw_static_layer("number", self.numbers.begin,
+                               self.draw_number_static)
+        self.draw_number_text()
+        self.draw_number_buttons()
 
     # Verbal game's methods
-    def draw_verbal_text(self) -> None:
+    def draw_verbal_static(self, surface: pygame.Surface) -> None:
         """
-        Draws the verbal game's text.
+        Draws the verbal game's static layer (background, text, the score
+        heading and idle buttons) on <surface>.
         """
-        title_font = pygame.font.Font(SANS_FONT, 60)
-        text, text_rect = self.text_obj("Verbal Memory Test", BLACK,
-                                        title_font)
+        self.draw_background(surface)
+        text, text_rect = self.text_obj("Verbal Memory Test", BLACK, 60)
         text_rect.center = (self.SCREEN_WIDTH / 2), \
                            (self.SCREEN_HEIGHT / 12)
-        desc_font = pygame.font.Font(SANS_FONT, 20)
         description = 'Words will be shown once at a time, if the word' \
                       ' has been shown, click "shown", and if not, click "new".'
-        desc_text, desc_rect = self.text_obj(description, DARK_BROWN,
-                                             desc_font)
+        desc_text, desc_rect = self.text_obj(description, DARK_BROWN, 20)
         desc_rect.center = (self.SCREEN_WIDTH / 2, self.SCREEN_HEIGHT / 6)
-        word_font = pygame.font.Font(SANS_FONT, 60)
-        word_text, word_rect = self.text_obj(self.words.curr_word, BLACK,
-                                             word_font)
-        word_rect.center = (self.SCREEN_WIDTH / 2, self.SCREEN_HEIGHT / 2)
-        point_text, point_rect = self.text_obj("Score", ALT_RED, word_font)
+        point_text, point_rect = self.text_obj("Score", ALT_RED, 60)
         point_rect.center = (self.SCREEN_WIDTH / 1.19, self.SCREEN_HEIGHT / 3.2)
-        pygame.draw.line(self.screen, ALT_RED,
+        pygame.draw.line(surface, ALT_RED,
                          (self.SCREEN_WIDTH / 1.3, self.SCREEN_HEIGHT / 2.83),
                          (self.SCREEN_WIDTH / 1.1, self.SCREEN_HEIGHT / 2.83),
                          3)
-        num_font = pygame.font.Font(SANS_FONT, 70)
-        num_text, num_rect = self.text_obj(str(self.words.points), ALT_RED,
-                                           num_font)
-        num_rect.center = (self.SCREEN_WIDTH / 1.19, self.SCREEN_HEIGHT / 2.1)
-        self.screen.blit(text, text_rect)
-        self.screen.blit(desc_text, desc_rect)
-        self.screen.blit(word_text, word_rect)
-        self.screen.blit(point_text, point_rect)
-        self.screen.blit(num_text, num_rect)
-
-    def verbal_button_event_handler(self) -> None:
-        """
-        The event handler for the buttons of the verbal game.
-        """
-        for button in self.verbal_buttons:
-            if button.is_hover(pygame.mouse.get_pos()):
-                if button.text == "BACK":
-                    self.verbal_running = False
-                    self.main_running = True
-                elif button.text == "New" or button.text == "Shown":
-                    self.words.answer(button.text)
-                else:
-                    # Something may be wrong, so stay on reaction game.
-                    self.verbal_running = True
+        surface.blit(text, text_rect)
+        surface.blit(desc_text, desc_rect)
+        surface.blit(point_text, point_rect)
+        self.draw_idle_buttons(surface, self.verbal_buttons)
+
+    def draw_verbal_text(self) -> None:
+        """
+        Draws the verbal game's changing text (the word and the score).
+        """
+        self.blit_text("word", self.words.curr_word, BLACK, 60,
+                       (self.SCREEN_WIDTH / 2, self.SCREEN_HEIGHT / 2))
+        self.blit_text("score", str(self.words.points), ALT_RED, 70,
+                       (self.SCREEN_WIDTH / 1.19, self.SCREEN_HEIGHT / 2.1))
+
+    def draw_verbal_loading(self) -> None:
+        """
+        Draws a loading message while the verbal game's words are loading.
+        """
+        dots = "." * (int(self.scheduler.now() * 3) % 3 + 1)
+        self.blit_text("word", "Loading words" + dots, GREY, 60,
+                       (self.SCREEN_WIDTH / 2, self.SCREEN_HEIGHT / 2))
+
+    def verbal_answer(self, answer: str) -> None:
+        """
+        Answers the verbal game's current word with <answer> ("New" or
+        "Shown"), once the game is set up. A game that was lost or finished
+        is scored and a new one is started.
+        """
+        if self._words_set_up:
+            if not self.words.is_correct(answer):
+                self.record_verbal_score()
+            self.words.answer(answer)
+            if self.words.finished:
+                self.record_verbal_score()
+                self.words.setup()
+
+    def record_verbal_score(self) -> None:
+        """
+        Logs and submits the score of the verbal game that just ended.
+        """
+        self.results.record(VERBAL, self.words.points,
+                            int(self.words.endless))
+        self.submit_score(VERBAL, self.words.points)
+
+    def endless_action(self, event: pygame.event.Event) -> None:
+        """
+        Switches the verbal game's endless mode on or off and starts a new
+        game, for the click <event>.
+        """
+        if self._words_set_up:
+            self.words.endless = not self.words.endless
+            self.endless_button.text = \
+                "Endless: On" if self.words.endless else "Endless: Off"
+            self.words.setup()
 
     def draw_verbal_buttons(self) -> None:
         """
-        Draws the buttons required for the verbal game.
+        Draws the verbal game's buttons that differ from their idle look.
+        """
+        self.draw_buttons(self.verbal_buttons)
+
+    def setup_verbal_game(self) -> None:
+        """
+        Sets up the verbal memory benchmark/game, starting to load its words
+        if the intro has not already. The game itself is set up by the first
+        frame after its words have loaded.
         """
-        for button in self.verbal_buttons:
-            orig_button_color = button.color
-            if button.is_hover(pygame.mouse.get_pos()):
-                button.color = (button.color[0] + (255 -
-                                                   button.color[0]) * 0.3,
-                                button.color[1] + (255 -
-                                                   button.color[1]) * 0.3,
-                                button.color[2] + (255 -
-                                                   button.color[2]) * 0.3)
-            button.draw(self.screen)
-            button.color = orig_button_color
+        self._words_set_up = False
+        self.words.load_async(self.background)
 
-    def verbal_game(self) -> None:
+    def draw_verbal_frame(self) -> None:
         """
-        Runs the verbal memory benchmark/game.
+        Draws a frame of the verbal memory benchmark/game.
+        Until the words have finished loading in the background, a loading
+        message is shown instead of the game.
         """
-        self.words.setup()
-        while self.verbal_running and self.game_running:
-            self.draw_background()
+        if not self._words_set_up and \
+                self.scheduler.is_done(self.words.ready):
+            self.words.setup()
+            self._words_set_up = True
+        self.draw_static_layer("verbal", None, self.draw_verbal_static)
+        if self._words_set_up:
             self.draw_verbal_text()
-            self.draw_verbal_buttons()
-            pygame.display.update()
-            for event in pygame.event.get():
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    self.verbal_button_event_handler()
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        self.verbal_running = False
-                        self.game_running = False
-                if event.type == pygame.QUIT:
-                    self.verbal_running = False
-                    self.game_running = False
-
-    # This method runs the entire game.
+        else:
+            self.draw_verbal_loading()
+        self.draw_verbal_buttons()
+
+    # Aim trainer's methods
+    def draw_aim_static(self, surface: pygame.Surface) -> None:
+        """
+        Draws the aim trainer's static layer (background, text and idle
+        buttons) on <surface>.
+        """
+        self.draw_background(surface)
+        text, text_rect = self.text_obj("Aim Trainer", BLACK, 60)
+        text_rect.center = (self.SCREEN_WIDTH / 2), \
+                           (self.SCREEN_HEIGHT / 12)
+        description = 'Click the targets as fast as you can! Every target' \
+                      ' you hit is replaced by a new one, until ' + \
+                      str(self.aim.total_targets) + ' have been hit.'
+        desc_text, desc_rect = self.text_obj(description, DARK_BROWN, 20)
+        desc_rect.center = (self.SCREEN_WIDTH / 2, self.SCREEN_HEIGHT / 6)
+        surface.blit(text, text_rect)
+        surface.blit(desc_text, desc_rect)
+        self.draw_idle_buttons(surface, self.aim_buttons)
+
+    def draw_aim_targets(self) -> None:
+        """
+        Draws the aim trainer's targets and how many are left to hit.
+        """
+        if not self.aim.begin:
+            return
+        left = self.aim.total_targets - len(self.aim.hit_times)
+        self.blit_text("targets left", "Targets left: " + str(left), ALT_RED,
+                       30, (self.SCREEN_WIDTH / 2, AIM_AREA[1] - 15))
+        for target in self.aim.targets:
+            center = (round(target.x), round(target.y))
+            pygame.draw.circle(self.screen, RED, center, target.radius)
+            pygame.draw.circle(self.screen, WHITE, center,
+                               target.radius * 2 / 3)
+            pygame.draw.circle(self.screen, RED, center, target.radius / 3)
+        self.dirty.track(("aim", "targets"), pygame.Rect(AIM_AREA),
+                         self.aim.changes)
+
+    def aim_button_action(self, event: pygame.event.Event) -> None:
+        """
+        Starts a game of the aim trainer, for the click <event>.
+        """
+        if not self.aim.begin:
+            self.aim.start()
+
+    def aim_click_handler(self, event: pygame.event.Event) -> None:
+        """
+        The event handler for clicks in the aim trainer, for the click
+        <event>. During a game, clicks in the target area shoot at the
+        targets, and the time from a target being presented to <event>
+        arriving is recorded for every target hit.
+        """
+        if self.aim.begin and self.aim.in_area(event.pos):
+            hit_time = self.aim.click(event.pos, event.arrived)
+            if hit_time is not None:
+                self.results.record(AIM, hit_time, len(self.aim.hit_times))
+            if not self.aim.begin:
+                self.submit_score(AIM, self.aim.average_time())
+                self.aim_button.text = self.aim.result_text()
+                self.aim_button.font_size = 35
+        else:
+            self.scenes[AIM].click(event)
+
+    def setup_aim_game(self) -> None:
+        """
+        Sets up the aim trainer.
+        """
+        self.aim.setup()
+        self.aim_button.text = "Click to Begin!"
+        self.aim_button.font_size = 45
+
+    def draw_aim_buttons(self) -> None:
+        """
+        Draws the aim trainer's buttons that differ from their idle look. The
+        start button is hidden during a game.
+        """
+        self.draw_buttons([button for button in self.aim_buttons
+                           if button is not self.aim_button or
+                           not self.aim.begin])
+
+    def draw_aim_frame(self) -> None:
+        """
+        Draws a frame of the aim trainer.
+        """
+        self.draw_static_layer("aim", None, self.draw_aim_static)
+        self.draw_aim_targets()
+        self.draw_aim_buttons()
+
+    def aim_presented(self) -> None:
+        """
+        Records when new targets were first presented, once a frame showing
+        them has been sent to the display.
+        """
+        self.aim.mark_presented(self.scheduler.now())
+
+    # These methods run the entire game.
+    def instrument(self, profiler: Profiler) -> None:
+        """
+        Make <profiler> time every frame and, within it, every drawing and
+        text rendering method, presenting the frame, waiting for events, and
+        each scene's event handlers.
+        """
+        for name in dir(self):
+            if name.startswith(("draw_", "blit_", "setup_")) or \
+                    name == "text_obj":
+                setattr(self, name, profiler.timed(name, getattr(self, name)))
+        for scene in self.scenes.values():
+            scene.draw = profiler.timed(scene.name + " draw", scene.draw)
+            scene.enter = profiler.timed(scene.name + " enter", scene.enter)
+            scene.presented = profiler.timed(scene.name + " presented",
+                                             scene.presented)
+            scene.handlers = {
+                kind: profiler.timed(scene.name + " " +
+                                     pygame.event.event_name(kind), handler)
+                for kind, handler in scene.handlers.items()}
+        self.dirty.present = profiler.timed("present", self.dirty.present)
+        self.scheduler.events = profiler.timed("wait for events",
+                                               self.scheduler.events,
+                                               waiting=True)
+        self.scheduler.wait_events = profiler.timed(
+            "wait for events", self.scheduler.wait_events, waiting=True)
+        self.run_frame = profiler.frame(self.run_frame)
+        self.run_frame_async = profiler.frame(self.run_frame_async)
+
+    def present_frame(self, scene: Scene) -> None:
+        """
+        Draws and presents one frame of <scene>.
+        """
+        self.mouse_pos, self.mouse_down = self.scheduler.pointer()
+        self.hovered = scene.button_at(self.mouse_pos)
+        scene.draw()
+        self.dirty.present()
+        scene.presented()
+
+    def dispatch_events(self, scene: Scene,
+                        events: List[pygame.event.Event]) -> None:
+        """
+        Dispatches <events> to <scene>. Events that arrive after the scene
+        has been left are dropped, as they were meant for the scene that was
+        left. If the window was uncovered, the next frame redraws all of it.
+        """
+        for event in events:
+            if event.type in EXPOSE_EVENTS:
+                self.dirty.full()
+            scene.dispatch(event)
+            if self.current_scene != scene.name or not self.game_running:
+                break
+
+    def run_frame(self, scene: Scene) -> None:
+        """
+        Draws and presents one frame of <scene>, then dispatches the events
+        that arrived during it.
+        """
+        self.present_frame(scene)
+        self.dispatch_events(scene, self.scheduler.events(scene.mode()))
+
+    async def run_frame_async(self, scene: Scene) -> None:
+        """
+        The same as run_frame(), but awaits the frame's events, letting the
+        other tasks on the event loop run until they arrive.
+        """
+        self.present_frame(scene)
+        self.dispatch_events(scene,
+                             await self.scheduler.wait_events(scene.mode()))
+
+    def enter_scene(self, scene: Scene) -> None:
+        """
+        Sets <scene> up to run. Only the event types the scene uses (and
+        EXPOSE_EVENTS) are let onto the event queue.
+        """
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(scene.allowed + EXPOSE_EVENTS)
+        scene.start()
+        self.dirty.full()
+
+    def run_scene(self, scene: Scene) -> None:
+        """
+        Runs <scene> until the game switches to another scene or ends.
+        """
+        self.enter_scene(scene)
+        while self.current_scene == scene.name and self.game_running:
+            self.run_frame(scene)
+
+    async def play_scene(self, scene: Scene) -> None:
+        """
+        Runs <scene> as a coroutine, which hands the event loop over once
+        per frame, until the game switches to another scene or ends.
+        """
+        self.enter_scene(scene)
+        while self.current_scene == scene.name and self.game_running:
+            await self.run_frame_async(scene)
+
     def run_game(self) -> None:
         """
-        Runs the game
+        Runs the game, then writes out the results log and sends the scores
+        still waiting to be submitted.
         """
         while self.game_running:
-            self.game_intro()
-            self.main_menu()
-            self.reaction_game()
-            self.number_game()
-            self.verbal_game()
+            self.run_scene(self.scenes[self.current_scene])
+        pygame.event.set_allowed(None)
+        self.results.close()
+        if self.scores is not None:
+            self.scores.close()
+
+    async def run_game_async(self) -> None:
+        """
+        Runs the game on the running asyncio event loop, then writes out the
+        results log and sends the scores still waiting to be submitted. Each
+        scene is played by a coroutine that awaits its frames' events instead
+        of blocking on them, so other tasks on the loop run while a frame
+        waits, and the game's disk work runs in background, so it never holds
+        a frame up.
+        Frames are paced as by run_game(). How late each frame ended is kept
+        in scheduler.lateness, and each event's arrival_error still bounds
+        how long it waited on the queue, so a task holding the loop up shows
+        up in both.
+        """
+        # Imported here so the game only pays for importing asyncio when it
+        # runs on it.
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        loop = asyncio.get_running_loop()
+        self.background = ThreadPoolExecutor(BACKGROUND_WORKERS,
+                                             "game-background")
+        try:
+            while self.game_running:
+                await self.play_scene(self.scenes[self.current_scene])
+            pygame.event.set_allowed(None)
+            await loop.run_in_executor(self.background, self.results.close)
+            if self.scores is not None:
+                await loop.run_in_executor(self.background,
+                                           self.scores.close)
+        finally:
+            self.background.shutdown(wait=False)
+            self.background = None
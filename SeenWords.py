@@ -0,0 +1,64 @@
+"""
+    File name: SeenWords.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+import random
+from typing import Iterator, List, Optional, Set
+
+
+class SeenWords:
+    """
+    The words that have been shown in a verbal game, kept both in a set (for
+    O(1) membership checks) and in a list (for O(1) random picks).
+    === Private Attributes ===
+    _lookup: Every seen word.
+    _order: Every seen word, in the order they were first seen.
+
+    === Representation Invariants ===
+    set(_order) == _lookup
+    len(_order) == len(_lookup)
+    """
+    _lookup: Set[str]
+    _order: List[str]
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty SeenWords.
+        """
+        self._lookup = set()
+        self._order = []
+
+    def add(self, word: str) -> None:
+        """
+        Record that <word> has been shown.
+        """
+        if word not in self._lookup:
+            self._lookup.add(word)
+            self._order.append(word)
+
+    def __contains__(self, word: str) -> bool:
+        """
+        Return whether <word> has been shown.
+        """
+        return word in self._lookup
+
+    def __len__(self) -> int:
+        """
+        Return the number of distinct words shown.
+        """
+        return len(self._order)
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Yield the seen words in the order they were first seen.
+        """
+        return iter(self._order)
+
+    def choice(self, rng: Optional[random.Random] = None) -> str:
+        """
+        Return a random seen word, using <rng> (the random module by default).
+        Precondition: len(self) > 0
+        """
+        chooser = rng if rng is not None else random
+        return self._order[chooser.randrange(len(self._order))]
@@ -0,0 +1,440 @@
+"""
+    File name: Simulation.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+
+    Plays millions of games of the reaction, number or verbal game with
+    simulated players (bots), without pygame, to see how changes to a game's
+    difficulty change its scores. Prints the outcome curves as JSON.
+
+    Usage: python Simulation.py GAME [--games N] [--jobs N] [--seed N]
+                                [--set NAME=VALUE ...] [--bot NAME=VALUE ...]
+                                [--output FILE]
+    --set changes an attribute of the game (e.g. --set time_step=0.3), and
+    --bot changes an attribute of the bot (e.g. --bot span=9).
+"""
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple, Union
+from ReactionGame import ReactionGame
+from NumberGame import NumberGame
+from VerbalGame import VerbalGame
+
+# The most games a worker plays before sending its outcomes back.
+SHARD_GAMES = 2000
+
+# The highest score a bot is allowed to reach; games reaching it are stopped
+# and counted as capped, so a bot that never forgets can not run forever.
+SCORE_CAP = 100000
+
+Value = Union[int, float, str]
+
+
+class ReactionBot:
+    """
+    A simulated player of the reaction game.
+    Its reaction times are normally distributed, with an occasional lapse of
+    attention that adds an exponentially distributed delay. While waiting
+    for "GO!", it jumps the gun at a constant rate, so the longer the wait,
+    the likelier a false start.
+    === Public Attributes ===
+    mean: The mean of its reaction times (in seconds).
+    spread: The standard deviation of its reaction times (in seconds).
+    lapse_chance: The chance of a reaction having a lapse.
+    lapse_time: The mean delay (in seconds) a lapse adds.
+    false_start_rate: How often it clicks before "GO!", per second waited.
+
+    === Representation Invariants ===
+    mean > 0
+    spread >= 0
+    0 <= lapse_chance <= 1
+    lapse_time > 0
+    false_start_rate >= 0
+    """
+    mean: float = 0.25
+    spread: float = 0.04
+    lapse_chance: float = 0.03
+    lapse_time: float = 0.5
+    false_start_rate: float = 0.01
+
+    def react(self, wait: float, rng: random.Random) -> Optional[float]:
+        """
+        Return how long (in seconds) after "GO!" the bot clicks, when "GO!"
+        comes after <wait> seconds, or None if it clicks before "GO!".
+        """
+        if self.false_start_rate > 0 and \
+                rng.expovariate(self.false_start_rate) < wait:
+            return None
+        reaction = max(0.05, rng.gauss(self.mean, self.spread))
+        if rng.random() < self.lapse_chance:
+            reaction += rng.expovariate(1 / self.lapse_time)
+        return reaction
+
+
+class NumberBot:
+    """
+    A simulated player of the number game.
+    It memorizes one digit every seconds_per_digit seconds, up to its span,
+    and recalls a number with a chance that falls off logistically as the
+    number grows past what it memorized.
+    === Public Attributes ===
+    span: The most digits it can hold in memory.
+    seconds_per_digit: How long (in seconds) it takes to memorize a digit.
+    spread: How gradually its recall falls off (in digits).
+
+    === Representation Invariants ===
+    span > 0
+    seconds_per_digit > 0
+    spread > 0
+    """
+    span: float = 7.0
+    seconds_per_digit: float = 0.25
+    spread: float = 0.8
+
+    def recall(self, digits: int, seconds: float,
+               rng: random.Random) -> bool:
+        """
+        Return whether the bot recalls a number of <digits> digits that was
+        shown for <seconds> seconds.
+        """
+        memorized = min(self.span, seconds / self.seconds_per_digit)
+        excess = (digits - memorized) / self.spread
+        if excess > 50:
+            return False
+        return rng.random() < 1 / (1 + math.exp(excess))
+
+
+class VerbalBot:
+    """
+    A simulated player of the verbal game.
+    It remembers a word it has seen with a chance that decays exponentially
+    with the number of words shown since, and mistakes a new word for a seen
+    one with a fixed chance.
+    === Public Attributes ===
+    memory: How many words it takes for its memory of a word to fade to
+        1 / e.
+    false_alarm: The chance of it calling a new word seen.
+
+    === Private Attributes ===
+    _seen: When (counted in words shown) each word was last shown.
+    _shown: The number of words shown this game.
+
+    === Representation Invariants ===
+    memory > 0
+    0 <= false_alarm <= 1
+    """
+    memory: float = 400.0
+    false_alarm: float = 0.01
+    _seen: Dict[str, int]
+    _shown: int
+
+    def __init__(self) -> None:
+        """
+        Initialize a VerbalBot with nothing in memory.
+        """
+        self.start()
+
+    def start(self) -> None:
+        """
+        Forget every word, for a new game.
+        """
+        self._seen = {}
+        self._shown = 0
+
+    def judge(self, word: str, rng: random.Random) -> str:
+        """
+        Return the bot's answer ("New" or "Shown") when <word> is shown.
+        """
+        last = self._seen.get(word)
+        self._seen[word] = self._shown
+        self._shown += 1
+        if last is None:
+            return "Shown" if rng.random() < self.false_alarm else "New"
+        age = self._shown - 1 - last
+        return "Shown" if rng.random() < math.exp(-age / self.memory) \
+            else "New"
+
+
+class Outcomes:
+    """
+    The aggregated outcomes of many simulated games, which can be merged with
+    the outcomes of other games, so games can be simulated in parallel and
+    only their totals sent back.
+    === Public Attributes ===
+    scores: The number of games ending with each score.
+    counters: Totals of other events (false starts, capped games...), keyed
+        by name.
+
+    === Representation Invariants ===
+    all(count > 0 for count in scores.values())
+    """
+    scores: Dict[int, int]
+    counters: Dict[str, int]
+
+    def __init__(self) -> None:
+        """
+        Initialize Outcomes with no games.
+        """
+        self.scores = {}
+        self.counters = {}
+
+    def add(self, score: int) -> None:
+        """
+        Record a game that ended with <score>.
+        """
+        self.scores[score] = self.scores.get(score, 0) + 1
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """
+        Add <amount> to the counter <name>.
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def merge(self, other: "Outcomes") -> None:
+        """
+        Add every outcome in <other> to these outcomes.
+        """
+        for score, games in other.scores.items():
+            self.scores[score] = self.scores.get(score, 0) + games
+        for name, amount in other.counters.items():
+            self.count(name, amount)
+
+    def games(self) -> int:
+        """
+        Return the number of games recorded.
+        """
+        return sum(self.scores.values())
+
+    def report(self, unit: str) -> Dict:
+        """
+        Return the outcomes as a JSON-serializable dictionary, with scores in
+        <unit>. The curve gives, for each score, the fraction of games that
+        reached at least that score.
+        """
+        games = self.games()
+        if games == 0:
+            return {"games": 0, "unit": unit, "counters": self.counters}
+        total = 0
+        percentiles = {}
+        wanted = [10, 50, 90, 99]
+        seen = 0
+        curve = []
+        for score in sorted(self.scores):
+            curve.append([score, (games - seen) / games])
+            seen += self.scores[score]
+            total += score * self.scores[score]
+            while wanted and seen >= math.ceil(wanted[0] / 100 * games):
+                percentiles["p" + str(wanted.pop(0))] = score
+        return {"games": games,
+                "unit": unit,
+                "mean": total / games,
+                **percentiles,
+                "curve": curve,
+                "counters": self.counters}
+
+
+def simulate_reaction(count: int, rng: random.Random,
+                      settings: Dict[str, Value],
+                      bot_settings: Dict[str, Value]) -> Outcomes:
+    """
+    Play <count> sessions of the reaction game, scoring each by its average
+    reaction time in whole milliseconds.
+    """
+    game = ReactionGame(rng)
+    bot = configure(ReactionBot(), bot_settings)
+    configure(game, settings)
+    outcomes = Outcomes()
+    for _ in range(count):
+        game.new_session()
+        tries = 0
+        while not game.session_done() and tries < 20 * game.trials:
+            tries += 1
+            game.setup()
+            reaction = bot.react(game.wait_time, rng)
+            if reaction is None:
+                outcomes.count("false_starts")
+                continue
+            game.record(reaction, 0.0)
+            if not game.counted:
+                outcomes.count("rejected")
+        if game.session_done():
+            outcomes.add(int(game.stats.mean * 1000))
+        else:
+            outcomes.count("abandoned")
+    return outcomes
+
+
+def simulate_number(count: int, rng: random.Random,
+                    settings: Dict[str, Value],
+                    bot_settings: Dict[str, Value]) -> Outcomes:
+    """
+    Play <count> games of the number game, scoring each by its points.
+    """
+    game = NumberGame(rng)
+    bot = configure(NumberBot(), bot_settings)
+    configure(game, settings)
+    outcomes = Outcomes()
+    game.setup()
+    for _ in range(count):
+        while game.points < SCORE_CAP and \
+                bot.recall(len(game.curr_num), game.time_on_screen, rng):
+            game.answer(game.curr_num)
+        if game.points >= SCORE_CAP:
+            outcomes.count("capped")
+        outcomes.add(game.points)
+        # Any other answer is wrong, and starts the next game.
+        game.answer("")
+    return outcomes
+
+
+def simulate_verbal(count: int, rng: random.Random,
+                    settings: Dict[str, Value],
+                    bot_settings: Dict[str, Value]) -> Outcomes:
+    """
+    Play <count> games of the verbal game, scoring each by its points.
+    """
+    game = VerbalGame(rng)
+    bot = configure(VerbalBot(), bot_settings)
+    configure(game, settings)
+    outcomes = Outcomes()
+    game.setup()
+    for _ in range(count):
+        bot.start()
+        answer = bot.judge(game.curr_word, rng)
+        while game.points < SCORE_CAP and game.is_correct(answer):
+            game.answer(answer)
+            if game.finished:
+                break
+            answer = bot.judge(game.curr_word, rng)
+        if game.points >= SCORE_CAP:
+            outcomes.count("capped")
+        outcomes.add(game.points)
+        game.setup()
+    return outcomes
+
+
+# Each game that can be simulated: its simulator and the unit of its scores.
+SIMULATORS = {"reaction": (simulate_reaction, "ms"),
+              "number": (simulate_number, "points"),
+              "verbal": (simulate_verbal, "points")}
+
+
+def configure(target, settings: Dict[str, Value]):
+    """
+    Set each attribute of <target> named in <settings> to its value, and
+    return <target>.
+    Raises AttributeError if <target> has no such attribute.
+    """
+    for name, value in settings.items():
+        if name.startswith('_') or not hasattr(target, name):
+            raise AttributeError(type(target).__name__ +
+                                 ' has no setting ' + name)
+        setattr(target, name, value)
+    return target
+
+
+def run_shard(task: Tuple[str, int, int, int, Dict[str, Value],
+                          Dict[str, Value]]) -> Outcomes:
+    """
+    Play the shard of games described by <task>: (game, number of games,
+    seed, shard number, game settings, bot settings). Each shard draws from
+    its own generator, seeded from the seed and the shard number, so a run
+    gives the same outcomes however many workers it is spread over.
+    """
+    name, count, seed, shard, settings, bot_settings = task
+    rng = random.Random(str(seed) + ':' + str(shard))
+    return SIMULATORS[name][0](count, rng, settings, bot_settings)
+
+
+def simulate(name: str, games: int, jobs: Optional[int] = None,
+             seed: int = 0, settings: Optional[Dict[str, Value]] = None,
+             bot_settings: Optional[Dict[str, Value]] = None) -> Dict:
+    """
+    Play <games> games of the game <name> with bots, across <jobs> processes
+    (one per CPU by default), and return the report. Outcomes are merged as
+    each shard finishes, so only totals are ever sent between processes.
+    Precondition: name in SIMULATORS
+    """
+    start = time.perf_counter()
+    settings = settings or {}
+    bot_settings = bot_settings or {}
+    work = [(name, min(SHARD_GAMES, games - first), seed, shard, settings,
+             bot_settings)
+            for shard, first in enumerate(range(0, games, SHARD_GAMES))]
+    totals = Outcomes()
+    if len(work) <= 1 or jobs == 1:
+        for task in work:
+            totals.merge(run_shard(task))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for future in as_completed([executor.submit(run_shard, task)
+                                        for task in work]):
+                totals.merge(future.result())
+    report = totals.report(SIMULATORS[name][1])
+    report["game"] = name
+    report["seed"] = seed
+    report["settings"] = settings
+    report["bot"] = bot_settings
+    report["elapsed_s"] = time.perf_counter() - start
+    return report
+
+
+def parse_settings(pairs: List[str]) -> Dict[str, Value]:
+    """
+    Return the NAME=VALUE <pairs> as a dictionary, with numeric values
+    converted to numbers.
+    Raises ValueError if a pair has no "=".
+    """
+    settings = {}
+    for pair in pairs:
+        name, equals, text = pair.partition('=')
+        if not equals:
+            raise ValueError('expected NAME=VALUE, got ' + pair)
+        value = text
+        for kind in (int, float):
+            try:
+                value = kind(text)
+                break
+            except ValueError:
+                pass
+        settings[name] = value
+    return settings
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the simulation from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Play the games with simulated players.")
+    parser.add_argument("game", choices=sorted(SIMULATORS))
+    parser.add_argument("--games", type=int, default=100000,
+                        help="games to play")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="processes to use (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the random number generators")
+    parser.add_argument("--set", action="append", default=[],
+                        metavar="NAME=VALUE", help="change a game setting")
+    parser.add_argument("--bot", action="append", default=[],
+                        metavar="NAME=VALUE", help="change a bot setting")
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args(argv)
+    report = simulate(args.game, args.games, args.jobs, args.seed,
+                      parse_settings(args.set), parse_settings(args.bot))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
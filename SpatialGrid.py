@@ -0,0 +1,108 @@
+"""
+    File name: SpatialGrid.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+Box = Tuple[float, float, float, float]
+
+
+class SpatialGrid:
+    """
+    A uniform grid of square cells over the screen, used to find what is
+    under a point without checking everything on screen.
+    Every item is listed in each cell its bounding box overlaps, so finding
+    the item under a point only checks the few items in that point's cell,
+    however many items there are. Items are anything with an
+    is_hover(position) method, such as a Button.
+    === Public Attributes ===
+    cell_size: The width and height of each cell, in pixels.
+
+    === Private Attributes ===
+    _cells: The items overlapping each cell, keyed by the cell's (column,
+        row), oldest first.
+    _items: The item and the cells it is listed in, keyed by the item's id.
+
+    === Representation Invariants ===
+    cell_size > 0
+    No list in _cells is empty.
+    """
+    cell_size: int
+    _cells: Dict[Tuple[int, int], List[Any]]
+    _items: Dict[int, Tuple[Any, List[Tuple[int, int]]]]
+
+    def __init__(self, cell_size: int = 64) -> None:
+        """
+        Initialize an empty SpatialGrid with cells <cell_size> pixels wide.
+        Precondition: cell_size > 0
+        """
+        self.cell_size = cell_size
+        self._cells = {}
+        self._items = {}
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        """
+        Return the (column, row) of the cell containing the point (x, y).
+        """
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def insert(self, item: Any, box: Box) -> None:
+        """
+        Add <item>, whose bounding box is <box> (x, y, width, height), to the
+        grid. An item already in the grid is moved to <box>.
+        Precondition: item has an is_hover(position) method that is only True
+            inside box.
+        """
+        if id(item) in self._items:
+            self.remove(item)
+        left, top = self._cell(box[0], box[1])
+        right, bottom = self._cell(box[0] + box[2], box[1] + box[3])
+        cells = [(column, row) for column in range(left, right + 1)
+                 for row in range(top, bottom + 1)]
+        for cell in cells:
+            self._cells.setdefault(cell, []).append(item)
+        self._items[id(item)] = (item, cells)
+
+    def remove(self, item: Any) -> None:
+        """
+        Remove <item> from the grid, if it is in it.
+        """
+        entry = self._items.pop(id(item), None)
+        if entry is None:
+            return
+        for cell in entry[1]:
+            listed = self._cells[cell]
+            listed.remove(item)
+            if not listed:
+                del self._cells[cell]
+
+    def at(self, position: Tuple[float, float]) -> Optional[Any]:
+        """
+        Return the item under <position>, or None if there is none. If items
+        overlap there, the one added last (the one drawn on top) is returned.
+        """
+        for item in reversed(self._cells.get(self._cell(*position), ())):
+            if item.is_hover(position):
+                return item
+        return None
+
+    def clear(self) -> None:
+        """
+        Remove every item from the grid.
+        """
+        self._cells.clear()
+        self._items.clear()
+
+    def __len__(self) -> int:
+        """
+        Return the number of items in the grid.
+        """
+        return len(self._items)
+
+    def __contains__(self, item: Any) -> bool:
+        """
+        Return whether <item> is in the grid.
+        """
+        return id(item) in self._items
@@ -0,0 +1,87 @@
+"""
+    File name: Startup.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+import importlib
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Modules pygame imports eagerly but the game never uses: NumPy (for
+# pygame.surfarray and pygame.sndarray) and pkg_resources (for finding
+# pygame's own files, which pygame can also do without it). When they are
+# installed, importing them takes several times longer than pygame itself.
+SKIPPED_IMPORTS = ("numpy", "pkg_resources")
+
+# How long (in seconds) after main.py starts the intro may take to be on
+# screen, checked by python main.py --startup-check.
+STARTUP_TARGET = 0.5
+
+
+class StartupTimeline:
+    """
+    When each step of starting the game finished, so slow steps can be found
+    and the time until the intro is on screen can be checked.
+    === Public Attributes ===
+    start: The time.perf_counter() reading the timeline is measured from.
+    marks: Each step, and the time.perf_counter() reading when it finished,
+        in order.
+    """
+    start: float
+    marks: List[Tuple[str, float]]
+
+    def __init__(self, start: Optional[float] = None) -> None:
+        """
+        Initialize a StartupTimeline measured from time.perf_counter() reading
+        <start> (now by default).
+        """
+        self.start = time.perf_counter() if start is None else start
+        self.marks = []
+
+    def mark(self, step: str) -> None:
+        """
+        Record that <step> has just finished.
+        """
+        self.marks.append((step, time.perf_counter()))
+
+    def elapsed(self, step: str) -> Optional[float]:
+        """
+        Return how long (in seconds) after start <step> finished, or None if
+        it has not been marked.
+        """
+        for name, when in self.marks:
+            if name == step:
+                return when - self.start
+        return None
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return when each step finished and how long it took, in milliseconds
+        since start.
+        """
+        report = {}
+        previous = self.start
+        for step, when in self.marks:
+            report[step] = {"at_ms": (when - self.start) * 1000,
+                            "took_ms": (when - previous) * 1000}
+            previous = when
+        return report
+
+
+def import_pygame() -> None:
+    """
+    Import pygame without importing the modules in SKIPPED_IMPORTS, which are
+    importable again afterwards for any code that does need them.
+    """
+    skipped = [name for name in SKIPPED_IMPORTS if name not in sys.modules]
+    for name in skipped:
+        # A None entry makes importing the module raise ImportError, which
+        # pygame handles by leaving out the parts that need it.
+        sys.modules[name] = None
+    try:
+        importlib.import_module("pygame")
+    finally:
+        for name in skipped:
+            if sys.modules.get(name, 0) is None:
+                del sys.modules[name]
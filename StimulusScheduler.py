@@ -0,0 +1,100 @@
+"""
+    File name: StimulusScheduler.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+from typing import Optional
+import pygame
+
+# The event posted by pygame's timer when a stimulus is due.
+STIMULUS_EVENT = pygame.event.custom_type()
+
+
+class StimulusScheduler:
+    """
+    Schedules a stimulus (e.g. the reaction game's "GO!") for an exact
+    deadline instead of waiting for a frame to notice that it is due.
+    Arming the scheduler starts a pygame timer that posts STIMULUS_EVENT at
+    the deadline; the scene then draws the stimulus and reports when the frame
+    showing it was actually presented, so reactions can be measured from what
+    the user saw rather than from when the stimulus was meant to appear.
+    All times are readings of the clock the game is timed with (see
+    FrameScheduler.now), in seconds.
+    === Public Attributes ===
+    due_at: When the armed stimulus should appear, or None if not armed.
+    fired_at: When the stimulus was found to be due, or None if it has not
+        fired yet.
+    presented_at: When the first frame showing the stimulus was sent to the
+        display, or None if it has not been presented yet.
+
+    === Representation Invariants ===
+    fired_at is None or (due_at is not None and fired_at >= due_at)
+    presented_at is None or (fired_at is not None and
+        presented_at >= fired_at)
+    """
+    due_at: Optional[float]
+    fired_at: Optional[float]
+    presented_at: Optional[float]
+
+    def __init__(self) -> None:
+        """
+        Initialize an unarmed StimulusScheduler.
+        """
+        self.due_at = None
+        self.fired_at = None
+        self.presented_at = None
+
+    def arm(self, delay: float, now: float) -> None:
+        """
+        Schedule the stimulus to appear <delay> seconds after time <now>.
+        Precondition: delay > 0
+        """
+        self.due_at = now + delay
+        self.fired_at = None
+        self.presented_at = None
+        # pygame's timer only has millisecond resolution, so round down and
+        # let check() hold the stimulus back until the exact deadline.
+        pygame.time.set_timer(STIMULUS_EVENT, max(1, int(delay * 1000)), 1)
+
+    def cancel(self) -> None:
+        """
+        Forget the armed stimulus, if any.
+        """
+        pygame.time.set_timer(STIMULUS_EVENT, 0)
+        self.due_at = None
+        self.fired_at = None
+        self.presented_at = None
+
+    def check(self, now: float) -> bool:
+        """
+        Fire the stimulus if it is armed and due at time <now>, and return
+        whether it has fired.
+        """
+        if self.due_at is not None and self.fired_at is None and \
+                now >= self.due_at:
+            self.fired_at = now
+        return self.fired_at is not None
+
+    @property
+    def fired(self) -> bool:
+        """
+        Whether the stimulus has fired and should be drawn.
+        """
+        return self.fired_at is not None
+
+    def mark_presented(self, now: float) -> None:
+        """
+        Record that a frame showing the fired stimulus was sent to the display
+        at time <now>. Only the first presentation counts.
+        """
+        if self.fired_at is not None and self.presented_at is None:
+            self.presented_at = now
+
+    def onset_lag(self) -> Optional[float]:
+        """
+        Return how late (in seconds) the stimulus was presented compared with
+        its deadline, or None if it has not been presented.
+        """
+        if self.presented_at is None or self.due_at is None:
+            return None
+        return self.presented_at - self.due_at
@@ -0,0 +1,102 @@
+"""
+    File name: TextCache.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+from collections import OrderedDict
+from typing import Dict, Tuple
+import pygame
+from FontManager import FONTS, SANS_FONT
+
+TextKey = Tuple[str, Tuple[int, ...], str, int]
+
+
+class TextCache:
+    """
+    A bounded least-recently-used cache of rendered text surfaces, so that
+    text which does not change between frames is only rasterized once.
+    The surfaces handed out are shared, so callers must never draw on them.
+    === Public Attributes ===
+    max_bytes: The largest amount of pixel memory (in bytes) the cache may
+        hold before it starts evicting the least recently used surfaces.
+    used_bytes: The amount of pixel memory currently held by the cache.
+    hits: The number of renders answered from the cache.
+    misses: The number of renders that had to be rasterized.
+    evictions: The number of surfaces dropped to stay under max_bytes.
+
+    === Private Attributes ===
+    _surfaces: The cached surfaces keyed by (text, color, font path, size),
+        ordered from least to most recently used.
+
+    === Representation Invariants ===
+    max_bytes > 0
+    0 <= used_bytes
+    used_bytes <= max_bytes, unless _surfaces holds a single surface that is
+        bigger than max_bytes on its own.
+    """
+    max_bytes: int
+    used_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    _surfaces: "OrderedDict[TextKey, pygame.Surface]"
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024) -> None:
+        """
+        Initialize an empty TextCache holding at most <max_bytes> of pixels.
+        Precondition: max_bytes > 0
+        """
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._surfaces = OrderedDict()
+
+    @staticmethod
+    def _size_of(surface: pygame.Surface) -> int:
+        """
+        Return the number of bytes of pixel memory used by <surface>.
+        """
+        return surface.get_pitch() * surface.get_height()
+
+    def render(self, text: str, color: Tuple[int, int, int], size: int,
+               path: str = SANS_FONT) -> pygame.Surface:
+        """
+        Return <text> rendered (antialiased) in <color> with the font at <path>
+        and point size <size>, rasterizing it only on a cache miss.
+        """
+        key = (text, tuple(color), path, size)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = FONTS.get(size, path).render(text, True, color)
+        self._surfaces[key] = surface
+        self.used_bytes += self._size_of(surface)
+        while self.used_bytes > self.max_bytes and len(self._surfaces) > 1:
+            _, old = self._surfaces.popitem(last=False)
+            self.used_bytes -= self._size_of(old)
+            self.evictions += 1
+        return surface
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the cache's counters.
+        """
+        return {"hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions, "entries": len(self._surfaces),
+                "used_bytes": self.used_bytes, "max_bytes": self.max_bytes}
+
+    def clear(self) -> None:
+        """
+        Drop every cached surface.
+        """
+        self._surfaces.clear()
+        self.used_bytes = 0
+
+
+# The cache shared by the whole game.
+TEXT_CACHE = TextCache()
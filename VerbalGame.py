@@ -4,59 +4,118 @@
     Python Version: 3.9
 """
 import random
-from typing import List
+import threading
+from itertools import islice
+from concurrent.futures import Executor, Future
+from typing import Iterator, Optional
+from WordStore import WordStore
+from SeenWords import SeenWords
+
+# The number of words a game is played with.
+GAME_WORDS = 1000
 
 
 class VerbalGame:
     """
     A class representing the verbal game's inner workings.
     === Public Attributes ===
-    words: A list of all the words from words.txt
-    game_words: A list of 1000 random words from words
+    words: All the words from words.txt, in a compiled memory-mapped store.
     words_shown: All the words that have already been shown to the user.
+    endless: Whether games are endless, with new words streamed from all of
+        words instead of only GAME_WORDS of them.
     points: The number of answers the user has gotten correctly.
+    finished: Whether the game is over because every one of its GAME_WORDS
+        words has been shown (which never happens in endless games).
     curr_word: The word being currently displayed on screen.
+    ready: Completes once words has been loaded by load_async(), or None if
+        loading has not started.
+    seen_chance: The chance of the next word being one already shown (when
+        there is one).
+    rng: The random number generator words are picked with, or None to use
+        the random module.
+
+    === Private Attributes ===
+    _fresh: The words that have not been shown yet, in the order they will be
+        shown. They are drawn from a shuffled stream of words as they are
+        needed, so a short game does not pay for picking all GAME_WORDS.
 
     === Representation Invariants ===
-    len(game_words) must always be equal to 1000.
-    0 < len(words_shown) <= len(game_words) < len(words)
+    0 <= len(words_shown) <= len(words)
     points >= 0
+    0 <= seen_chance <= 1
     """
-    words: List[str]
-    game_words: List[str]
-    words_shown: List[str]
+    words: WordStore
+    words_shown: SeenWords
+    endless: bool = False
     points: int = 0
+    finished: bool = False
     curr_word: str
+    ready: Optional[Future]
+    seen_chance: float = 0.5
+    rng: Optional[random.Random] = None
+    _fresh: Iterator[str]
 
-    def __init__(self) -> None:
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
         """
-        Initialize VerbalGame.
+        Initialize VerbalGame, picking words with <rng> (the random module by
+        default). The words are not loaded until load_async() or
+        load_random_words() is called.
         """
-        self.load_random_words()
+        self.ready = None
+        self.rng = rng
 
-    def load_random_words(self) -> None:
+    def load_async(self, executor: Optional[Executor] = None) -> Future:
+        """
+        Start loading the words in <executor>, or on a background thread of
+        their own if it is None (if loading has not been started already),
+        and return a future that completes when they are loaded.
+        """
+        if self.ready is None and executor is not None:
+            self.ready = executor.submit(self.load_random_words)
+        elif self.ready is None:
+            self.ready = Future()
+            loader = threading.Thread(target=self._load_into,
+                                      args=(self.ready,), name="word-loader",
+                                      daemon=True)
+            loader.start()
+        return self.ready
+
+    def _load_into(self, ready: Future) -> None:
+        """
+        Load the words and complete <ready> with the outcome.
         """
-        From words.txt, load up all the words and shuffle them.
+        try:
+            self.load_random_words()
+        except BaseException as error:
+            ready.set_exception(error)
+        else:
+            ready.set_result(None)
+
+    def is_ready(self) -> bool:
         """
-        with open('words.txt') as word_file:
-            self.words = word_file.read().split()
-        random.shuffle(self.words)
+        Return whether the words have finished loading (or failed to load).
+        """
+        return self.ready is not None and self.ready.done()
 
-    def get_1000_words(self) -> List:
+    def load_random_words(self) -> None:
         """
-        Get any 1000 words from self.words.
+        Open the compiled store of the words in words.txt, building it first
+        if words.txt is new or has changed.
         """
-        a = random.randint(1, 360000)
-        return self.words[a: a + 1000]
+        self.words = WordStore('words.txt')
 
     def setup(self) -> None:
         """
-        Set up a game.
+        Set up a game, waiting for the words to finish loading if needed.
         """
+        self.load_async().result()
         self.points = 0
-        self.words_shown = []
-        self.game_words = self.get_1000_words()
-        self.curr_word = self.game_words[self.points]
+        self.finished = False
+        self.words_shown = SeenWords()
+        self._fresh = self.words.stream(self.rng)
+        if not self.endless:
+            self._fresh = islice(self._fresh, GAME_WORDS)
+        self.curr_word = next(self._fresh)
 
     def is_correct(self, answer: str) -> bool:
         """
@@ -75,18 +134,37 @@ class VerbalGame:
         """
         if self.is_correct(answer):
             self.points += 1
-            self.words_shown.append(self.curr_word)
+            self.words_shown.add(self.curr_word)
             self.curr_word_randomizer()
         else:
             self.setup()
 
     def curr_word_randomizer(self) -> None:
         """
-        Make self.curr_word either new word or an already seen word.
+        Make self.curr_word either new word or an already seen word (with a
+        chance of seen_chance). Once every new word has been used, the game
+        is finished, or only seen words are shown if it is endless.
         """
-        temp = random.choice(self.words_shown)
-        if random.randint(1, 2) == 2 and len(self.words_shown) > 0 and \
-                temp != self.curr_word:
-            self.curr_word = temp
+        chooser = self.rng if self.rng is not None else random
+        if len(self.words_shown) > 0 and chooser.random() < self.seen_chance:
+            temp = self.words_shown.choice(self.rng)
+            if temp != self.curr_word:
+                self.curr_word = temp
+                return
+        new_word = self.next_new_word()
+        if new_word is not None:
+            self.curr_word = new_word
+        elif not self.endless:
+            self.finished = True
         else:
-            self.curr_word = self.game_words[self.points]
+            self.curr_word = self.words_shown.choice(self.rng)
+
+    def next_new_word(self) -> Optional[str]:
+        """
+        Return the next word that has not been shown yet, or None if there
+        are none left.
+        """
+        for word in self._fresh:
+            if word not in self.words_shown:
+                return word
+        return None
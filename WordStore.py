@@ -0,0 +1,215 @@
+"""
+    File name: WordStore.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+import hashlib
+import mmap
+import os
+import random
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterator, Optional, Union
+
+# The header of a compiled store: magic, format version, number of words,
+# length of the word blob in bytes and the SHA-256 of the source word list.
+HEADER = struct.Struct("<4sIIQ32s")
+MAGIC = b"WSTR"
+VERSION = 1
+
+
+class WordStore:
+    """
+    A read-only list of words kept in one compiled, memory-mapped file instead
+    of as hundreds of thousands of Python strings.
+    The compiled file holds a header, an array of count + 1 little-endian
+    32-bit offsets and one blob of UTF-8 words; word i is
+    blob[offsets[i]:offsets[i + 1]]. It is built from the source word list
+    the first time it is needed and rebuilt whenever the source changes.
+    === Public Attributes ===
+    source: The path of the plain text word list (whitespace separated).
+    path: The path of the compiled store.
+    digest: The SHA-256 of the source the store was built from.
+
+    === Private Attributes ===
+    _data: The whole compiled store, memory-mapped (or in memory, if it could
+        not be written to disk).
+    _file: The open store file behind _data, or None if it is in memory.
+    _view: A memoryview of all of _data.
+    _offsets: The offsets of every word in _blob.
+    _blob: The words, encoded in UTF-8 and concatenated.
+
+    === Representation Invariants ===
+    len(_offsets) == len(self) + 1
+    _offsets is non-decreasing and _offsets[-1] == len(_blob)
+    """
+    source: str
+    path: str
+    digest: bytes
+    _data: Union[mmap.mmap, bytes]
+    _file: Optional[BinaryIO]
+    _view: memoryview
+    _offsets: Union[memoryview, array]
+    _blob: memoryview
+
+    def __init__(self, source: str = 'words.txt',
+                 path: Optional[str] = None) -> None:
+        """
+        Open the compiled store of the word list at <source>, stored at <path>
+        (by default next to <source>, with the extension .store), building
+        it first if it is missing or out of date.
+        """
+        self.source = source
+        self.path = path if path is not None else \
+            os.path.splitext(source)[0] + '.store'
+        self.digest = self._hash_source()
+        self._file = None
+        data = self._open_existing()
+        if data is None:
+            compiled = self.compile()
+            try:
+                self._write(compiled)
+                data = self._open_existing()
+            except OSError:
+                data = None
+            if data is None:
+                # The store could not be written, so keep it in memory.
+                data = compiled
+        self._load(data)
+
+    def _hash_source(self) -> bytes:
+        """
+        Return the SHA-256 of the source word list.
+        """
+        digest = hashlib.sha256()
+        with open(self.source, 'rb') as word_file:
+            for chunk in iter(lambda: word_file.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.digest()
+
+    def compile(self) -> bytes:
+        """
+        Return the compiled store for the source word list.
+        """
+        with open(self.source, 'rb') as word_file:
+            words = word_file.read().split()
+        offsets = array('I', [0])
+        total = 0
+        for word in words:
+            total += len(word)
+            offsets.append(total)
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+        return HEADER.pack(MAGIC, VERSION, len(words), total, self.digest) + \
+            offsets.tobytes() + b''.join(words)
+
+    def _write(self, compiled: bytes) -> None:
+        """
+        Atomically replace the store on disk with <compiled>.
+        """
+        temporary = self.path + '.' + str(os.getpid()) + '.tmp'
+        with open(temporary, 'wb') as store:
+            store.write(compiled)
+            store.flush()
+            os.fsync(store.fileno())
+        os.replace(temporary, self.path)
+
+    def _open_existing(self) -> Optional[mmap.mmap]:
+        """
+        Memory-map the store on disk and return it, or return None if it is
+        missing, corrupt or was built from a different source.
+        """
+        try:
+            store = open(self.path, 'rb')
+        except OSError:
+            return None
+        try:
+            data = mmap.mmap(store.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            store.close()
+            return None
+        if len(data) >= HEADER.size:
+            magic, version, count, blob_size, digest = \
+                HEADER.unpack_from(data)
+            if magic == MAGIC and version == VERSION and \
+                    digest == self.digest and \
+                    len(data) == HEADER.size + 4 * (count + 1) + blob_size:
+                self._file = store
+                return data
+        data.close()
+        store.close()
+        return None
+
+    def _load(self, data: Union[mmap.mmap, bytes]) -> None:
+        """
+        Point the store at the compiled bytes <data>.
+        """
+        self._data = data
+        count = HEADER.unpack_from(data)[2]
+        view = memoryview(data)
+        self._view = view
+        start = HEADER.size
+        end = start + 4 * (count + 1)
+        if sys.byteorder == 'little':
+            self._offsets = view[start:end].cast('I')
+        else:
+            self._offsets = array('I', view[start:end])
+            self._offsets.byteswap()
+        self._blob = view[end:]
+
+    def __len__(self) -> int:
+        """
+        Return the number of words in the store.
+        """
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        """
+        Return the word at <index>.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('word index out of range')
+        return str(self._blob[self._offsets[index]:self._offsets[index + 1]],
+                   'utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Yield every word in the store, in the source's order.
+        """
+        for index in range(len(self)):
+            yield self[index]
+
+    def stream(self, rng: Optional[random.Random] = None) -> Iterator[str]:
+        """
+        Yield every word in the store exactly once, in a random order, using
+        <rng> (the random module by default). Each word costs O(1) time and
+        the memory used only grows with the number of words taken, since the
+        shuffle is a Fisher-Yates shuffle that only records the swaps it made.
+        """
+        chooser = rng if rng is not None else random
+        count = len(self)
+        swaps = {}
+        for position in range(count):
+            chosen = chooser.randrange(position, count)
+            yield self[swaps.get(chosen, chosen)]
+            if chosen != position:
+                swaps[chosen] = swaps.pop(position, position)
+            else:
+                swaps.pop(position, None)
+
+    def close(self) -> None:
+        """
+        Release the memory-mapped store. The store can not be used afterwards.
+        """
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._blob.release()
+        self._view.release()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -3,16 +3,104 @@
     Author: Adam Kanoun
     Python Version: 3.9
 """
-from Screen import Screen
+import time
+_START = time.perf_counter()
 
+import argparse
+import json
+import os
+import socket
+import sys
+from typing import List, Optional
+from Startup import StartupTimeline, STARTUP_TARGET, import_pygame
 
-def main() -> None:
+TIMELINE = StartupTimeline(_START)
+import_pygame()
+TIMELINE.mark("pygame imported")
+
+from Screen import Screen, INTRO
+from Profiler import Profiler, PROFILE_ENV
+from ScoreClient import ScoreClient, SCORE_SERVER_ENV
+TIMELINE.mark("game imported")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """
     Run the game.
     """
-    screen = Screen()
-    screen.run_game()
+    parser = argparse.ArgumentParser(description="Play Adam's Benchmark Game.")
+    parser.add_argument("--profile", metavar="FILE",
+                        default=os.environ.get(PROFILE_ENV),
+                        help="time every frame and write a Chrome trace of "
+                             "the last ones to FILE (also turned on by "
+                             "setting " + PROFILE_ENV + "=FILE)")
+    parser.add_argument("--asyncio", action="store_true",
+                        help="run the game on an asyncio event loop, with "
+                             "its disk work in the background")
+    parser.add_argument("--record", metavar="FILE",
+                        help="record the session to FILE, to be replayed "
+                             "with Recording.py")
+    parser.add_argument("--score-server", metavar="URL",
+                        default=os.environ.get(SCORE_SERVER_ENV),
+                        help="submit the score of every finished game to "
+                             "the ScoreServer.py at URL (also turned on by "
+                             "setting " + SCORE_SERVER_ENV + "=URL)")
+    parser.add_argument("--kiosk", metavar="NAME",
+                        default=socket.gethostname(),
+                        help="the name scores are submitted under "
+                             "(default: this machine's name)")
+    parser.add_argument("--timeline", action="store_true",
+                        help="print when each step of starting up finished")
+    parser.add_argument("--startup-check", metavar="SECONDS", type=float,
+                        nargs="?", const=STARTUP_TARGET,
+                        help="quit as soon as the intro is on screen, and "
+                             "fail if that took longer than SECONDS "
+                             "(default: %(const)s)")
+    args = parser.parse_args(argv)
+    profiler = Profiler() if args.profile else None
+    recorder = None
+    if args.record:
+        from Recording import SessionRecorder
+        recorder = SessionRecorder(args.record)
+    scores = ScoreClient(args.score_server, args.kiosk) \
+        if args.score_server else None
+    screen = Screen(recorder, profiler=profiler, timeline=TIMELINE,
+                    seed=None if recorder is None else recorder.seed,
+                    scores=scores)
+    if recorder is not None:
+        recorder.screen = screen
+    if args.startup_check is not None:
+        intro = screen.scenes[INTRO]
+        warm_up = intro.presented
+
+        def quit_once_presented() -> None:
+            warm_up()
+            screen.game_running = False
+        intro.presented = quit_once_presented
+    try:
+        if args.asyncio:
+            import asyncio
+            asyncio.run(screen.run_game_async())
+        else:
+            screen.run_game()
+    finally:
+        if recorder is not None:
+            recorder.close()
+        if profiler is not None:
+            profiler.dump(args.profile)
+            print(json.dumps(profiler.summary(), indent=2))
+    if args.timeline or args.startup_check is not None:
+        print(json.dumps(TIMELINE.report(), indent=2))
+    if args.startup_check is not None:
+        took = TIMELINE.elapsed("intro presented")
+        if took is None or took > args.startup_check:
+            print("The intro took too long to show up: " +
+                  ("never" if took is None else format(took, ".3f") + " s") +
+                  " (the target is " + format(args.startup_check, ".3f") +
+                  " s)", file=sys.stderr)
+            return 1
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
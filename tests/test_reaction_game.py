@@ -0,0 +1,37 @@
+"""
+    File name: test_reaction_game.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+from ReactionGame import ReactionGame, OUTLIER_WARMUP
+
+
+def test_slow_trial_mid_session_is_rejected() -> None:
+    """
+    A trial far slower than the ones before it, partway through a session,
+    is rejected rather than counted.
+    """
+    game = ReactionGame()
+    assert OUTLIER_WARMUP < game.trials
+    for speed in (0.25, 0.26, 0.24):
+        game.record(speed, 0.0)
+    assert not game.session_done()
+    game.record(1.2, 0.0)
+    assert not game.counted
+    assert game.rejected == 1
+    assert game.stats.count == 3
+    game.record(0.25, 0.0)
+    assert game.counted
+    assert not game.session_done()
+
+
+def test_trials_before_warm_up_are_not_checked() -> None:
+    """
+    Before OUTLIER_WARMUP trials are counted, only the fixed limits apply.
+    """
+    game = ReactionGame()
+    game.record(0.2, 0.0)
+    game.record(1.2, 0.0)
+    assert game.counted
+    game.record(0.05, 0.0)
+    assert not game.counted
@@ -0,0 +1,47 @@
+"""
+    File name: test_score_server.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+import asyncio
+import os
+
+import pytest
+
+from ScoreServer import ScoreServer
+
+
+def test_failed_snapshot_is_tried_again(tmp_path) -> None:
+    """
+    A snapshot that could not be written leaves the leaderboards marked
+    changed, so the next snapshot writes them.
+    """
+    server = ScoreServer(snapshot_path=str(tmp_path / "missing" / "s.json"))
+    server._changed = True
+    with pytest.raises(OSError):
+        asyncio.run(server.save())
+    assert server._changed
+    os.mkdir(tmp_path / "missing")
+    asyncio.run(server.save())
+    assert not server._changed
+    assert os.path.exists(tmp_path / "missing" / "s.json")
+
+
+def test_request_line_too_long_is_answered() -> None:
+    """
+    A request line longer than the server reads at once is answered with
+    413 instead of dropping the connection.
+    """
+    async def request() -> bytes:
+        server = ScoreServer()
+        port = await server.start("127.0.0.1", 0)
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"GET /" + b"a" * 100000 + b" HTTP/1.1\r\n\r\n")
+            status_line = await reader.readline()
+            writer.close()
+            return status_line
+        finally:
+            await server.close()
+
+    assert asyncio.run(request()).split()[1] == b"413"
@@ -0,0 +1,66 @@
+"""
+    File name: test_verbal_game.py
+    Author: Adam Kanoun
+    Python Version: 3.9
+"""
+import random
+from concurrent.futures import Future
+
+from VerbalGame import VerbalGame, GAME_WORDS
+from WordStore import WordStore
+
+
+def make_game(tmp_path, endless: bool) -> VerbalGame:
+    """
+    Return a VerbalGame set up with 3 * GAME_WORDS made-up words.
+    """
+    source = tmp_path / "words.txt"
+    source.write_text("\n".join("word" + str(i)
+                                for i in range(3 * GAME_WORDS)))
+    game = VerbalGame(random.Random(0))
+    game.words = WordStore(str(source))
+    game.ready = Future()
+    game.ready.set_result(None)
+    game.endless = endless
+    game.setup()
+    return game
+
+
+def play_perfectly(game: VerbalGame, answers: int) -> int:
+    """
+    Answer <game> correctly until it is finished or <answers> answers have
+    been given, and return the number of new words that were shown.
+    """
+    new_words = 0
+    for _ in range(answers):
+        if game.curr_word in game.words_shown:
+            game.answer("Shown")
+        else:
+            new_words += 1
+            game.answer("New")
+        if game.finished:
+            break
+    return new_words
+
+
+def test_game_finishes_after_its_words(tmp_path) -> None:
+    """
+    A game that is not endless is finished once all GAME_WORDS of its words
+    have been shown, instead of showing seen words forever.
+    """
+    game = make_game(tmp_path, False)
+    assert play_perfectly(game, 10 * GAME_WORDS) == GAME_WORDS
+    assert game.finished
+    assert game.points >= GAME_WORDS
+    game.setup()
+    assert not game.finished
+    assert game.points == 0
+
+
+def test_endless_game_keeps_showing_new_words(tmp_path) -> None:
+    """
+    An endless game goes on showing new words past GAME_WORDS of them.
+    """
+    game = make_game(tmp_path, True)
+    assert play_perfectly(game, 4 * GAME_WORDS) > GAME_WORDS
+    assert not game.finished